@@ -1,13 +1,37 @@
-from flask import Flask, request, jsonify, render_template, send_from_directory
+from flask import Flask, Response, g, request, jsonify, render_template, send_from_directory, stream_with_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import text  
-from datetime import datetime, date, time
+from sqlalchemy import text, tuple_
+from datetime import datetime, date, time, timedelta, timezone
+import click
 import json
+import re
+import secrets
+import struct
+import sys
 import uuid
-from werkzeug.security import generate_password_hash, check_password_hash
+import hashlib
+import hmac
+import itertools
+import threading
+import unicodedata
+import zlib
+import time as time_module
+from array import array
+from collections import OrderedDict, defaultdict, namedtuple
+from functools import lru_cache, wraps
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from itsdangerous import URLSafeTimedSerializer, BadSignature, SignatureExpired
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash, check_password_hash
 from config import Config
 
+try:
+    import brotli  # 선택 설치 (pip install brotli) - 없으면 gzip만 협상
+except ImportError:
+    brotli = None
+
 print("=== 🚀 Flask 애플리케이션 시작 ===")
 
 app = Flask(__name__)
@@ -16,6 +40,12 @@ print("✅ Flask 앱 생성 완료")
 try:
     app.config.from_object(Config)
     print("✅ Config 로드 완료")
+    if not app.config.get('SECRET_KEY'):
+        # 알려진 기본 키로는 누구나 임의 사용자 토큰을 서명할 수 있으므로 기본값 없이 임의 키 사용
+        # (재시작/다른 워커 프로세스에서는 기존 토큰이 무효 - 운영 환경에서는 SECRET_KEY 필수)
+        app.config['SECRET_KEY'] = secrets.token_hex(32)
+        print("⚠️⚠️⚠️ SECRET_KEY 환경 변수가 없습니다 - 임시 서명 키 사용 중 (재시작 시 모든 로그인 토큰 무효). 운영 환경에서는 반드시 SECRET_KEY를 지정하세요!")
+        app.logger.warning('SECRET_KEY is not set - using a random per-process key; auth tokens will not survive restarts')
     print(f"📊 데이터베이스 URI: {app.config.get('SQLALCHEMY_DATABASE_URI')}")
 except Exception as e:
     print(f"❌ Config 로드 실패: {e}")
@@ -32,26 +62,474 @@ try:
 except Exception as e:
     print(f"❌ SQLAlchemy 초기화 실패: {e}")
 
-# 토큰에서 사용자 ID 추출하는 헬퍼 함수 추가
+# 인증 토큰 헬퍼 함수 (SECRET_KEY로 서명 + 만료 시간 포함 - 검증에 DB 조회 불필요)
+def get_token_serializer():
+    return URLSafeTimedSerializer(app.config['SECRET_KEY'], salt='auth-token')
+
+def issue_auth_token(user_id):
+    """사용자 ID로 서명된 토큰 생성"""
+    return get_token_serializer().dumps({'user_id': user_id})
+
 def extract_user_id_from_token(token):
     """
-    토큰에서 사용자 ID를 안전하게 추출
-    토큰 형식: token_USER_ID_TIMESTAMP
-    예: token_sch_001_1753656376.965785 -> sch_001
+    토큰 서명/만료 확인 후 사용자 ID 추출
+    위조되었거나 만료된 토큰이면 None
     """
     try:
-        parts = token.split('_')
-        if len(parts) >= 3 and parts[0] == 'token':
-            # 첫 번째는 'token', 마지막은 timestamp, 중간은 모두 user_id
-            user_id_parts = parts[1:-1]  # timestamp 제외하고 user_id 부분들
-            user_id = '_'.join(user_id_parts)
-            print(f"🔧 토큰 파싱: {token} -> {user_id}")
-            return user_id
+        payload = get_token_serializer().loads(token, max_age=app.config.get('AUTH_TOKEN_MAX_AGE', 86400))
+        return payload.get('user_id')
+    except SignatureExpired:
+        print("❌ 만료된 토큰")
+        return None
+    except BadSignature:
+        print("❌ 유효하지 않은 토큰 서명")
         return None
     except Exception as e:
         print(f"❌ 토큰 파싱 오류: {e}")
         return None
 
+# ETag 헬퍼 함수 (강한 ETag + If-None-Match 처리)
+def make_etag(*parts):
+    """버전/요청 파라미터 등으로 ETag 값 생성"""
+    return hashlib.sha1(json.dumps(parts, default=str, sort_keys=True).encode('utf-8')).hexdigest()
+
+def set_etag_headers(response, etag):
+    """ETag 설정 + 매번 재검증하도록 Cache-Control 설정 (토큰별로 응답이 다르므로 Vary 추가)"""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.vary.add('Authorization')
+    return response
+
+def not_modified(etag):
+    """If-None-Match가 현재 ETag(또는 압축 변형 ETag)와 같으면 304 응답, 아니면 None"""
+    for candidate in [etag] + [f'{etag}-{encoding}' for encoding in COMPRESSION_ENCODINGS]:
+        if request.if_none_match.contains(candidate):
+            print(f"⚡ 변경 없음 (304): {candidate}")
+            return set_etag_headers(app.response_class(status=304), candidate)
+    return None
+
+# 응답 압축 (Accept-Encoding 협상 - brotli 모듈이 있으면 br 우선, 없으면 gzip)
+COMPRESSION_ENCODINGS = ['br', 'gzip'] if brotli else ['gzip']
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'application/vnd.calendar-snapshot', 'text/calendar'}
+
+class StreamCompressor:
+    """gzip(zlib) / brotli 압축기 공통 인터페이스 (compress: 입력 청크 → 나온 만큼의 출력, finish: 남은 출력)"""
+    
+    def __init__(self, encoding):
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=app.config.get('BROTLI_QUALITY', 5))
+            self.compress, self.finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(app.config.get('GZIP_LEVEL', 6), zlib.DEFLATED, 31)
+            self.compress, self.finish = compressor.compress, compressor.flush
+
+def compress_body(body, encoding):
+    compressor = StreamCompressor(encoding)
+    return compressor.compress(body) + compressor.finish()
+
+def iter_compressed(chunks, encoding):
+    """스트리밍 응답 청크를 이어서 압축 (압축기 내부 버퍼가 찰 때마다 내보내므로 메모리 사용량 일정)"""
+    compressor = StreamCompressor(encoding)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+        if data:
+            yield data
+    yield compressor.finish()
+
+def compress_response(view):
+    """
+    Accept-Encoding 협상 압축 데코레이터
+    - 200 응답 + 압축 대상 MIME 타입만, 일반 응답은 COMPRESSION_MIN_SIZE 이상일 때만 압축
+    - 스트리밍 응답은 청크 단위로 이어서 압축
+    - 뷰가 g.response_cache = (캐시 그룹, 캐시 키)를 남기면 압축 결과도 같은 그룹으로 응답 캐시에 저장
+    - 압축 응답의 ETag는 '원래 ETag-인코딩' (not_modified가 변형 ETag도 인정)
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code != 200 or response.mimetype not in COMPRESSIBLE_MIMETYPES \
+                or 'Content-Encoding' in response.headers:
+            return response
+        response.vary.add('Accept-Encoding')
+        encoding = request.accept_encodings.best_match(COMPRESSION_ENCODINGS)
+        if not encoding:
+            return response
+        
+        if response.is_streamed:
+            response.response = iter_compressed(response.response, encoding)
+            response.headers.pop('Content-Length', None)
+        else:
+            body = response.get_data()
+            if len(body) < app.config.get('COMPRESSION_MIN_SIZE', 1024):
+                return response
+            response_cache = g.pop('response_cache', None)
+            compressed = None
+            if response_cache:
+                group, cache_key = response_cache
+                compressed = schedule_response_cache.get((cache_key, encoding))
+            if compressed is None:
+                compressed = compress_body(body, encoding)
+                if response_cache:
+                    schedule_response_cache.set(group, (cache_key, encoding), compressed)
+            else:
+                print(f"⚡ 압축 응답 캐시 적중 ({encoding})")
+            response.set_data(compressed)
+            print(f"🗜️ {encoding} 압축: {len(body):,}B → {len(compressed):,}B")
+        
+        response.headers['Content-Encoding'] = encoding
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(f'{etag}-{encoding}', weak)
+        return response
+    return wrapper
+
+# 프로세스 내 캐시 (LRU + TTL, 그룹 단위 무효화) - 응답 캐시 / 인증 사용자 캐시에서 사용
+class LRUCache:
+    """
+    스레드 안전 LRU 캐시
+    - max_entries 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    - ttl 초가 지난 항목은 조회 시 만료 처리
+    - group(캘린더 id) 단위로 관련 항목을 정확히 무효화
+    """
+    
+    def __init__(self, max_entries=1024, ttl=60):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (만료 시각, group, value)
+        self._groups = defaultdict(set)  # group -> keys
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+    
+    def _remove(self, key):
+        expires_at, group, value = self._entries.pop(key)
+        keys = self._groups.get(group)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._groups[group]
+    
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] < time_module.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+    
+    def set(self, group, key, value):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time_module.monotonic() + self.ttl, group, value)
+            self._groups[group].add(key)
+            while len(self._entries) > self.max_entries:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+    
+    def invalidate(self, group):
+        """group에 속한 항목 모두 제거"""
+        with self._lock:
+            keys = list(self._groups.get(group, ()))
+            for key in keys:
+                self._remove(key)
+            self.invalidations += len(keys)
+            return len(keys)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._groups.clear()
+    
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups > 0 else 0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+# 캘린더별 일정 목록 응답 캐시 (키: 캘린더 + 조회 기간/파라미터 + 조회 사용자)
+schedule_response_cache = LRUCache(
+    max_entries=app.config.get('RESPONSE_CACHE_MAX_ENTRIES', 1024),
+    ttl=app.config.get('RESPONSE_CACHE_TTL', 60)
+)
+
+# 반복 일정 발생 날짜 캐시 (일정 id 그룹, 키에 규칙/시작일/기간 포함 - 시리즈가 바뀌면 키도 바뀜)
+recurrence_cache = LRUCache(
+    max_entries=app.config.get('RECURRENCE_CACHE_MAX_ENTRIES', 4096),
+    ttl=app.config.get('RECURRENCE_CACHE_TTL', 3600)
+)
+
+# 일정 분석 결과 캐시 (사용자 그룹, 키에 대상 캘린더별 버전 포함 - 일정이 바뀌면 키도 바뀜)
+analytics_cache = LRUCache(
+    max_entries=app.config.get('ANALYTICS_CACHE_MAX_ENTRIES', 256),
+    ttl=app.config.get('ANALYTICS_CACHE_TTL', 3600)
+)
+
+# 인증 사용자 캐시 (요청마다 User 테이블을 조회하지 않도록 TTL 캐시 사용)
+# ORM 객체 대신 필요한 값만 담은 스냅샷을 캐시 (세션과 무관하게 재사용 가능)
+AuthUser = namedtuple('AuthUser', ['id', 'user_id', 'name', 'email', 'user_type'])
+
+auth_user_cache = LRUCache(
+    max_entries=app.config.get('AUTH_USER_CACHE_MAX_ENTRIES', 4096),
+    ttl=app.config.get('AUTH_USER_CACHE_TTL', 300)
+)
+
+def resolve_auth_user(user_id):
+    """사용자 ID → AuthUser (캐시 미스일 때만 DB 조회)"""
+    auth_user = auth_user_cache.get(user_id)
+    if auth_user is None:
+        user = User.query.filter_by(user_id=user_id).first()
+        if not user:
+            return None
+        auth_user = AuthUser(user.id, user.user_id, user.name, user.email, user.user_type)
+        auth_user_cache.set(user_id, user_id, auth_user)
+    return auth_user
+
+def login_required(view):
+    """
+    인증 데코레이터: Authorization 헤더의 토큰 검증 후 g.current_user에 AuthUser 설정
+    실패 시 기존 핸들러와 같은 401/404 JSON 응답
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        auth_header = request.headers.get('Authorization')
+        if not auth_header:
+            print("❌ 인증 헤더 없음")
+            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
+        
+        token = auth_header.replace('Bearer ', '')
+        user_id = extract_user_id_from_token(token)
+        if not user_id:
+            print("❌ 토큰에서 사용자 ID 추출 실패")
+            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
+        
+        user = resolve_auth_user(user_id)
+        if not user:
+            print("❌ 사용자 없음")
+            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
+        
+        g.current_user = user
+        return view(*args, **kwargs)
+    return wrapper
+
+# 조회 기간(from/to) 파라미터 파싱 헬퍼 함수
+def parse_date_window(args):
+    """
+    요청 파라미터에서 조회 기간을 추출
+    형식: ?from=YYYY-MM-DD&to=YYYY-MM-DD (to 날짜 포함, 둘 다 선택 사항)
+    잘못된 형식이면 ValueError 발생
+    """
+    date_from = args.get('from')
+    date_to = args.get('to')
+    
+    date_from = datetime.strptime(date_from, '%Y-%m-%d').date() if date_from else None
+    date_to = datetime.strptime(date_to, '%Y-%m-%d').date() if date_to else None
+    
+    if date_from and date_to and date_from > date_to:
+        raise ValueError('from 날짜는 to 날짜보다 늦을 수 없습니다.')
+    
+    return date_from, date_to
+
+# 페이지네이션 커서 헬퍼 함수 (정렬 키: date_info, start_time, id)
+def encode_schedule_cursor(schedule, occurrence_date=None):
+    """
+    마지막 일정으로 다음 페이지 커서 생성 (반복 일정은 발생 날짜 기준)
+    형식: YYYY-MM-DD_HH:MM:SS_ID
+    """
+    day = occurrence_date or schedule.date_info
+    return f"{day.isoformat()}_{schedule.start_time.strftime('%H:%M:%S')}_{schedule.id}"
+
+def decode_schedule_cursor(cursor):
+    """커서를 (date_info, start_time, id)로 변환, 잘못된 형식이면 ValueError 발생"""
+    date_part, time_part, id_part = cursor.split('_')
+    return (
+        datetime.strptime(date_part, '%Y-%m-%d').date(),
+        datetime.strptime(time_part, '%H:%M:%S').time(),
+        int(id_part)
+    )
+
+def parse_page_size(args):
+    """limit 파라미터 파싱 (기본값/최대값은 Config에서 설정)"""
+    default_size = app.config.get('SCHEDULE_PAGE_SIZE', 100)
+    max_size = app.config.get('SCHEDULE_PAGE_SIZE_MAX', 500)
+    limit = int(args.get('limit', default_size))
+    if limit < 1:
+        raise ValueError('limit은 1 이상이어야 합니다.')
+    return min(limit, max_size)
+
+# 반복 일정(RRULE) 헬퍼 함수
+# 지원 범위: FREQ=DAILY/WEEKLY/MONTHLY/YEARLY, INTERVAL, COUNT, UNTIL, BYDAY(WEEKLY), BYMONTHDAY(MONTHLY)
+# 그 외 규칙이나 자유 형식 문자열은 반복하지 않는 일반 일정으로 취급
+RecurrenceRule = namedtuple('RecurrenceRule', ['freq', 'interval', 'count', 'until', 'byday', 'bymonthday'])
+RRULE_WEEKDAYS = {'MO': 0, 'TU': 1, 'WE': 2, 'TH': 3, 'FR': 4, 'SA': 5, 'SU': 6}
+RRULE_SUPPORTED_PARTS = {'FREQ', 'INTERVAL', 'COUNT', 'UNTIL', 'BYDAY', 'BYMONTHDAY', 'WKST'}
+RECURRENCE_OPEN_END = date(9999, 12, 31)  # 종료 조건 없는 반복 일정의 recurrence_until
+
+def parse_recurrence_rule(value):
+    """recurring 문자열 → RecurrenceRule (지원하지 않는 규칙이면 None)"""
+    if not value or not value.upper().startswith('FREQ='):
+        return None
+    try:
+        parts = dict(part.split('=', 1) for part in value.upper().split(';') if part)
+        if set(parts) - RRULE_SUPPORTED_PARTS or parts.get('WKST', 'MO') != 'MO':
+            return None
+        until = parts.get('UNTIL')
+        rule = RecurrenceRule(
+            freq=parts['FREQ'],
+            interval=int(parts.get('INTERVAL', 1)),
+            count=int(parts['COUNT']) if 'COUNT' in parts else None,
+            until=date(int(until[0:4]), int(until[4:6]), int(until[6:8])) if until else None,
+            byday=tuple(sorted({RRULE_WEEKDAYS[day] for day in parts['BYDAY'].split(',')})) if 'BYDAY' in parts else None,
+            bymonthday=tuple(sorted({int(day) for day in parts['BYMONTHDAY'].split(',')})) if 'BYMONTHDAY' in parts else None
+        )
+    except (ValueError, KeyError):
+        return None
+    
+    if rule.freq not in ('DAILY', 'WEEKLY', 'MONTHLY', 'YEARLY') or rule.interval < 1:
+        return None
+    if rule.count is not None and rule.count < 1:
+        return None
+    if rule.byday and rule.freq != 'WEEKLY':
+        return None
+    if rule.bymonthday and (rule.freq != 'MONTHLY' or not all(1 <= day <= 31 for day in rule.bymonthday)):
+        return None
+    return rule
+
+def iter_recurrence_dates(rule, dtstart, date_from, date_to):
+    """
+    date_from ~ date_to 사이의 발생 날짜를 순서대로 생성
+    - DAILY/WEEKLY는 date_from 이전 주기를 계산으로 건너뛰므로 비용은 기간 내 발생 수에 비례
+    - MONTHLY/YEARLY는 연 12회 이하라 시작일부터 주기를 순회
+    - COUNT는 시작일부터 센 발생 순번 기준
+    """
+    date_from = max(date_from or dtstart, dtstart)
+    date_to = min(date_to, rule.until) if rule.until else date_to
+    
+    if rule.freq == 'DAILY':
+        index = -(-(date_from - dtstart).days // rule.interval)
+        while rule.count is None or index < rule.count:
+            day = dtstart + timedelta(days=index * rule.interval)
+            if day > date_to:
+                return
+            yield day
+            index += 1
+        return
+    
+    if rule.freq == 'WEEKLY':
+        weekdays = rule.byday or (dtstart.weekday(),)
+        first_week = [weekday for weekday in weekdays if weekday >= dtstart.weekday()]
+        week0 = dtstart - timedelta(days=dtstart.weekday())
+        period = ((date_from - week0).days // 7) // rule.interval
+        index = 0 if period == 0 else len(first_week) + (period - 1) * len(weekdays)
+        while True:
+            week_start = week0 + timedelta(weeks=period * rule.interval)
+            if week_start > date_to:
+                return
+            for weekday in (first_week if period == 0 else weekdays):
+                if rule.count is not None and index >= rule.count:
+                    return
+                index += 1
+                day = week_start + timedelta(days=weekday)
+                if day > date_to:
+                    return
+                if day >= date_from:
+                    yield day
+            period += 1
+    
+    index = 0
+    period = 0
+    while True:
+        if rule.freq == 'MONTHLY':
+            month = dtstart.month - 1 + period * rule.interval
+            year, month = dtstart.year + month // 12, month % 12 + 1
+            candidates = [(year, month, day) for day in (rule.bymonthday or (dtstart.day,))]
+        else:
+            year = dtstart.year + period * rule.interval
+            candidates = [(year, dtstart.month, dtstart.day)]
+        if year > date_to.year:
+            return
+        for candidate in candidates:
+            try:
+                day = date(*candidate)
+            except ValueError:
+                continue  # 2월 30일 등 없는 날짜는 건너뜀 (RFC 5545)
+            if day < dtstart:
+                continue
+            if (rule.count is not None and index >= rule.count) or day > date_to:
+                return
+            index += 1
+            if day >= date_from:
+                yield day
+        period += 1
+
+def compute_recurrence_until(recurring, dtstart):
+    """
+    반복 일정의 마지막 발생 날짜 (기간 조회에서 반복 일정 행을 거르는 데 사용)
+    반복 일정이 아니면 None, 종료 조건이 없으면 RECURRENCE_OPEN_END
+    """
+    rule = parse_recurrence_rule(recurring)
+    if rule is None or dtstart is None:
+        return None
+    if rule.count is None:
+        return rule.until or RECURRENCE_OPEN_END
+    last = dtstart
+    try:
+        for last in iter_recurrence_dates(rule, dtstart, dtstart, rule.until or RECURRENCE_OPEN_END):
+            pass
+    except OverflowError:
+        return RECURRENCE_OPEN_END
+    return last
+
+def get_recurrence_horizon(date_from):
+    """조회 종료일이 없을 때 반복 일정을 펼칠 마지막 날짜"""
+    horizon_days = app.config.get('RECURRENCE_HORIZON_DAYS', 366)
+    return (date_from or date.today()) + timedelta(days=horizon_days)
+
+def expand_schedule_occurrences(schedules, date_from, date_to, max_occurrences=None):
+    """
+    일정 목록 → (일정, 발생 날짜) 목록
+    - 일반 일정은 그대로 (date_info)
+    - 반복 일정은 기간 내 발생 날짜로 펼침 (일정별 최대 max_occurrences개, 기본 RECURRENCE_MAX_OCCURRENCES)
+    - 펼친 결과는 (일정 id, 규칙, 시작일, 기간, 최대 개수) 키로 캐시 - 일정 수정/삭제 시 무효화
+    """
+    if max_occurrences is None:
+        max_occurrences = app.config.get('RECURRENCE_MAX_OCCURRENCES', 1000)
+    window_end = date_to or get_recurrence_horizon(date_from)
+    occurrences = []
+    for schedule in schedules:
+        rule = parse_recurrence_rule(schedule.recurring) if schedule.recurrence_until else None
+        if rule is None:
+            occurrences.append((schedule, schedule.date_info))
+            continue
+        
+        cache_key = (schedule.id, schedule.recurring, schedule.date_info, date_from, window_end, max_occurrences)
+        dates = recurrence_cache.get(cache_key)
+        if dates is None:
+            dates = tuple(itertools.islice(iter_recurrence_dates(rule, schedule.date_info, date_from, window_end), max_occurrences))
+            recurrence_cache.set(schedule.id, cache_key, dates)
+        occurrences.extend((schedule, day) for day in dates)
+    return occurrences
+
 # 프론트엔드 라우트
 @app.route('/')
 def index():
@@ -63,6 +541,130 @@ def static_files(filename):
     print(f"📁 정적 파일 요청: {filename}")
     return send_from_directory('static', filename)
 
+# 비밀번호 해시 전용 프로세스 풀 (scrypt 계산으로 요청 처리 스레드가 막히지 않도록)
+class PasswordHasherBusy(Exception):
+    """비밀번호 해시 대기열이 가득 찬 경우"""
+
+def normalize_password_hash_method(method):
+    """
+    해시 방식 → 저장된 해시 앞부분과 같은 전체 표기 (werkzeug 기본값 채움)
+    예: 'scrypt' → 'scrypt:32768:8:1', 'pbkdf2' → 'pbkdf2:sha256:<기본 반복 수>'
+    """
+    name, *args = method.split(':')
+    if name == 'scrypt' and not args:
+        return 'scrypt:32768:8:1'
+    if name == 'pbkdf2' and len(args) < 2:
+        return f"pbkdf2:{args[0] if args else 'sha256'}:{DEFAULT_PBKDF2_ITERATIONS}"
+    return method
+
+class PasswordHasher:
+    """
+    scrypt 해시/검증을 별도 프로세스 풀에서 실행
+    - workers: 프로세스 수 (0이면 현재 스레드에서 직접 실행)
+    - max_pending: 동시에 처리/대기할 수 있는 최대 요청 수 (초과 시 PasswordHasherBusy)
+      시간 초과로 응답을 포기해도 워커에서 계산이 끝날 때까지는 자리를 차지
+    """
+    
+    def __init__(self, method, workers=2, max_pending=32, timeout=10):
+        self.method = normalize_password_hash_method(method)
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+    
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+    
+    def _run(self, func, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy('비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요.')
+        
+        started = time_module.monotonic()
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        
+        def release(_future=None):
+            elapsed = time_module.monotonic() - started
+            with self._lock:
+                self.in_flight -= 1
+                self.completed += 1
+                self.total_seconds += elapsed
+                self.max_seconds = max(self.max_seconds, elapsed)
+            self._slots.release()
+        
+        if self.workers <= 0:
+            try:
+                return func(*args)
+            finally:
+                release()
+        
+        try:
+            future = self._get_executor().submit(func, *args)
+        except BrokenProcessPool:
+            # 워커 프로세스가 죽은 경우 다음 요청에서 풀을 새로 생성
+            with self._executor_lock:
+                self._executor = None
+            release()
+            raise
+        except Exception:
+            release()
+            raise
+        # 자리는 작업이 실제로 끝날 때 반환 (시간 초과 후에도 워커가 계산 중이면 계속 차지)
+        future.add_done_callback(release)
+        try:
+            return future.result(timeout=self.timeout)
+        except BrokenProcessPool:
+            with self._executor_lock:
+                self._executor = None
+            raise
+    
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+    
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+    
+    def needs_rehash(self, password_hash):
+        """저장된 해시 방식(예: scrypt:32768:8:1)이 현재 설정과 다르면 True"""
+        return password_hash.split('$', 1)[0] != self.method
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'method': self.method,
+                'workers': self.workers,
+                'max_pending': self.max_pending,
+                'in_flight': self.in_flight,
+                'queued': max(0, self.in_flight - self.workers),
+                'peak_in_flight': self.peak_in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'avg_seconds': self.total_seconds / self.completed if self.completed > 0 else 0,
+                'max_seconds': self.max_seconds
+            }
+
+password_hasher = PasswordHasher(
+    method=app.config.get('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1'),
+    workers=app.config.get('PASSWORD_HASH_WORKERS', 2),
+    max_pending=app.config.get('PASSWORD_HASH_MAX_PENDING', 32),
+    timeout=app.config.get('PASSWORD_HASH_TIMEOUT', 10)
+)
+
 # 데이터베이스 모델 정의 (기존 구조와 호환)
 class User(db.Model):
     __tablename__ = 'users'
@@ -80,10 +682,13 @@ class User(db.Model):
     calendars = db.relationship('Calendar', backref='user', lazy=True, cascade='all, delete-orphan')
     
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self):
+        return password_hasher.needs_rehash(self.password_hash)
     
     def to_dict(self):
         return {
@@ -96,6 +701,19 @@ class User(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'calendars': [calendar.to_dict() for calendar in self.calendars]
         }
+    
+    def to_export_dict(self):
+        """/json-data 전체 덤프용 (캘린더 제외, 내부 id 포함)"""
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'name': self.name,
+            'email': self.email,
+            'user_type': self.user_type,
+            'phone': self.phone,
+            'profile': self.profile,
+            'created_at': self.created_at.isoformat() if self.created_at else None
+        }
 
 class Calendar(db.Model):
     __tablename__ = 'calendars'
@@ -106,6 +724,12 @@ class Calendar(db.Model):
     description = db.Column(db.Text)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    # 일정 추가/삭제 시마다 증가하는 버전 (ETag 생성용 - 일정 테이블 조회 없이 변경 여부 판단)
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    # 마지막 일정 변경 시각 (버전과 함께 갱신, .ics 피드 Last-Modified용)
+    updated_at = db.Column(db.DateTime)
+    # .ics 구독 전용 비밀 값 (읽기 전용, 재발급/폐기 가능 - 로그인 토큰 대신 구독 URL에 사용)
+    feed_token = db.Column(db.String(64), unique=True)
     
     schedules = db.relationship('Schedule', backref='calendar', lazy=True, cascade='all, delete-orphan')
     
@@ -117,6 +741,17 @@ class Calendar(db.Model):
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'schedules': [schedule.to_dict() for schedule in self.schedules]
         }
+    
+    def to_export_dict(self):
+        """/json-data 전체 덤프용 (일정 제외, 내부 id 포함)"""
+        return {
+            'id': self.id,
+            'calendar_code': self.calendar_code,
+            'calendar_name': self.calendar_name,
+            'description': self.description,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'user_id': self.user_id
+        }
 
 class Schedule(db.Model):
     __tablename__ = 'schedules'
@@ -136,30 +771,68 @@ class Schedule(db.Model):
     importance = db.Column(db.Integer, default=5)
     notes = db.Column(db.Text)
     recurring = db.Column(db.String(100))
+    # 반복 일정의 마지막 발생 날짜 (반복 일정이 아니면 NULL, 종료 조건 없으면 9999-12-31)
+    recurrence_until = db.Column(db.Date)
     
-    # 기존 JSON 컬럼들 (필요시 사용)
-    exercise_plan = db.Column(db.JSON)
-    health_goals = db.Column(db.JSON)
-    family_activities = db.Column(db.JSON)
-    gifts_to_bring = db.Column(db.JSON)
-    meeting_agenda = db.Column(db.JSON)
-    attendees = db.Column(db.JSON)
-    preparation_items = db.Column(db.JSON)
-    presentation_materials = db.Column(db.JSON)
-    client_info = db.Column(db.JSON)
-    success_metrics = db.Column(db.JSON)
-    study_details = db.Column(db.JSON)
-    study_members = db.Column(db.JSON)
-    goals = db.Column(db.JSON)
-    lesson_details = db.Column(db.JSON)
-    equipment_needed = db.Column(db.JSON)
-    practice_goals = db.Column(db.JSON)
-    medical_info = db.Column(db.JSON)
-    insurance_info = db.Column(db.JSON)
-    preparation = db.Column(db.JSON)
+    # 기존 JSON 컬럼들 (필요시 사용) - 목록 조회에서는 읽지 않으므로 지연 로딩 그룹으로 분리
+    # 필요한 쿼리에서만 .options(db.undefer_group('extras'))로 함께 조회
+    exercise_plan = db.deferred(db.Column(db.JSON), group='extras')
+    health_goals = db.deferred(db.Column(db.JSON), group='extras')
+    family_activities = db.deferred(db.Column(db.JSON), group='extras')
+    gifts_to_bring = db.deferred(db.Column(db.JSON), group='extras')
+    meeting_agenda = db.deferred(db.Column(db.JSON), group='extras')
+    attendees = db.deferred(db.Column(db.JSON), group='extras')
+    preparation_items = db.deferred(db.Column(db.JSON), group='extras')
+    presentation_materials = db.deferred(db.Column(db.JSON), group='extras')
+    client_info = db.deferred(db.Column(db.JSON), group='extras')
+    success_metrics = db.deferred(db.Column(db.JSON), group='extras')
+    study_details = db.deferred(db.Column(db.JSON), group='extras')
+    study_members = db.deferred(db.Column(db.JSON), group='extras')
+    goals = db.deferred(db.Column(db.JSON), group='extras')
+    lesson_details = db.deferred(db.Column(db.JSON), group='extras')
+    equipment_needed = db.deferred(db.Column(db.JSON), group='extras')
+    practice_goals = db.deferred(db.Column(db.JSON), group='extras')
+    medical_info = db.deferred(db.Column(db.JSON), group='extras')
+    insurance_info = db.deferred(db.Column(db.JSON), group='extras')
+    preparation = db.deferred(db.Column(db.JSON), group='extras')
     
     calendar_id = db.Column(db.Integer, db.ForeignKey('calendars.id'), nullable=False)
     
+    # 월간 뷰 조회용 복합 인덱스 (캘린더 + 기간 범위 스캔)
+    # 전체 일정 페이지네이션용 인덱스 (date_info, start_time, id 순 키셋)
+    __table_args__ = (
+        db.Index('idx_schedules_calendar_date_time', 'calendar_id', 'date_info', 'start_time'),
+        db.Index('idx_schedules_date_time_id', 'date_info', 'start_time', 'id'),
+        db.Index('idx_schedules_calendar_recurrence', 'calendar_id', 'recurrence_until', 'date_info', 'start_time', 'importance', 'estimated_cost'),
+    )
+    
+    @classmethod
+    def window_condition(cls, date_from=None, date_to=None):
+        """
+        조회 기간 조건 (없으면 None)
+        일반 일정은 date_info가 기간 안에 있을 때, 반복 일정은 시작~마지막 발생이 기간과 겹칠 때
+        """
+        if not date_from and not date_to:
+            return None
+        plain = []
+        series = [cls.recurrence_until.isnot(None)]
+        if date_from:
+            plain.append(cls.date_info >= date_from)
+            series.append(cls.recurrence_until >= date_from)
+        if date_to:
+            plain.append(cls.date_info <= date_to)
+        if date_to and not date_from:
+            # 시작일이 있으면 recurrence_until 인덱스만 사용 (date_info 조건이 있으면 과거 전체를 훑는
+            # date_info 범위 조회가 선택될 수 있음 - 기간 이후에 시작하는 시리즈는 펼칠 때 제외됨)
+            series.append(cls.date_info <= date_to)
+        return db.or_(db.and_(*plain), db.and_(*series))
+    
+    @classmethod
+    def in_window(cls, query, date_from=None, date_to=None):
+        """조회 기간 조건을 SQL 쿼리에 추가 (반복 일정은 기간과 겹치는 시리즈 행 포함)"""
+        condition = cls.window_condition(date_from, date_to)
+        return query.filter(condition) if condition is not None else query
+    
     def to_dict(self):
         return {
             'schedule_id': self.schedule_id,
@@ -176,13 +849,677 @@ class Schedule(db.Model):
             'recurring': self.recurring,
             'tags': self.tags
         }
+    
+    def to_export_dict(self):
+        """/json-data 전체 덤프용 (파생 필드 + 추가 JSON 필드 포함)"""
+        # 날짜와 시간을 결합하여 완전한 datetime 생성
+        start_datetime = datetime.combine(self.date_info, self.start_time)
+        end_datetime = datetime.combine(self.date_info, self.end_time)
+        
+        # location_data와 participants_data 안전하게 처리
+        location_str = ""
+        if self.location_data:
+            if isinstance(self.location_data, dict):
+                location_str = self.location_data.get('name', '')
+            else:
+                location_str = str(self.location_data)
+        
+        participants_list = []
+        if self.participants_data:
+            if isinstance(self.participants_data, list):
+                participants_list = self.participants_data
+            else:
+                participants_list = [str(self.participants_data)]
+        
+        return {
+            'id': self.id,
+            'schedule_id': self.schedule_id,
+            'title': self.title,
+            'description': self.description,
+            'date_info': self.date_info.isoformat(),
+            'start_time': self.start_time.strftime('%H:%M'),
+            'end_time': self.end_time.strftime('%H:%M'),
+            'start_datetime': start_datetime.isoformat(),
+            'end_datetime': end_datetime.isoformat(),
+            'location_data': self.location_data,
+            'location_str': location_str,
+            'participants_data': self.participants_data,
+            'participants_list': participants_list,
+            'estimated_cost': self.estimated_cost,
+            'tags': self.tags,
+            'importance': self.importance,
+            'notes': self.notes,
+            'recurring': self.recurring,
+            'calendar_id': self.calendar_id,
+            # 추가 JSON 필드들
+            'exercise_plan': self.exercise_plan,
+            'health_goals': self.health_goals,
+            'family_activities': self.family_activities,
+            'meeting_agenda': self.meeting_agenda,
+            'attendees': self.attendees,
+            'preparation_items': self.preparation_items,
+            'medical_info': self.medical_info
+        }
+
+# 테이블별 행 수 카운터 (/json-summary용 - COUNT(*) 전체 스캔 대신 O(1) 조회)
+class TableCounter(db.Model):
+    __tablename__ = 'table_counters'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    count = db.Column(db.BigInteger, nullable=False, default=0)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+COUNTED_MODELS = {'users': User, 'calendars': Calendar, 'schedules': Schedule}
+
+def seed_counters(connection):
+    """없는 카운터 행을 현재 COUNT(*)로 생성 (이미 있는 행은 유지)"""
+    counters = TableCounter.__table__
+    existing = set(connection.execute(db.select(counters.c.name)).scalars())
+    for name, model in COUNTED_MODELS.items():
+        if name not in existing:
+            count = connection.execute(db.select(db.func.count()).select_from(model.__table__)).scalar()
+            connection.execute(counters.insert().values(name=name, count=count, updated_at=datetime.utcnow()))
+
+# db.create_all()로 테이블을 만들 때 카운터 행도 함께 생성 (모든 테이블 생성 후 실행)
+@db.event.listens_for(db.metadata, 'after_create')
+def seed_counters_after_create(target, connection, **kw):
+    seed_counters(connection)
+
+def bump_counter(connection, name, delta):
+    """
+    카운터 증감 (같은 커넥션/트랜잭션에서 실행되므로 INSERT/DELETE와 함께 커밋/롤백)
+    카운터 행이 없으면 같은 트랜잭션의 COUNT(*)로 생성 (방금 INSERT/DELETE한 행까지 반영된 값)
+    """
+    counters = TableCounter.__table__
+    result = connection.execute(
+        counters.update()
+        .where(counters.c.name == name)
+        .values(count=counters.c.count + delta, updated_at=datetime.utcnow())
+    )
+    if result.rowcount == 0:
+        print(f"⚠️ 카운터 행 없음 - 생성: {name}")
+        seed_counters(connection)
+
+def reconcile_counters():
+    """실제 COUNT(*)로 카운터 재계산 (불일치 복구용 - flask reconcile-counters)"""
+    counts = {}
+    for name, model in COUNTED_MODELS.items():
+        counts[name] = db.session.query(db.func.count(model.id)).scalar()
+        db.session.merge(TableCounter(name=name, count=counts[name], updated_at=datetime.utcnow()))
+    db.session.commit()
+    print(f"🔄 카운터 재계산 완료: {counts}")
+    return counts
+
+def get_table_counts():
+    """
+    카운터 테이블에서 행 수 조회 (읽기 전용)
+    카운터 행이 없으면 쓰지 않고 COUNT(*)로 대신 응답 - 복구는 flask reconcile-counters
+    """
+    counts = {counter.name: counter.count for counter in TableCounter.query.all()}
+    for name, model in COUNTED_MODELS.items():
+        if name not in counts:
+            print(f"⚠️ 카운터 없음 - COUNT(*)로 대체: {name}")
+            counts[name] = db.session.query(db.func.count(model.id)).scalar()
+    return counts
+
+# INSERT/DELETE 시 카운터 자동 갱신 (create_user, create_calendar, 일정 생성/삭제 등 모든 경로)
+def register_counter_events(name, model):
+    @db.event.listens_for(model, 'after_insert')
+    def after_insert(mapper, connection, target):
+        bump_counter(connection, name, 1)
+    
+    @db.event.listens_for(model, 'after_delete')
+    def after_delete(mapper, connection, target):
+        bump_counter(connection, name, -1)
+
+for counter_name, counted_model in COUNTED_MODELS.items():
+    register_counter_events(counter_name, counted_model)
+
+# 일정 INSERT/UPDATE/DELETE 시 해당 캘린더 버전 증가 (같은 트랜잭션)
+def bump_calendar_version(connection, calendar_id):
+    calendars = Calendar.__table__
+    connection.execute(
+        calendars.update()
+        .where(calendars.c.id == calendar_id)
+        .values(version=calendars.c.version + 1, updated_at=datetime.utcnow())
+    )
+
+@db.event.listens_for(Schedule, 'after_insert')
+@db.event.listens_for(Schedule, 'after_update')
+@db.event.listens_for(Schedule, 'after_delete')
+def schedule_changed(mapper, connection, target):
+    bump_calendar_version(connection, target.calendar_id)
+    recurrence_cache.invalidate(target.id)
+
+# 반복 규칙/시작일이 바뀌면 마지막 발생 날짜 재계산 (Core 일괄 INSERT는 행 생성 시 직접 계산)
+@db.event.listens_for(Schedule, 'before_insert')
+@db.event.listens_for(Schedule, 'before_update')
+def schedule_recurrence_until(mapper, connection, target):
+    target.recurrence_until = compute_recurrence_until(target.recurring, target.date_info)
+
+# 일정 검색용 역색인 (글자 2-gram → 일정, 캘린더 id로 시작하는 키라 사용자 캘린더 범위만 조회)
+# 한글은 띄어쓰기/조사 변화가 많아 단어 대신 2글자 단위로 색인 (예: "클라이언트" → 클라/라이/이언/언트)
+class ScheduleSearchToken(db.Model):
+    __tablename__ = 'schedule_search_index'
+    
+    calendar_id = db.Column(db.Integer, primary_key=True)
+    token = db.Column(db.String(16), primary_key=True)
+    schedule_id = db.Column(db.Integer, primary_key=True, index=True)
+    weight = db.Column(db.Integer, nullable=False, default=1)
+
+# 일정 태그 정규화 테이블 (tags JSON 배열 대신 인덱스로 태그 필터/집계)
+# - (calendar_id, tag, schedule_id): 캘린더/사용자 범위 태그 필터, 태그별 개수 집계
+# - (tag, schedule_id): 전체 캘린더 대상 태그 필터
+class ScheduleTag(db.Model):
+    __tablename__ = 'schedule_tags'
+    
+    calendar_id = db.Column(db.Integer, primary_key=True)
+    tag = db.Column(db.String(50), primary_key=True)
+    schedule_id = db.Column(db.Integer, primary_key=True, index=True)
+    
+    __table_args__ = (
+        db.Index('idx_schedule_tags_tag', 'tag', 'schedule_id'),
+    )
+
+def normalize_tag(tag):
+    """태그 비교용 정규화 (NFKC + 공백 제거 + 소문자, 최대 50자)"""
+    return unicodedata.normalize('NFKC', str(tag)).strip().lower()[:50]
+
+def build_tag_rows(schedule):
+    """일정(행/dict) → 태그 테이블 행 목록 (중복 태그 제거)"""
+    get = schedule.get if isinstance(schedule, dict) else lambda key: getattr(schedule, key)
+    tags = get('tags')
+    if not isinstance(tags, list):
+        return []
+    normalized = dict.fromkeys(normalize_tag(tag) for tag in tags if tag is not None)
+    return [
+        {'calendar_id': get('calendar_id'), 'tag': tag, 'schedule_id': get('id')}
+        for tag in normalized if tag
+    ]
+
+def reindex_schedule_tags(connection, schedules):
+    """일정들의 태그 테이블 행 교체 (같은 커넥션/트랜잭션에서 실행)"""
+    schedule_tags = ScheduleTag.__table__
+    schedules = list(schedules)
+    if not schedules:
+        return
+    ids = [schedule['id'] if isinstance(schedule, dict) else schedule.id for schedule in schedules]
+    connection.execute(schedule_tags.delete().where(schedule_tags.c.schedule_id.in_(ids)))
+    rows = [row for schedule in schedules for row in build_tag_rows(schedule)]
+    if rows:
+        connection.execute(schedule_tags.insert(), rows)
+
+def filter_by_tags(query, tags, calendar_id=None):
+    """태그 조건 추가 (여러 개면 모두 포함) - 태그 테이블 인덱스 조회로 일정 id를 좁힘"""
+    schedule_tags = ScheduleTag.__table__
+    for tag in tags:
+        tagged = db.select(schedule_tags.c.schedule_id).where(schedule_tags.c.tag == tag)
+        if calendar_id is not None:
+            tagged = tagged.where(schedule_tags.c.calendar_id == calendar_id)
+        query = query.filter(Schedule.id.in_(tagged))
+    return query
+
+def parse_tags(args):
+    """?tag=a&tag=b → 정규화된 태그 목록"""
+    return list(dict.fromkeys(tag for tag in (normalize_tag(value) for value in args.getlist('tag')) if tag))
+
+# 참석자 역색인 테이블 ("이 사람이 참석하는 일정" 조회 / 참석자 이름 자동완성)
+# - (calendar_id, name_key, schedule_id): 이름 조회, 이름 접두어 자동완성
+# - (calendar_id, contact_key, schedule_id): 연락처 조회
+class ScheduleParticipant(db.Model):
+    __tablename__ = 'schedule_participants'
+    
+    calendar_id = db.Column(db.Integer, primary_key=True)
+    name_key = db.Column(db.String(100), primary_key=True)
+    schedule_id = db.Column(db.Integer, primary_key=True, index=True)
+    contact_key = db.Column(db.String(100), nullable=False, default='')
+    name = db.Column(db.String(100), nullable=False)
+    contact = db.Column(db.String(100), nullable=False, default='')
+    
+    __table_args__ = (
+        db.Index('idx_schedule_participants_contact', 'calendar_id', 'contact_key', 'schedule_id'),
+    )
+
+def normalize_participant_name(name):
+    """참석자 이름 비교용 정규화 (NFKC + 소문자 + 공백 제거 - '김 대표'와 '김대표'를 같은 사람으로)"""
+    return ''.join(unicodedata.normalize('NFKC', str(name)).lower().split())[:100]
+
+def normalize_participant_contact(contact):
+    """연락처 비교용 정규화 (이메일은 소문자, 전화번호는 숫자만)"""
+    contact = unicodedata.normalize('NFKC', str(contact)).strip().lower()
+    if '@' not in contact:
+        digits = ''.join(ch for ch in contact if ch.isdigit())
+        contact = digits or contact
+    return contact[:100]
+
+def build_participant_rows(schedule):
+    """일정(행/dict) → 참석자 색인 행 목록 (같은 이름은 첫 항목만, 이름이 없으면 연락처를 키로 사용)"""
+    get = schedule.get if isinstance(schedule, dict) else lambda key: getattr(schedule, key)
+    participants = get('participants_data')
+    if not isinstance(participants, list):
+        return []
+    rows = {}
+    for participant in participants:
+        if isinstance(participant, dict):
+            name = participant.get('name') or ''
+            contact = participant.get('contact') or participant.get('email') or ''
+        else:
+            name, contact = participant or '', ''
+        contact_key = normalize_participant_contact(contact) if contact else ''
+        name_key = normalize_participant_name(name) or contact_key
+        if name_key and name_key not in rows:
+            rows[name_key] = {
+                'calendar_id': get('calendar_id'), 'name_key': name_key, 'schedule_id': get('id'),
+                'contact_key': contact_key, 'name': str(name or contact)[:100], 'contact': str(contact)[:100]
+            }
+    return list(rows.values())
+
+def reindex_schedule_participants(connection, schedules):
+    """일정들의 참석자 색인 행 교체 (같은 커넥션/트랜잭션에서 실행)"""
+    schedule_participants = ScheduleParticipant.__table__
+    schedules = list(schedules)
+    if not schedules:
+        return
+    ids = [schedule['id'] if isinstance(schedule, dict) else schedule.id for schedule in schedules]
+    connection.execute(schedule_participants.delete().where(schedule_participants.c.schedule_id.in_(ids)))
+    rows = [row for schedule in schedules for row in build_participant_rows(schedule)]
+    if rows:
+        connection.execute(schedule_participants.insert(), rows)
+
+def prefix_upper_bound(prefix):
+    """접두어 범위 조회 상한 (prefix <= key < 상한) - LIKE 대신 인덱스 범위 조건으로 사용"""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+# 필드별 가중치 (제목 일치를 가장 높게)
+SEARCH_FIELD_WEIGHTS = (('title', 3), ('tags', 2), ('location_data', 2), ('description', 1), ('notes', 1))
+SEARCH_WORD_PATTERN = re.compile(r'\w+')
+
+def tokenize_search_text(value):
+    """검색어/본문 → 글자 2-gram 목록 (NFKC 정규화 + 소문자, 1글자 단어는 제외)"""
+    if not value:
+        return []
+    tokens = []
+    for word in SEARCH_WORD_PATTERN.findall(unicodedata.normalize('NFKC', value).lower()):
+        tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+def schedule_search_text(field, value):
+    """필드 값 → 색인할 문자열 (tags는 목록, location_data는 name만)"""
+    if field == 'tags':
+        return ' '.join(str(tag) for tag in value) if isinstance(value, list) else (value or '')
+    if field == 'location_data':
+        return value.get('name', '') if isinstance(value, dict) else (value or '')
+    return value or ''
+
+def build_search_postings(schedule):
+    """일정(행/dict) → 역색인 행 목록 (같은 토큰은 필드 가중치 합으로 한 행)"""
+    get = schedule.get if isinstance(schedule, dict) else lambda key: getattr(schedule, key)
+    weights = defaultdict(int)
+    for field, weight in SEARCH_FIELD_WEIGHTS:
+        for token in tokenize_search_text(schedule_search_text(field, get(field))):
+            weights[token] += weight
+    return [
+        {'calendar_id': get('calendar_id'), 'token': token, 'schedule_id': get('id'), 'weight': weight}
+        for token, weight in weights.items()
+    ]
+
+def reindex_schedule_search(connection, schedules):
+    """일정들의 역색인 행 교체 (같은 커넥션/트랜잭션에서 실행)"""
+    search_index = ScheduleSearchToken.__table__
+    schedules = list(schedules)
+    if not schedules:
+        return
+    ids = [schedule['id'] if isinstance(schedule, dict) else schedule.id for schedule in schedules]
+    connection.execute(search_index.delete().where(search_index.c.schedule_id.in_(ids)))
+    postings = [posting for schedule in schedules for posting in build_search_postings(schedule)]
+    if postings:
+        connection.execute(search_index.insert(), postings)
+
+# 파생 색인(검색/태그/참석자)이 참조하는 일정 컬럼 - 이 컬럼이 바뀔 때만 재색인
+SCHEDULE_INDEX_FIELDS = [field for field, _ in SEARCH_FIELD_WEIGHTS] + ['participants_data', 'calendar_id']
+
+def load_index_fields(connection, schedule_ids):
+    """파생 색인에 필요한 컬럼만 다시 조회 (일부 컬럼만 로드된 객체도 안전하게 색인)"""
+    schedules = Schedule.__table__
+    columns = [schedules.c.id] + [schedules.c[field] for field in SCHEDULE_INDEX_FIELDS]
+    return [dict(row._mapping) for row in connection.execute(db.select(*columns).where(schedules.c.id.in_(schedule_ids)))]
+
+def index_schedules(connection, schedules):
+    """일정 파생 색인(검색 역색인 + 태그 테이블 + 참석자 색인) 갱신"""
+    schedules = list(schedules)
+    reindex_schedule_search(connection, schedules)
+    reindex_schedule_tags(connection, schedules)
+    reindex_schedule_participants(connection, schedules)
+
+@db.event.listens_for(Schedule, 'after_insert')
+def schedule_indexes_inserted(mapper, connection, target):
+    index_schedules(connection, [target])
+
+@db.event.listens_for(Schedule, 'after_update')
+def schedule_indexes_updated(mapper, connection, target):
+    state = db.inspect(target)
+    if any(state.attrs[field].history.has_changes() for field in SCHEDULE_INDEX_FIELDS):
+        index_schedules(connection, load_index_fields(connection, [target.id]))
+
+@db.event.listens_for(Schedule, 'after_delete')
+def schedule_indexes_deleted(mapper, connection, target):
+    for table in (ScheduleSearchToken.__table__, ScheduleTag.__table__, ScheduleParticipant.__table__):
+        connection.execute(table.delete().where(table.c.schedule_id == target.id))
+
+def rebuild_schedule_indexes(batch_size=1000):
+    """검색 역색인 + 태그 테이블 + 참석자 색인 전체 재생성 (기존 데이터 최초 색인 / 불일치 복구용)"""
+    connection = db.session.connection()
+    for table in (ScheduleSearchToken.__table__, ScheduleTag.__table__, ScheduleParticipant.__table__):
+        connection.execute(table.delete())
+    schedules = Schedule.__table__
+    last_id = 0
+    total = 0
+    while True:
+        ids = [row[0] for row in connection.execute(
+            db.select(schedules.c.id).where(schedules.c.id > last_id).order_by(schedules.c.id).limit(batch_size)
+        )]
+        if not ids:
+            break
+        index_schedules(connection, load_index_fields(connection, ids))
+        last_id = ids[-1]
+        total += len(ids)
+    db.session.commit()
+    print(f"✅ 검색/태그/참석자 색인 재생성 완료: 일정 {total}개")
+    return total
+
+# 사용자 정보 변경/삭제 시 인증 사용자 캐시 무효화
+@db.event.listens_for(User, 'after_update')
+@db.event.listens_for(User, 'after_delete')
+def user_changed(mapper, connection, target):
+    auth_user_cache.invalidate(target.user_id)
+
+@app.cli.command('reconcile-counters')
+def reconcile_counters_command():
+    """flask reconcile-counters - 카운터 테이블 재계산"""
+    reconcile_counters()
+
+@app.cli.command('rebuild-schedule-indexes')
+def rebuild_schedule_indexes_command():
+    """flask rebuild-schedule-indexes - 일정 검색 역색인/태그 테이블/참석자 색인 재생성"""
+    rebuild_schedule_indexes()
 
 print("✅ 데이터베이스 모델 정의 완료")
 
+# 관계 통계 계산 헬퍼 함수
+def compute_relationship_stats():
+    """
+    사용자별 캘린더 수, 캘린더별 일정 수를 GROUP BY 쿼리 한 번씩으로 계산
+    (캘린더/일정이 없는 항목도 0으로 포함)
+    """
+    user_rows = db.session.query(User.user_id, db.func.count(Calendar.id)) \
+        .outerjoin(Calendar, Calendar.user_id == User.id) \
+        .group_by(User.id, User.user_id) \
+        .all()
+    user_calendar_stats = {user_id: count for user_id, count in user_rows}
+    
+    calendar_rows = db.session.query(Calendar.calendar_code, db.func.count(Schedule.id)) \
+        .outerjoin(Schedule, Schedule.calendar_id == Calendar.id) \
+        .group_by(Calendar.id, Calendar.calendar_code) \
+        .all()
+    calendar_schedule_stats = {calendar_code: count for calendar_code, count in calendar_rows}
+    
+    return user_calendar_stats, calendar_schedule_stats
+
+# NDJSON 스트리밍 내보내기 (/json-data?format=ndjson)
+EXPORT_CHUNK_SIZE = 1000
+
+def iter_ndjson_export():
+    """
+    users → calendars → schedules 순서로 한 줄에 레코드 하나씩 생성
+    서버 사이드 커서(yield_per)로 청크 단위 조회하므로 메모리 사용량 일정
+    """
+    counts = {'users': 0, 'calendars': 0, 'schedules': 0}
+    tables = [('user', 'users', User), ('calendar', 'calendars', Calendar), ('schedule', 'schedules', Schedule)]
+    
+    yield json.dumps({'type': 'meta', 'timestamp': datetime.utcnow().isoformat(), 'tables': [t[1] for t in tables]}, ensure_ascii=False) + '\n'
+    
+    for record_type, table_name, model in tables:
+        stmt = db.select(model).order_by(model.id).execution_options(yield_per=EXPORT_CHUNK_SIZE)
+        if model is Schedule:
+            stmt = stmt.options(db.undefer_group('extras'))
+        for obj in db.session.execute(stmt).scalars():
+            yield json.dumps({'type': record_type, 'data': obj.to_export_dict()}, ensure_ascii=False) + '\n'
+            counts[table_name] += 1
+        print(f"📤 NDJSON 내보내기: {table_name} {counts[table_name]}건")
+    
+    yield json.dumps({'type': 'summary', 'statistics': counts}, ensure_ascii=False) + '\n'
+
+# 컬럼형 스냅샷 내보내기 (/json-data?format=columnar, flask export-snapshot)
+#
+# 스냅샷 형식 (모든 정수는 little-endian)
+#   파일  = 매직 b'CALSNAP1' + 블록 반복
+#   블록  = 헤더 길이(uint32) + 헤더(UTF-8 JSON) + 버퍼들(헤더 columns[].buffers 길이 순서대로 이어 붙임)
+#   첫 블록 헤더: {"format": "calsnap", "version": 1, "timestamp": ..., "tables": [{"name", "columns": [{"name", "type"}]}]}
+#   데이터 블록 헤더: {"table", "rows", "columns": [{"name", "validity", "buffers": [바이트 길이...], "dictionary": 새 사전 항목 수, "reset": 사전 초기화 여부}]}
+#   마지막 블록 헤더: {"statistics": {테이블: 행 수}} (버퍼 없음)
+# 컬럼 타입별 버퍼
+#   int64     : 값 int64 × rows
+#   date      : 1970-01-01부터 일수 int32 × rows
+#   time      : 자정부터 초 int32 × rows
+#   timestamp : 1970-01-01 00:00:00(UTC)부터 초 int64 × rows
+#   string    : 오프셋 int32 × (rows + 1) + UTF-8 데이터
+#   dictionary: 사전 인덱스 int32 × rows + 새 사전 항목(string 형식 2개 버퍼)
+#               종류가 적은 컬럼(user_type, recurring)용 - 사전은 테이블/컬럼별로 블록을 넘어 누적
+#               (이전 블록에 나온 값은 다시 보내지 않음, SNAPSHOT_DICTIONARY_MAX_ENTRIES를 넘으면 초기화)
+#   json      : dictionary와 같은 인코딩, 값은 DB에 저장된 JSON 텍스트 그대로
+#               값 종류가 많으므로 사전은 블록마다 새로 시작 (블록 안의 중복만 제거)
+# reset이 true면 읽는 쪽은 이전 사전을 버리고 이 블록의 새 항목으로 대체 (Arrow 사전 교체와 같은 방식)
+# validity가 true인 컬럼은 맨 앞에 null 비트맵 버퍼 추가 (행 i → 바이트 i // 8의 비트 i % 8, 1 = 값 있음)
+SNAPSHOT_MAGIC = b'CALSNAP1'
+SNAPSHOT_EPOCH = datetime(1970, 1, 1)
+SNAPSHOT_EPOCH_ORDINAL = SNAPSHOT_EPOCH.toordinal()
+# 누적 사전(dictionary 컬럼) 최대 항목 수 - 넘으면 다음 블록에서 초기화 (내보내기/읽기 메모리 상한)
+SNAPSHOT_DICTIONARY_MAX_ENTRIES = 65536
+
+SNAPSHOT_TABLES = [
+    ('users', User, [
+        ('id', 'int64'), ('user_id', 'string'), ('name', 'string'), ('email', 'string'),
+        ('user_type', 'dictionary'), ('phone', 'string'), ('profile', 'string'), ('created_at', 'timestamp')
+    ]),
+    ('calendars', Calendar, [
+        ('id', 'int64'), ('calendar_code', 'string'), ('calendar_name', 'string'), ('description', 'string'),
+        ('created_at', 'timestamp'), ('user_id', 'int64')
+    ]),
+    ('schedules', Schedule, [
+        ('id', 'int64'), ('schedule_id', 'string'), ('title', 'string'), ('description', 'string'),
+        ('date_info', 'date'), ('start_time', 'time'), ('end_time', 'time'),
+        ('location_data', 'json'), ('participants_data', 'json'), ('estimated_cost', 'int64'), ('tags', 'json'),
+        ('importance', 'int64'), ('notes', 'string'), ('recurring', 'dictionary'), ('calendar_id', 'int64'),
+        ('exercise_plan', 'json'), ('health_goals', 'json'), ('family_activities', 'json'), ('meeting_agenda', 'json'),
+        ('attendees', 'json'), ('preparation_items', 'json'), ('medical_info', 'json')
+    ]),
+]
+
+def snapshot_array_bytes(typecode, values):
+    """정수 목록 → little-endian 바이트"""
+    values = array(typecode, values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tobytes()
+
+def snapshot_bytes_array(typecode, data):
+    """little-endian 바이트 → 정수 array"""
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+def encode_snapshot_strings(values):
+    """문자열 목록 → [오프셋 int32, UTF-8 데이터] 버퍼"""
+    encoded = [value.encode('utf-8') if value is not None else b'' for value in values]
+    return [snapshot_array_bytes('i', itertools.accumulate(map(len, encoded), initial=0)), b''.join(encoded)]
+
+def encode_snapshot_column(values, column_type, dictionary):
+    """블록 하나의 컬럼 값 → (validity 여부, 버퍼 목록, 새 사전 항목 수)"""
+    buffers = []
+    validity = any(value is None for value in values)
+    if validity:
+        bitmap = bytearray((len(values) + 7) // 8)
+        for i, value in enumerate(values):
+            if value is not None:
+                bitmap[i >> 3] |= 1 << (i & 7)
+        buffers.append(bytes(bitmap))
+    
+    new_entries = []
+    if column_type == 'int64':
+        buffers.append(snapshot_array_bytes('q', (value or 0 for value in values)))
+    elif column_type == 'date':
+        buffers.append(snapshot_array_bytes('i', (value.toordinal() - SNAPSHOT_EPOCH_ORDINAL if value else 0 for value in values)))
+    elif column_type == 'time':
+        buffers.append(snapshot_array_bytes('i', (value.hour * 3600 + value.minute * 60 + value.second if value else 0 for value in values)))
+    elif column_type == 'timestamp':
+        buffers.append(snapshot_array_bytes('q', (int((value - SNAPSHOT_EPOCH).total_seconds()) if value else 0 for value in values)))
+    elif column_type == 'string':
+        buffers.extend(encode_snapshot_strings(values))
+    else:
+        indices = []
+        for value in values:
+            if value is None:
+                indices.append(0)
+                continue
+            index = dictionary.get(value)
+            if index is None:
+                index = dictionary[value] = len(dictionary)
+                new_entries.append(value)
+            indices.append(index)
+        buffers.append(snapshot_array_bytes('i', indices))
+        buffers.extend(encode_snapshot_strings(new_entries))
+    return validity, buffers, len(new_entries)
+
+def encode_snapshot_block(header, buffers=()):
+    header = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return struct.pack('<I', len(header)) + header + b''.join(buffers)
+
+def iter_columnar_export(chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    users → calendars → schedules를 청크(chunk_size행)마다 컬럼형 블록으로 생성
+    - 필요한 컬럼만 Core select + yield_per로 조회 (메모리 사용량 일정)
+    - JSON 컬럼은 역직렬화하지 않고 저장된 텍스트 그대로 블록별 사전 인코딩
+    """
+    yield SNAPSHOT_MAGIC + encode_snapshot_block({
+        'format': 'calsnap',
+        'version': 1,
+        'timestamp': datetime.utcnow().isoformat(),
+        'tables': [
+            {'name': table_name, 'columns': [{'name': name, 'type': column_type} for name, column_type in columns]}
+            for table_name, _, columns in SNAPSHOT_TABLES
+        ]
+    })
+    
+    counts = {}
+    for table_name, model, columns in SNAPSHOT_TABLES:
+        table = model.__table__
+        selected = [
+            db.type_coerce(table.c[name], db.Text) if column_type == 'json' else table.c[name]
+            for name, column_type in columns
+        ]
+        dictionaries = {name: {} for name, _ in columns}
+        counts[table_name] = 0
+        stmt = db.select(*selected).order_by(table.c.id).execution_options(yield_per=chunk_size)
+        for rows in db.session.execute(stmt).partitions():
+            header_columns = []
+            buffers = []
+            for (name, column_type), values in zip(columns, zip(*rows)):
+                dictionary = dictionaries[name]
+                reset = column_type == 'json' or len(dictionary) >= SNAPSHOT_DICTIONARY_MAX_ENTRIES
+                if reset:
+                    dictionary.clear()
+                validity, column_buffers, new_entries = encode_snapshot_column(values, column_type, dictionary)
+                header_columns.append({
+                    'name': name,
+                    'validity': validity,
+                    'buffers': [len(buffer) for buffer in column_buffers],
+                    'dictionary': new_entries,
+                    'reset': reset
+                })
+                buffers.extend(column_buffers)
+            yield encode_snapshot_block({'table': table_name, 'rows': len(rows), 'columns': header_columns}, buffers)
+            counts[table_name] += len(rows)
+        print(f"📤 컬럼형 스냅샷 내보내기: {table_name} {counts[table_name]}건")
+    
+    yield encode_snapshot_block({'statistics': counts})
+
+def decode_snapshot_strings(offsets, data):
+    offsets = snapshot_bytes_array('i', offsets)
+    return [data[start:end].decode('utf-8') for start, end in zip(offsets, offsets[1:])]
+
+def read_columnar_snapshot(stream):
+    """
+    컬럼형 스냅샷 읽기 → ({테이블: {컬럼: 값 목록}}, 통계)
+    (분석 쪽 참고 구현 - 날짜/시간은 date/time/datetime, json 컬럼은 JSON 텍스트 문자열로 반환)
+    """
+    if stream.read(len(SNAPSHOT_MAGIC)) != SNAPSHOT_MAGIC:
+        raise ValueError('컬럼형 스냅샷 파일이 아닙니다.')
+    
+    def read_header():
+        size = struct.unpack('<I', stream.read(4))[0]
+        return json.loads(stream.read(size))
+    
+    schema = read_header()
+    column_types = {table['name']: {column['name']: column['type'] for column in table['columns']} for table in schema['tables']}
+    tables = {table['name']: {column['name']: [] for column in table['columns']} for table in schema['tables']}
+    dictionaries = defaultdict(list)
+    
+    while True:
+        header = read_header()
+        if 'statistics' in header:
+            return tables, header['statistics']
+        table_name, rows = header['table'], header['rows']
+        for column in header['columns']:
+            name, column_type = column['name'], column_types[table_name][column['name']]
+            buffers = [stream.read(size) for size in column['buffers']]
+            validity = buffers.pop(0) if column['validity'] else None
+            if column_type in ('int64', 'date', 'time', 'timestamp'):
+                values = snapshot_bytes_array('q' if column_type in ('int64', 'timestamp') else 'i', buffers[0])
+                if column_type == 'date':
+                    values = [date.fromordinal(SNAPSHOT_EPOCH_ORDINAL + value) for value in values]
+                elif column_type == 'time':
+                    values = [time(value // 3600, value // 60 % 60, value % 60) for value in values]
+                elif column_type == 'timestamp':
+                    values = [SNAPSHOT_EPOCH + timedelta(seconds=value) for value in values]
+                else:
+                    values = values.tolist()
+            elif column_type == 'string':
+                values = decode_snapshot_strings(*buffers)
+            else:
+                dictionary = dictionaries[(table_name, name)]
+                if column.get('reset'):
+                    dictionary.clear()
+                dictionary.extend(decode_snapshot_strings(*buffers[1:]))
+                values = snapshot_bytes_array('i', buffers[0])
+                if validity is None:
+                    values = [dictionary[index] for index in values]
+            if validity is not None:
+                # null 행은 None (사전 컬럼은 null 행의 인덱스 0이 사전에 없을 수 있으므로 값이 있는 행만 조회)
+                lookup = dictionary.__getitem__ if column_type in ('dictionary', 'json') else None
+                values = [
+                    (lookup(value) if lookup else value) if validity[i >> 3] >> (i & 7) & 1 else None
+                    for i, value in enumerate(values)
+                ]
+            tables[table_name][name].extend(values)
+
 # JSON 데이터 출력 API - 메인 엔드포인트
 @app.route('/json-data', methods=['GET'])
+@compress_response
 def get_json_data():
     print("\n=== 🌐 JSON 데이터 요청 시작 ===")
+    if request.args.get('format') == 'ndjson':
+        print("📤 NDJSON 스트리밍 모드")
+        return Response(stream_with_context(iter_ndjson_export()), mimetype='application/x-ndjson')
+    if request.args.get('format') == 'columnar':
+        print("📤 컬럼형 스냅샷 스트리밍 모드")
+        return Response(
+            stream_with_context(iter_columnar_export()),
+            mimetype='application/vnd.calendar-snapshot',
+            headers={'Content-Disposition': 'attachment; filename="calendar-snapshot.calsnap"'}
+        )
+    
     try:
         print("1️⃣ 데이터베이스 연결 테스트...")
         # SQLAlchemy를 사용한 연결 확인
@@ -198,107 +1535,32 @@ def get_json_data():
         print(f"6️⃣ 찾은 캘린더 수: {len(calendars)}")
         
         print("7️⃣ 모든 일정 조회 중...")
-        schedules = Schedule.query.all()
+        schedules = Schedule.query.options(db.undefer_group('extras')).all()
         print(f"8️⃣ 찾은 일정 수: {len(schedules)}")
         
         # 사용자 데이터 변환
         users_data = []
         for user in users:
-            user_data = {
-                'id': user.id,
-                'user_id': user.user_id,
-                'name': user.name,
-                'email': user.email,
-                'user_type': user.user_type,
-                'phone': user.phone,
-                'profile': user.profile,
-                'created_at': user.created_at.isoformat() if user.created_at else None
-            }
-            users_data.append(user_data)
+            users_data.append(user.to_export_dict())
             print(f"9️⃣ 사용자 추가: {user.name} ({user.user_id})")
         
         # 캘린더 데이터 변환
         calendars_data = []
         for calendar in calendars:
-            calendar_data = {
-                'id': calendar.id,
-                'calendar_code': calendar.calendar_code,
-                'calendar_name': calendar.calendar_name,
-                'description': calendar.description,
-                'created_at': calendar.created_at.isoformat() if calendar.created_at else None,
-                'user_id': calendar.user_id
-            }
-            calendars_data.append(calendar_data)
+            calendars_data.append(calendar.to_export_dict())
             print(f"🔟 캘린더 추가: {calendar.calendar_name} ({calendar.calendar_code})")
         
         # 일정 데이터 변환
         schedules_data = []
         for schedule in schedules:
-            # 날짜와 시간을 결합하여 완전한 datetime 생성
-            start_datetime = datetime.combine(schedule.date_info, schedule.start_time)
-            end_datetime = datetime.combine(schedule.date_info, schedule.end_time)
-            
-            # location_data와 participants_data 안전하게 처리
-            location_str = ""
-            if schedule.location_data:
-                if isinstance(schedule.location_data, dict):
-                    location_str = schedule.location_data.get('name', '')
-                else:
-                    location_str = str(schedule.location_data)
-            
-            participants_list = []
-            if schedule.participants_data:
-                if isinstance(schedule.participants_data, list):
-                    participants_list = schedule.participants_data
-                else:
-                    participants_list = [str(schedule.participants_data)]
-            
-            schedule_data = {
-                'id': schedule.id,
-                'schedule_id': schedule.schedule_id,
-                'title': schedule.title,
-                'description': schedule.description,
-                'date_info': schedule.date_info.isoformat(),
-                'start_time': schedule.start_time.strftime('%H:%M'),
-                'end_time': schedule.end_time.strftime('%H:%M'),
-                'start_datetime': start_datetime.isoformat(),
-                'end_datetime': end_datetime.isoformat(),
-                'location_data': schedule.location_data,
-                'location_str': location_str,
-                'participants_data': schedule.participants_data,
-                'participants_list': participants_list,
-                'estimated_cost': schedule.estimated_cost,
-                'tags': schedule.tags,
-                'importance': schedule.importance,
-                'notes': schedule.notes,
-                'recurring': schedule.recurring,
-                'calendar_id': schedule.calendar_id,
-                # 추가 JSON 필드들
-                'exercise_plan': schedule.exercise_plan,
-                'health_goals': schedule.health_goals,
-                'family_activities': schedule.family_activities,
-                'meeting_agenda': schedule.meeting_agenda,
-                'attendees': schedule.attendees,
-                'preparation_items': schedule.preparation_items,
-                'medical_info': schedule.medical_info
-            }
-            schedules_data.append(schedule_data)
+            schedules_data.append(schedule.to_export_dict())
             print(f"1️⃣1️⃣ 일정 추가: {schedule.title} ({schedule.schedule_id})")
         
         # 데이터베이스 통계 계산
         print("1️⃣2️⃣ 통계 계산 중...")
         
-        # 사용자별 캘린더 수 계산
-        user_calendar_stats = {}
-        for user in users:
-            calendar_count = Calendar.query.filter_by(user_id=user.id).count()
-            user_calendar_stats[user.user_id] = calendar_count
-        
-        # 캘린더별 일정 수 계산
-        calendar_schedule_stats = {}
-        for calendar in calendars:
-            schedule_count = Schedule.query.filter_by(calendar_id=calendar.id).count()
-            calendar_schedule_stats[calendar.calendar_code] = schedule_count
+        # 사용자별 캘린더 수 / 캘린더별 일정 수 계산 (GROUP BY 쿼리 2개)
+        user_calendar_stats, calendar_schedule_stats = compute_relationship_stats()
         
         # 최종 JSON 데이터 구성
         json_data = {
@@ -356,21 +1618,28 @@ def get_json_data():
         
         return jsonify(error_data), 500
 
+@app.cli.command('export-snapshot')
+@click.argument('path', type=click.Path(dir_okay=False, writable=True))
+def export_snapshot_command(path):
+    """flask export-snapshot PATH - 사용자/캘린더/일정 컬럼형 스냅샷 파일 생성"""
+    with open(path, 'wb') as f:
+        for block in iter_columnar_export():
+            f.write(block)
+    print(f"✅ 스냅샷 저장 완료: {path}")
+
 # 간단한 JSON 요약 데이터 (기존 코드와 호환)
 @app.route('/json-summary', methods=['GET'])
 def get_json_summary():
     print("\n=== 📊 JSON 요약 데이터 요청 ===")
     try:
-        print("1️⃣ 데이터베이스 연결 확인...")
-        db.session.execute(text('SELECT 1'))
-        print("2️⃣ 연결 성공")
-        
-        # 간단한 통계 조회
-        users_count = User.query.count()
-        calendars_count = Calendar.query.count()
-        schedules_count = Schedule.query.count()
+        # 간단한 통계 조회 (카운터 테이블 조회 1회 - 연결 확인 겸용)
+        print("1️⃣ 카운터 조회 중...")
+        counts = get_table_counts()
+        users_count = counts['users']
+        calendars_count = counts['calendars']
+        schedules_count = counts['schedules']
         
-        print(f"3️⃣ 통계 조회 완료: 사용자 {users_count}명, 캘린더 {calendars_count}개, 일정 {schedules_count}개")
+        print(f"2️⃣ 통계 조회 완료: 사용자 {users_count}명, 캘린더 {calendars_count}개, 일정 {schedules_count}개")
         
         summary_data = {
             'success': True,
@@ -397,13 +1666,49 @@ def get_json_summary():
             'error': str(e)
         }), 500
 
-# 사용자별 상세 JSON 데이터 조회
-@app.route('/json-data/users/<user_id>', methods=['GET'])
-def get_user_json_data(user_id):
-    print(f"\n=== 👤 사용자별 JSON 데이터 요청: {user_id} ===")
+# 통계만 조회 (대시보드용 - 전체 데이터 덤프 없이)
+@app.route('/json-data/stats', methods=['GET'])
+def get_json_stats():
+    print("\n=== 📊 JSON 통계 데이터 요청 ===")
     try:
-        print("1️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
+        user_calendar_stats, calendar_schedule_stats = compute_relationship_stats()
+        
+        total_users = len(user_calendar_stats)
+        total_calendars = len(calendar_schedule_stats)
+        total_schedules = sum(calendar_schedule_stats.values())
+        
+        print(f"✅ 통계 계산 완료: 사용자 {total_users}명, 캘린더 {total_calendars}개, 일정 {total_schedules}개")
+        
+        return jsonify({
+            'success': True,
+            'timestamp': datetime.utcnow().isoformat(),
+            'statistics': {
+                'total_users': total_users,
+                'total_calendars': total_calendars,
+                'total_schedules': total_schedules,
+                'user_calendar_stats': user_calendar_stats,
+                'calendar_schedule_stats': calendar_schedule_stats,
+                'avg_calendars_per_user': total_calendars / total_users if total_users > 0 else 0,
+                'avg_schedules_per_calendar': total_schedules / total_calendars if total_calendars > 0 else 0
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ 통계 데이터 조회 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '통계 데이터 조회 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 사용자별 상세 JSON 데이터 조회
+@app.route('/json-data/users/<user_id>', methods=['GET'])
+@compress_response
+def get_user_json_data(user_id):
+    print(f"\n=== 👤 사용자별 JSON 데이터 요청: {user_id} ===")
+    try:
+        print("1️⃣ 사용자 검색 중...")
+        user = User.query.filter_by(user_id=user_id).first()
         
         if not user:
             print("❌ 사용자 없음")
@@ -491,6 +1796,21 @@ def api_status():
         
         return jsonify(error_response), 500
 
+# 캐시/비밀번호 해시 풀 통계 (크기 조정용)
+@app.route('/api/cache/stats', methods=['GET'])
+@login_required
+def get_cache_stats():
+    print("\n=== 📦 응답 캐시 통계 조회 ===")
+    return jsonify({
+        'success': True,
+        'data': {
+            'schedule_response_cache': schedule_response_cache.stats(),
+            'auth_user_cache': auth_user_cache.stats(),
+            'analytics_cache': analytics_cache.stats(),
+            'password_hasher': password_hasher.stats()
+        }
+    }), 200
+
 # 로그인 API (프론트엔드용)
 @app.route('/api/auth/login', methods=['POST'])
 def auth_login():
@@ -514,8 +1834,14 @@ def auth_login():
             print(f"7️⃣ 비밀번호 확인 결과: {password_check}")
             
             if password_check:
+                # 해시 방식이 바뀌었으면 로그인 성공 시 새 방식으로 재해시 (별도 마이그레이션 불필요)
+                if user.password_needs_rehash():
+                    print("🔄 비밀번호 재해시 중...")
+                    user.set_password(password)
+                    db.session.commit()
+                
                 print("8️⃣ 토큰 생성 중...")
-                token = f"token_{user.user_id}_{datetime.utcnow().timestamp()}"
+                token = issue_auth_token(user.user_id)
                 print(f"9️⃣ 생성된 토큰: {token}")
                 
                 response_data = {
@@ -544,6 +1870,11 @@ def auth_login():
         }
         print(f"❌ 실패 응답: {error_response}")
         return jsonify(error_response), 401
+    
+    except PasswordHasherBusy as e:
+        print(f"❌ 비밀번호 처리 대기열 초과: {e}")
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 503, {'Retry-After': '1'}
             
     except Exception as e:
         print(f"❌ 로그인 처리 중 오류: {e}")
@@ -636,6 +1967,11 @@ def create_user():
         }
         print(f"🔟 성공 응답: {response_data}")
         return jsonify(response_data), 201
+    
+    except PasswordHasherBusy as e:
+        print(f"❌ 비밀번호 처리 대기열 초과: {e}")
+        db.session.rollback()
+        return jsonify({'success': False, 'error': str(e)}), 503, {'Retry-After': '1'}
         
     except Exception as e:
         print(f"❌ 회원가입 처리 중 오류: {e}")
@@ -688,294 +2024,1448 @@ def auth_logout():
         'message': '로그아웃 성공'
     }), 200
 
+# 프론트엔드용 캘린더 항목 변환 (camelCase 키 함께 제공)
+def build_calendar_item(calendar):
+    return {
+        'calendar_id': calendar.calendar_code,
+        'calendarId': calendar.calendar_code,
+        'calendar_name': calendar.calendar_name,
+        'calendarName': calendar.calendar_name,
+        'description': calendar.description,
+        'created_at': calendar.created_at.isoformat() if calendar.created_at else None
+    }
+
+# 응답 필드 → 필요한 Schedule 컬럼 (fields= 파라미터로 요청한 컬럼만 조회)
+SCHEDULE_ITEM_COLUMNS = {
+    'id': ['schedule_id'],
+    'title': ['title'],
+    'description': ['description'],
+    'start_time': ['date_info', 'start_time'],
+    'startTime': ['date_info', 'start_time'],
+    'end_time': ['date_info', 'end_time'],
+    'endTime': ['date_info', 'end_time'],
+    'location': ['location_data'],
+    'color': [],
+    'notification': [],
+    'importance': ['importance'],
+    'participants': ['participants_data'],
+    'notes': ['notes'],
+    'tags': ['tags'],
+    'recurring': ['recurring'],
+    'is_my_schedule': [],
+    'owner_name': [],
+    'owner_id': []
+}
+
+USER_SCHEDULE_ITEM_COLUMNS = {
+    'schedule_id': ['schedule_id'],
+    'title': ['title'],
+    'description': ['description'],
+    'date_info': ['date_info'],
+    'start_time': ['start_time'],
+    'end_time': ['end_time'],
+    'start_datetime': ['date_info', 'start_time'],
+    'end_datetime': ['date_info', 'end_time'],
+    'location': ['location_data'],
+    'participants': ['participants_data'],
+    'estimated_cost': ['estimated_cost'],
+    'tags': ['tags'],
+    'importance': ['importance'],
+    'notes': ['notes'],
+    'recurring': ['recurring'],
+    'calendar_name': [],
+    'calendar_code': [],
+    'owner_name': [],
+    'owner_id': [],
+    'is_my_schedule': []
+}
+
+def parse_fields(args, allowed):
+    """
+    fields 파라미터 파싱 (예: ?fields=id,title,startTime)
+    없으면 None(전체 필드), 허용되지 않은 필드가 있으면 ValueError 발생
+    """
+    fields = args.get('fields')
+    if not fields:
+        return None
+    
+    fields = {field.strip() for field in fields.split(',') if field.strip()}
+    unknown = fields - set(allowed)
+    if unknown:
+        raise ValueError(f"알 수 없는 필드: {', '.join(sorted(unknown))}")
+    return fields
+
+def schedule_load_only(fields, column_map, *always):
+    """요청 필드에 필요한 Schedule 컬럼만 조회하는 로더 옵션 (fields가 None이면 기본 컬럼 전체)"""
+    if fields is None:
+        return []
+    
+    columns = {'id', 'calendar_id', *always}
+    for field in fields:
+        columns.update(column_map[field])
+    return [db.load_only(*[getattr(Schedule, column) for column in sorted(columns)])]
+
+# 프론트엔드용 일정 항목 변환 (기존 JSON 구조와 호환, 반복 일정은 occurrence_date 날짜로 표시)
+def build_schedule_item(schedule, calendar_owner, is_my_schedule, fields=None, occurrence_date=None):
+    def wanted(*keys):
+        return fields is None or any(key in fields for key in keys)
+    
+    day = occurrence_date or schedule.date_info
+    item = {}
+    if wanted('id'):
+        item['id'] = schedule.schedule_id
+    if wanted('title'):
+        item['title'] = schedule.title
+    if wanted('description'):
+        item['description'] = schedule.description
+    if wanted('start_time', 'startTime'):
+        start_datetime = datetime.combine(day, schedule.start_time)
+        item['start_time'] = start_datetime.isoformat()
+        item['startTime'] = start_datetime.isoformat()
+    if wanted('end_time', 'endTime'):
+        end_datetime = datetime.combine(day, schedule.end_time)
+        item['end_time'] = end_datetime.isoformat()
+        item['endTime'] = end_datetime.isoformat()
+    
+    if wanted('location'):
+        location_str = ""
+        if schedule.location_data:
+            if isinstance(schedule.location_data, dict):
+                location_str = schedule.location_data.get('name', '')
+            else:
+                location_str = str(schedule.location_data)
+        item['location'] = location_str
+    
+    item['color'] = '#667eea' if is_my_schedule else '#10b981'  # 내 일정 파란색, 다른 사람 초록색
+    item['notification'] = True
+    if wanted('importance'):
+        item['importance'] = schedule.importance
+    
+    if wanted('participants'):
+        participants_str = ""
+        if schedule.participants_data:
+            if isinstance(schedule.participants_data, list):
+                participants_str = ", ".join([p.get('name', '') for p in schedule.participants_data if isinstance(p, dict)])
+            else:
+                participants_str = str(schedule.participants_data)
+        item['participants'] = participants_str
+    
+    if wanted('notes'):
+        item['notes'] = schedule.notes
+    if wanted('tags'):
+        item['tags'] = schedule.tags
+    if wanted('recurring'):
+        item['recurring'] = schedule.recurring
+    item['is_my_schedule'] = is_my_schedule
+    item['owner_name'] = calendar_owner.name if calendar_owner else 'Unknown'
+    item['owner_id'] = calendar_owner.user_id if calendar_owner else 'Unknown'
+    
+    if fields is not None:
+        item = {key: value for key, value in item.items() if key in fields}
+    return item
+
+# 사용자별 일정 조회용 항목 변환 (소유자/캘린더 정보 포함)
+def build_user_schedule_item(schedule, calendar, owner, viewer, fields=None, occurrence_date=None):
+    def wanted(*keys):
+        return fields is None or any(key in fields for key in keys)
+    
+    day = occurrence_date or schedule.date_info
+    item = {}
+    if wanted('schedule_id'):
+        item['schedule_id'] = schedule.schedule_id
+    if wanted('title'):
+        item['title'] = schedule.title
+    if wanted('description'):
+        item['description'] = schedule.description
+    if wanted('date_info'):
+        item['date_info'] = day.isoformat()
+    if wanted('start_time'):
+        item['start_time'] = schedule.start_time.strftime('%H:%M')
+    if wanted('end_time'):
+        item['end_time'] = schedule.end_time.strftime('%H:%M')
+    if wanted('start_datetime'):
+        item['start_datetime'] = datetime.combine(day, schedule.start_time).isoformat()
+    if wanted('end_datetime'):
+        item['end_datetime'] = datetime.combine(day, schedule.end_time).isoformat()
+    if wanted('location'):
+        item['location'] = schedule.location_data
+    if wanted('participants'):
+        item['participants'] = schedule.participants_data
+    if wanted('estimated_cost'):
+        item['estimated_cost'] = schedule.estimated_cost
+    if wanted('tags'):
+        item['tags'] = schedule.tags
+    if wanted('importance'):
+        item['importance'] = schedule.importance
+    if wanted('notes'):
+        item['notes'] = schedule.notes
+    if wanted('recurring'):
+        item['recurring'] = schedule.recurring
+    
+    item['calendar_name'] = calendar.calendar_name
+    item['calendar_code'] = calendar.calendar_code
+    item['owner_name'] = owner.name  # 소유자 정보 추가
+    item['owner_id'] = owner.user_id
+    item['is_my_schedule'] = calendar.user_id == viewer.id  # 내 일정인지 표시
+    
+    if fields is not None:
+        item = {key: value for key, value in item.items() if key in fields}
+    return item
+
 # 캘린더 목록 조회 (프론트엔드용) - 수정된 토큰 파싱
 @app.route('/api/calendars', methods=['GET'])
+@login_required
 def get_calendars():
     print("\n=== 📅 캘린더 목록 조회 시작 ===")
     try:
-        print("1️⃣ 인증 헤더 확인 중...")
-        auth_header = request.headers.get('Authorization')
-        print(f"2️⃣ 인증 헤더: {auth_header}")
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
         
-        if not auth_header:
-            print("❌ 인증 헤더 없음")
-            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
+        print("2️⃣ 캘린더 검색 중...")
+        calendars = Calendar.query.filter_by(user_id=user.id).all()
+        print(f"3️⃣ 찾은 캘린더 수: {len(calendars)}")
         
-        print("3️⃣ 토큰 파싱 중...")
-        token = auth_header.replace('Bearer ', '')
-        print(f"4️⃣ 원본 토큰: {token}")
+        calendar_list = []
+        for calendar in calendars:
+            calendar_data = build_calendar_item(calendar)
+            calendar_list.append(calendar_data)
+            print(f"4️⃣ 캘린더 추가: {calendar_data}")
         
-        # 개선된 토큰 파싱
-        user_id = extract_user_id_from_token(token)
-        print(f"5️⃣ 추출된 사용자 ID: {user_id}")
+        # 캘린더 목록 내용 기반 ETag
+        etag = make_etag('calendars', user.id, calendar_list)
+        cached = not_modified(etag)
+        if cached:
+            return cached
         
-        if not user_id:
-            print("❌ 토큰에서 사용자 ID 추출 실패")
-            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
+        response_data = {
+            'success': True,
+            'data': {
+                'calendars': calendar_list
+            }
+        }
+        print(f"✅ 최종 응답: {response_data}")
+        return set_etag_headers(jsonify(response_data), etag), 200
         
-        print("6️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
-        print(f"7️⃣ 사용자 검색 결과: {user}")
+    except Exception as e:
+        print(f"❌ 캘린더 조회 오류: {e}")
+        print(f"❌ 오류 상세: {repr(e)}")
+        return jsonify({
+            'success': False,
+            'message': '캘린더 조회 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 전체 일정 보기 초기 로드 (프론트엔드 ALL_CALENDARS용) - 캘린더 목록 + 기간 내 일정을 한 번에
+@app.route('/api/bootstrap', methods=['GET'])
+@login_required
+def get_bootstrap():
+    print("\n=== 🚀 부트스트랩 조회 시작 ===")
+    try:
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
+        
+        try:
+            date_from, date_to = parse_date_window(request.args)
+        except ValueError as e:
+            print(f"❌ 조회 기간 파싱 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 기간 형식이 올바르지 않습니다. (YYYY-MM-DD)', 'error': str(e)}), 400
+        
+        try:
+            fields = parse_fields(request.args, SCHEDULE_ITEM_COLUMNS)
+            tags = parse_tags(request.args)
+        except ValueError as e:
+            print(f"❌ 필드 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '요청 필드가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        # 캘린더 ⟕ 일정 단일 조인 쿼리 (기간 조건은 ON 절에 - 일정 없는 캘린더도 포함)
+        print(f"2️⃣ 캘린더 + 일정 조회 중... ({date_from} ~ {date_to})")
+        join_condition = Schedule.calendar_id == Calendar.id
+        window_condition = Schedule.window_condition(date_from, date_to)
+        if window_condition is not None:
+            join_condition = db.and_(join_condition, window_condition)
+        for tag in tags:
+            join_condition = db.and_(join_condition, Schedule.id.in_(
+                db.select(ScheduleTag.schedule_id).where(ScheduleTag.tag == tag, ScheduleTag.calendar_id == Calendar.id)
+            ))
+        
+        rows = db.session.query(Calendar, Schedule) \
+            .outerjoin(Schedule, join_condition) \
+            .filter(Calendar.user_id == user.id) \
+            .options(*schedule_load_only(fields, SCHEDULE_ITEM_COLUMNS, 'date_info', 'start_time', 'recurring', 'recurrence_until')) \
+            .order_by(Calendar.id, Schedule.date_info, Schedule.start_time) \
+            .all()
         
-        if not user:
-            print("❌ 사용자 없음")
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
+        calendar_list = []
+        calendar_codes = {}
+        schedules = []
+        for calendar, schedule in rows:
+            if calendar.id not in calendar_codes:
+                calendar_codes[calendar.id] = calendar.calendar_code
+                calendar_list.append(build_calendar_item(calendar))
+            if schedule is not None:
+                schedules.append(schedule)
+        
+        # 반복 일정은 기간 내 발생 날짜로 펼친 뒤 캘린더/날짜/시간 순 정렬
+        occurrences = expand_schedule_occurrences(schedules, date_from, date_to)
+        occurrences.sort(key=lambda occurrence: (occurrence[0].calendar_id, occurrence[1], occurrence[0].start_time))
+        schedule_list = []
+        for schedule, day in occurrences:
+            schedule_data = build_schedule_item(schedule, user, True, fields, day)
+            schedule_data['calendarId'] = calendar_codes[schedule.calendar_id]
+            schedule_list.append(schedule_data)
+        
+        print(f"✅ 부트스트랩 완료: 캘린더 {len(calendar_list)}개, 일정 {len(schedule_list)}개")
+        return jsonify({
+            'success': True,
+            'data': {
+                'calendars': calendar_list,
+                'schedules': schedule_list,
+                'from': date_from.isoformat() if date_from else None,
+                'to': date_to.isoformat() if date_to else None
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ 부트스트랩 조회 오류: {e}")
+        print(f"❌ 오류 상세: {repr(e)}")
+        return jsonify({
+            'success': False,
+            'message': '부트스트랩 조회 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 캘린더 생성 API (프론트엔드용)
+@app.route('/api/calendars', methods=['POST'])
+@login_required
+def create_calendar():
+    print("\n=== 📅 캘린더 생성 시작 ===")
+    try:
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
+        
+        print("2️⃣ 요청 데이터 파싱 중...")
+        data = request.get_json()
+        print(f"3️⃣ 받은 데이터: {data}")
+        
+        calendar_name = data.get('calendarName', '새 캘린더')
+        description = data.get('description', '')
+        
+        print("4️⃣ 새 캘린더 생성 중...")
+        new_calendar = Calendar(
+            calendar_code=f"{user.user_id}_{datetime.utcnow().timestamp()}",
+            calendar_name=calendar_name,
+            description=description,
+            user_id=user.id
+        )
+        
+        print("5️⃣ 데이터베이스 저장 중...")
+        db.session.add(new_calendar)
+        db.session.commit()
+        print(f"6️⃣ 캘린더 생성 완료: {new_calendar.calendar_code}")
+        
+        response_data = {
+            'success': True,
+            'message': '캘린더가 생성되었습니다.',
+            'data': {
+                'calendar': {
+                    'calendar_id': new_calendar.calendar_code,
+                    'calendar_name': new_calendar.calendar_name,
+                    'description': new_calendar.description,
+                    'created_at': new_calendar.created_at.isoformat()
+                }
+            }
+        }
+        print(f"✅ 최종 응답: {response_data}")
+        return jsonify(response_data), 201
+        
+    except Exception as e:
+        print(f"❌ 캘린더 생성 오류: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '캘린더 생성 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 일정 목록 조회 (프론트엔드용) - 기존 스키마와 호환, 수정된 토큰 파싱
+@app.route('/api/schedules/<calendar_id>', methods=['GET'])
+@compress_response
+@login_required
+def get_schedules_by_calendar(calendar_id):
+    print(f"\n=== 📝 일정 목록 조회 시작 (캘린더: {calendar_id}) ===")
+    try:
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
+        
+        print("2️⃣ 캘린더 검색 중... (소유자 정보 함께 조회)")
+        calendar = Calendar.query.options(db.joinedload(Calendar.user)).filter_by(calendar_code=calendar_id).first()
+        print(f"3️⃣ 캘린더 검색 결과: {calendar}")
+        
+        if not calendar:
+            print("❌ 캘린더 없음")
+            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
+        
+        # 캘린더 소유자 정보 (모든 일정에 공통이므로 한 번만 조회)
+        calendar_owner = calendar.user
+        
+        # ✅ 내 일정인지 확인하여 색상 구분
+        is_my_schedule = calendar.user_id == user.id
+        
+        # 조회 기간 파라미터 (월간 뷰: ?from=YYYY-MM-DD&to=YYYY-MM-DD)
+        try:
+            date_from, date_to = parse_date_window(request.args)
+        except ValueError as e:
+            print(f"❌ 조회 기간 파싱 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 기간 형식이 올바르지 않습니다. (YYYY-MM-DD)', 'error': str(e)}), 400
+        print(f"4️⃣ 조회 기간: {date_from} ~ {date_to}")
+        
+        # 응답 필드 선택 (?fields=id,title,startTime) - 필요한 컬럼만 조회
+        try:
+            fields = parse_fields(request.args, SCHEDULE_ITEM_COLUMNS)
+            tags = parse_tags(request.args)
+        except ValueError as e:
+            print(f"❌ 필드 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '요청 필드가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        # 캘린더 버전 기반 ETag - 변경이 없으면 일정 테이블 조회 없이 304 응답
+        # 종료일(to)이 없으면 반복 일정 펼침 기간이 오늘 날짜에 따라 달라지므로 펼침 마지막 날짜도 포함
+        etag = make_etag('calendar-schedules', calendar.id, calendar.version, user.id, request.args.to_dict(flat=False),
+                         (date_to or get_recurrence_horizon(date_from)).isoformat())
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        # 응답 캐시 확인 (ETag에 캘린더 버전 + 조회 사용자 + 파라미터가 포함되어 있으므로 키로 사용)
+        cache_key = (calendar.id, etag)
+        g.response_cache = (calendar.id, cache_key)
+        cached_body = schedule_response_cache.get(cache_key)
+        if cached_body is not None:
+            print("⚡ 응답 캐시 적중")
+            response = app.response_class(cached_body, mimetype='application/json')
+            return set_etag_headers(response, etag), 200
+        
+        # ✅ 수정: 캘린더 소유자 확인 제거 - 모든 캘린더의 일정을 볼 수 있도록
+        print("4️⃣ 일정 검색 중... (모든 일정 표시)")
+        query = Schedule.query.filter_by(calendar_id=calendar.id) \
+            .options(*schedule_load_only(fields, SCHEDULE_ITEM_COLUMNS, 'date_info', 'start_time', 'recurring', 'recurrence_until'))
+        query = Schedule.in_window(query, date_from, date_to)
+        query = filter_by_tags(query, tags, calendar.id)
+        schedules = query.order_by(Schedule.date_info, Schedule.start_time).all()
+        
+        # 반복 일정은 한 행으로 저장 - 기간 내 발생 날짜로 펼쳐서 날짜/시간 순 정렬
+        occurrences = expand_schedule_occurrences(schedules, date_from, date_to)
+        occurrences.sort(key=lambda occurrence: (occurrence[1], occurrence[0].start_time))
+        print(f"5️⃣ 찾은 일정 수: {len(schedules)} (반복 일정 펼친 후 {len(occurrences)}개)")
+        
+        schedule_list = []
+        for schedule, day in occurrences:
+            schedule_data = build_schedule_item(schedule, calendar_owner, is_my_schedule, fields, day)
+            schedule_list.append(schedule_data)
+            print(f"6️⃣ 일정 추가: {schedule_data}")
+        
+        response_data = {
+            'success': True,
+            'data': {
+                'schedules': schedule_list,
+                'from': date_from.isoformat() if date_from else None,
+                'to': date_to.isoformat() if date_to else None
+            }
+        }
+        print(f"✅ 최종 응답: {response_data}")
+        response = jsonify(response_data)
+        schedule_response_cache.set(calendar.id, cache_key, response.get_data())
+        return set_etag_headers(response, etag), 200
+        
+    except Exception as e:
+        print(f"❌ 일정 조회 오류: {e}")
+        print(f"❌ 오류 상세: {repr(e)}")
+        return jsonify({
+            'success': False,
+            'message': '일정 조회 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# iCalendar(.ics) 구독 피드 헬퍼 함수
+ICS_FEED_COLUMNS = ('schedule_id', 'date_info', 'start_time', 'end_time', 'title', 'description',
+                    'location_data', 'participants_data', 'tags', 'recurring')
+
+def escape_ics_text(value):
+    """TEXT 값 이스케이프 (역슬래시, 세미콜론, 쉼표, 줄바꿈)"""
+    return (str(value).replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,')
+            .replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def fold_ics_line(line):
+    """75바이트 단위 줄 접기 (RFC 5545, UTF-8 멀티바이트 문자는 나누지 않음)"""
+    if len(line.encode('utf-8')) <= 75:
+        return line + '\r\n'
+    parts = []
+    current = ''
+    current_size = 0
+    limit = 75
+    for char in line:
+        char_size = len(char.encode('utf-8'))
+        if current_size + char_size > limit:
+            parts.append(current)
+            current, current_size, limit = '', 0, 74  # 이어지는 줄은 앞의 공백 1바이트 포함
+        current += char
+        current_size += char_size
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+def render_ics_event(schedule, calendar_code, dtstamp, tzid):
+    """
+    Schedule → VEVENT 텍스트
+    시각은 앱 기준 시간대(TZID) 현지 시각으로 출력 - UTC로 바꾸면 RRULE 반복이 일광 절약 시간 전환 때 어긋나므로 TZID 사용
+    """
+    day = schedule.date_info.strftime('%Y%m%d')
+    lines = [
+        'BEGIN:VEVENT',
+        f'UID:{schedule.schedule_id}@{calendar_code}',
+        f'DTSTAMP:{dtstamp}',
+        f'DTSTART;TZID={tzid}:{day}T{schedule.start_time.strftime("%H%M%S")}',
+        f'DTEND;TZID={tzid}:{day}T{schedule.end_time.strftime("%H%M%S")}',
+        f'SUMMARY:{escape_ics_text(schedule.title)}'
+    ]
+    if schedule.description:
+        lines.append(f'DESCRIPTION:{escape_ics_text(schedule.description)}')
+    location = (schedule.location_data or {}).get('name') if isinstance(schedule.location_data, dict) else None
+    if location:
+        lines.append(f'LOCATION:{escape_ics_text(location)}')
+    for participant in schedule.participants_data or []:
+        if isinstance(participant, dict) and participant.get('email'):
+            name = str(participant.get('name') or participant['email']).replace('"', "'")
+            lines.append(f'ATTENDEE;CN="{name}":mailto:{participant["email"]}')
+    if schedule.tags:
+        lines.append('CATEGORIES:' + ','.join(escape_ics_text(tag) for tag in schedule.tags))
+    # 가져온 일정의 RRULE만 그대로 출력 (자유 형식 반복 설명은 제외)
+    if schedule.recurring and schedule.recurring.upper().startswith('FREQ='):
+        lines.append(f'RRULE:{schedule.recurring}')
+    lines.append('END:VEVENT')
+    return ''.join(fold_ics_line(line) for line in lines)
+
+def iter_ics_feed(calendar_id, calendar_code, calendar_name, last_modified):
+    """캘린더 일정을 VCALENDAR 텍스트 조각으로 생성 (yield_per로 일정 청크 단위 조회)"""
+    dtstamp = last_modified.strftime('%Y%m%dT%H%M%SZ')
+    tzid = app.config['CALENDAR_TIMEZONE']
+    yield ''.join(fold_ics_line(line) for line in [
+        'BEGIN:VCALENDAR',
+        'VERSION:2.0',
+        'PRODID:-//Calendar App//Schedule Feed//KO',
+        'CALSCALE:GREGORIAN',
+        f'X-WR-CALNAME:{escape_ics_text(calendar_name)}',
+        f'X-WR-TIMEZONE:{tzid}'
+    ])
+    stmt = db.select(Schedule).filter_by(calendar_id=calendar_id) \
+        .options(db.load_only(*[getattr(Schedule, column) for column in ICS_FEED_COLUMNS])) \
+        .order_by(Schedule.date_info, Schedule.start_time) \
+        .execution_options(yield_per=EXPORT_CHUNK_SIZE)
+    for schedule in db.session.scalars(stmt):
+        yield render_ics_event(schedule, calendar_code, dtstamp, tzid)
+    yield 'END:VCALENDAR\r\n'
+
+# iCalendar(.ics) 구독 피드 API - 캘린더 버전별 캐시 + ETag/Last-Modified
+# 로그인 토큰 대신 캘린더별 구독 비밀 값(?key=)으로만 접근 - 유출되어도 해당 캘린더 읽기만 가능, 재발급으로 폐기
+@app.route('/api/calendars/<calendar_code>.ics', methods=['GET'])
+@compress_response
+def get_calendar_ics_feed(calendar_code):
+    print(f"\n=== 📡 .ics 구독 피드 요청: {calendar_code} ===")
+    try:
+        feed_key = request.args.get('key')
+        if not feed_key:
+            print("❌ 구독 키 없음")
+            return jsonify({'success': False, 'message': '구독 키가 필요합니다.'}), 401
+        
+        calendar = Calendar.query.filter_by(calendar_code=calendar_code).first()
+        # 캘린더 존재 여부가 드러나지 않도록 캘린더 없음/키 불일치/폐기 모두 같은 404 응답
+        if not calendar or not calendar.feed_token or not hmac.compare_digest(calendar.feed_token, feed_key):
+            print("❌ 캘린더 없음 또는 구독 키 불일치")
+            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
+        
+        # 피드는 조회 사용자와 무관하므로 캘린더 버전만으로 ETag/캐시 키 생성
+        etag = make_etag('calendar-ics', calendar.id, calendar.version)
+        last_modified = (calendar.updated_at or calendar.created_at or datetime.utcnow()).replace(microsecond=0)
+        print(f"1️⃣ 캘린더 버전: {calendar.version}, 마지막 변경: {last_modified}")
+        
+        def finish(response):
+            set_etag_headers(response, etag)
+            response.last_modified = last_modified.replace(tzinfo=timezone.utc)
+            return response
+        
+        # 조건부 요청 - 변경 없으면 일정 테이블 조회 없이 304 (If-None-Match 우선)
+        if request.if_none_match:
+            cached = not_modified(etag)
+            if cached:
+                return finish(cached)
+        elif request.if_modified_since and last_modified.replace(tzinfo=timezone.utc) <= request.if_modified_since:
+            print(f"⚡ 변경 없음 (304): {last_modified}")
+            return finish(app.response_class(status=304))
+        
+        cache_key = ('calendar-ics', calendar.id, calendar.version)
+        cached_body = schedule_response_cache.get(cache_key)
+        if cached_body is not None:
+            print("⚡ 피드 캐시 적중")
+            g.response_cache = (calendar.id, cache_key)
+            return finish(app.response_class(cached_body, mimetype='text/calendar'))
+        
+        # 캐시 없음 - 스트림으로 렌더링하면서 완료되면 캐시에 저장 (중간에 끊기면 저장하지 않음)
+        print("2️⃣ 피드 렌더링 (스트림)")
+        calendar_id = calendar.id
+        feed = iter_ics_feed(calendar_id, calendar.calendar_code, calendar.calendar_name, last_modified)
+        
+        def generate():
+            parts = []
+            for part in feed:
+                encoded = part.encode('utf-8')
+                parts.append(encoded)
+                yield encoded
+            schedule_response_cache.set(calendar_id, cache_key, b''.join(parts))
+            print(f"✅ 피드 렌더링 완료 및 캐시 저장 ({len(parts) - 2}개 일정)")
+        
+        return finish(Response(stream_with_context(generate()), mimetype='text/calendar'))
+        
+    except Exception as e:
+        print(f"❌ .ics 피드 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '.ics 피드 생성 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# .ics 구독 키 발급/재발급(POST) 및 폐기(DELETE) API - 캘린더 소유자만
+# 재발급하면 이전 구독 URL은 즉시 무효화됨
+@app.route('/api/calendars/<calendar_code>/feed-token', methods=['POST', 'DELETE'])
+@login_required
+def manage_calendar_feed_token(calendar_code):
+    print(f"\n=== 🔑 .ics 구독 키 {'폐기' if request.method == 'DELETE' else '발급'}: {calendar_code} ===")
+    try:
+        user = g.current_user
+        calendar = Calendar.query.filter_by(calendar_code=calendar_code).first()
+        if not calendar:
+            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
+        if calendar.user_id != user.id:
+            return jsonify({'success': False, 'message': '캘린더에 접근할 권한이 없습니다.'}), 403
+        
+        if request.method == 'DELETE':
+            calendar.feed_token = None
+            db.session.commit()
+            print("✅ 구독 키 폐기 완료")
+            return jsonify({'success': True, 'message': '구독 키가 폐기되었습니다.'}), 200
+        
+        calendar.feed_token = secrets.token_urlsafe(32)
+        db.session.commit()
+        print("✅ 구독 키 발급 완료")
+        return jsonify({
+            'success': True,
+            'message': '구독 키가 발급되었습니다.',
+            'data': {
+                'feed_token': calendar.feed_token,
+                'feed_url': f"{request.host_url.rstrip('/')}/api/calendars/{calendar.calendar_code}.ics?key={calendar.feed_token}"
+            }
+        }), 201
+        
+    except Exception as e:
+        print(f"❌ 구독 키 처리 오류: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '구독 키 처리 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 일정 충돌(시간 겹침) 확인 헬퍼 함수
+# 예약 UI가 드래그마다 호출하므로 쿼리는 한 번만 만들어 두고 파라미터만 바꿔 실행 (ORM 객체 생성 없음)
+# - 일반 일정: (calendar_id, date_info, start_time) 인덱스 범위 조회
+# - 반복 일정: (calendar_id, recurrence_until) 인덱스 범위 조회 (date_info 조건을 넣으면 과거 전체를
+#   훑는 date_info 범위 조회가 선택될 수 있으므로 제외 - 기간 이후에 시작하는 시리즈는 펼칠 때 제외됨)
+CONFLICT_QUERY = db.select(
+    Schedule.id, Schedule.schedule_id, Schedule.title, Schedule.date_info, Schedule.start_time, Schedule.end_time,
+    Schedule.recurring, Schedule.recurrence_until, Calendar.calendar_code, Calendar.calendar_name
+).join(Calendar, Schedule.calendar_id == Calendar.id).where(
+    Calendar.user_id == db.bindparam('owner_id'),
+    Schedule.schedule_id != db.bindparam('exclude_schedule_id'),
+    db.or_(
+        db.and_(
+            Schedule.recurrence_until.is_(None),
+            Schedule.date_info >= db.bindparam('first_day'),
+            Schedule.date_info <= db.bindparam('last_day'),
+            Schedule.start_time < db.bindparam('end_time'),
+            Schedule.end_time > db.bindparam('start_time')
+        ),
+        Schedule.recurrence_until >= db.bindparam('first_day')
+    )
+)
+
+def find_schedule_conflicts(owner_id, start_datetime, end_datetime, exclude_schedule_id=None):
+    """
+    사용자의 모든 캘린더에서 [start_datetime, end_datetime)과 겹치는 일정 조회
+    일정은 하루 안의 구간이므로 인덱스 범위 조회 1회로 후보를 좁힌 뒤 정확한 겹침 확인
+    반환: [(일정 행, 발생 날짜), ...] (시간 순, 행에 캘린더 코드/이름 포함)
+    """
+    start_datetime = start_datetime.replace(tzinfo=None)
+    end_datetime = end_datetime.replace(tzinfo=None)
+    if end_datetime <= start_datetime:
+        raise ValueError('종료 시간은 시작 시간보다 늦어야 합니다.')
+    first_day, last_day = start_datetime.date(), end_datetime.date()
+    max_days = app.config.get('CONFLICT_MAX_RANGE_DAYS', 31)
+    if (last_day - first_day).days > max_days:
+        raise ValueError(f'충돌 확인 기간은 최대 {max_days}일입니다.')
+    
+    # 여러 날에 걸친 기간이면 시간 조건은 날짜별로 달라지므로 SQL에서는 하루 전체로 조회
+    single_day = first_day == last_day
+    rows = db.session.execute(CONFLICT_QUERY, {
+        'owner_id': owner_id,
+        'exclude_schedule_id': exclude_schedule_id or '',
+        'first_day': first_day,
+        'last_day': last_day,
+        'start_time': start_datetime.time() if single_day else time.min,
+        'end_time': end_datetime.time() if single_day else time.max
+    }).all()
+    
+    conflicts = []
+    for row, day in expand_schedule_occurrences(rows, first_day, last_day):
+        if datetime.combine(day, row.start_time) < end_datetime and datetime.combine(day, row.end_time) > start_datetime:
+            conflicts.append((row, day))
+    conflicts.sort(key=lambda conflict: (conflict[1], conflict[0].start_time))
+    return conflicts
+
+def build_conflict_item(row, day):
+    return {
+        'id': row.schedule_id,
+        'title': row.title,
+        'startTime': datetime.combine(day, row.start_time).isoformat(),
+        'endTime': datetime.combine(day, row.end_time).isoformat(),
+        'calendarId': row.calendar_code,
+        'calendarName': row.calendar_name
+    }
+
+# 일정 충돌 확인 API (예약 UI 드래그용) - ?start=ISO&end=ISO[&exclude=schedule_id]
+@app.route('/api/schedules/conflicts', methods=['GET'])
+@login_required
+def get_schedule_conflicts():
+    print("\n=== 🔍 일정 충돌 확인 ===")
+    try:
+        user = g.current_user
+        try:
+            start_datetime = datetime.fromisoformat(request.args['start'].replace('Z', '+00:00'))
+            end_datetime = datetime.fromisoformat(request.args['end'].replace('Z', '+00:00'))
+            conflicts = find_schedule_conflicts(user.id, start_datetime, end_datetime, request.args.get('exclude'))
+        except (KeyError, ValueError) as e:
+            print(f"❌ 충돌 확인 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 기간이 올바르지 않습니다. (start, end: ISO 형식)', 'error': str(e)}), 400
+        
+        print(f"✅ 겹치는 일정 {len(conflicts)}개 ({user.user_id}: {start_datetime} ~ {end_datetime})")
+        return jsonify({
+            'success': True,
+            'data': {
+                'has_conflicts': bool(conflicts),
+                'conflicts': [build_conflict_item(*conflict) for conflict in conflicts]
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ 일정 충돌 확인 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '일정 충돌 확인 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 여러 사용자 바쁜 시간(free/busy) 헬퍼 함수
+# 사용자 ⟕ 캘린더 ⟕ 일정 단일 조인 쿼리 (기간 조건은 ON 절에 - 일정 없는 사용자도 존재 여부 확인 가능)
+FREEBUSY_QUERY = db.select(
+    User.user_id.label('owner_user_id'), Schedule.id, Schedule.date_info, Schedule.start_time, Schedule.end_time,
+    Schedule.recurring, Schedule.recurrence_until
+).select_from(User).outerjoin(Calendar, Calendar.user_id == User.id).outerjoin(Schedule, db.and_(
+    Schedule.calendar_id == Calendar.id,
+    db.or_(
+        db.and_(
+            Schedule.recurrence_until.is_(None),
+            Schedule.date_info >= db.bindparam('date_from'),
+            Schedule.date_info <= db.bindparam('date_to')
+        ),
+        Schedule.recurrence_until >= db.bindparam('date_from')
+    )
+)).where(User.user_id.in_(db.bindparam('user_ids', expanding=True)))
+
+def load_busy_intervals(user_ids, date_from, date_to):
+    """
+    사용자들의 기간 내 일정 구간 조회 (쿼리 1회, 반복 일정 펼침, 기간 밖은 잘라냄)
+    반환: (존재하는 사용자 id 집합, [(시작, 종료), ...])
+    """
+    rows = db.session.execute(FREEBUSY_QUERY, {
+        'user_ids': user_ids,
+        'date_from': date_from,
+        'date_to': date_to
+    }).all()
+    
+    found_users = {row.owner_user_id for row in rows}
+    schedules = [row for row in rows if row.id is not None]
+    window_start = datetime.combine(date_from, time.min)
+    window_end = datetime.combine(date_to + timedelta(days=1), time.min)
+    intervals = []
+    for row, day in expand_schedule_occurrences(schedules, date_from, date_to):
+        start = datetime.combine(day, row.start_time)
+        end = datetime.combine(day, row.end_time)
+        if start < window_end and end > window_start:
+            intervals.append((max(start, window_start), min(end, window_end)))
+    return found_users, intervals
+
+def parse_user_ids(args):
+    """?users=a,b&users=c → 순서를 유지한 중복 없는 사용자 id 목록"""
+    return list(dict.fromkeys(
+        user_id.strip() for value in args.getlist('users') for user_id in value.split(',') if user_id.strip()
+    ))
+
+def merge_busy_intervals(intervals):
+    """(시작, 종료) 구간들을 시작 시각 순으로 훑으며 겹치거나 맞닿은 구간을 병합"""
+    merged = []
+    for start, end in sorted(intervals):
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    return merged
+
+# 여러 사용자 바쁜 시간 조회 API - ?users=a,b,c&from=YYYY-MM-DD&to=YYYY-MM-DD
+# 일정 내용 없이 병합된 바쁜 구간만 반환
+@app.route('/api/freebusy', methods=['GET'])
+@login_required
+def get_freebusy():
+    print("\n=== 👥 free/busy 조회 ===")
+    try:
+        user_ids = parse_user_ids(request.args)
+        max_users = app.config.get('FREEBUSY_MAX_USERS', 100)
+        max_days = app.config.get('FREEBUSY_MAX_RANGE_DAYS', 62)
+        try:
+            date_from, date_to = parse_date_window(request.args)
+            if not user_ids:
+                raise ValueError('users는 필수 항목입니다.')
+            if len(user_ids) > max_users:
+                raise ValueError(f'한 번에 최대 {max_users}명까지 조회할 수 있습니다.')
+            if not date_from or not date_to:
+                raise ValueError('from, to는 필수 항목입니다.')
+            if (date_to - date_from).days >= max_days:
+                raise ValueError(f'조회 기간은 최대 {max_days}일입니다.')
+        except ValueError as e:
+            print(f"❌ free/busy 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        print(f"1️⃣ 사용자 {len(user_ids)}명, 기간 {date_from} ~ {date_to}")
+        found_users, intervals = load_busy_intervals(user_ids, date_from, date_to)
+        busy = merge_busy_intervals(intervals)
+        print(f"✅ 일정 {len(intervals)}개 → 바쁜 구간 {len(busy)}개")
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'from': date_from.isoformat(),
+                'to': date_to.isoformat(),
+                'users': [user_id for user_id in user_ids if user_id in found_users],
+                'unknown_users': [user_id for user_id in user_ids if user_id not in found_users],
+                'busy': [{'start': start.isoformat(), 'end': end.isoformat()} for start, end in busy]
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ free/busy 조회 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'free/busy 조회 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 공통 빈 시간 찾기 헬퍼 함수
+# 기간을 granularity분 단위 슬롯으로 나눠 정수 하나를 비트맵으로 사용 (슬롯 i = 비트 i)
+# - 바쁜 구간은 비트 범위 OR, 근무 시간 마스크와 AND NOT → 모두 비어 있는 슬롯
+# - 연속 k슬롯 빈 시간은 시프트 AND를 log(k)번 반복해 계산 (슬롯별/구간별 비교 없이 정수 연산으로 일괄 처리)
+def build_work_hours_mask(days, slots_per_day, work_start_slot, work_end_slot, weekdays, date_from):
+    """근무 요일/시간에 해당하는 슬롯 비트 마스크"""
+    day_mask = ((1 << (work_end_slot - work_start_slot)) - 1) << work_start_slot
+    mask = 0
+    for offset in range(days):
+        if (date_from + timedelta(days=offset)).weekday() in weekdays:
+            mask |= day_mask << (offset * slots_per_day)
+    return mask
+
+def find_common_free_slots(intervals, date_from, date_to, duration_minutes, granularity=5,
+                           work_start=time(9, 0), work_end=time(18, 0), weekdays=(0, 1, 2, 3, 4), limit=10):
+    """
+    모든 참석자가 비어 있는 duration_minutes 길이의 후보 시간 (빠른 순, 서로 겹치지 않게 최대 limit개)
+    intervals: 참석자 전체의 바쁜 구간 [(시작, 종료), ...]
+    """
+    slots_per_day = 24 * 60 // granularity
+    days = (date_to - date_from).days + 1
+    window_start = datetime.combine(date_from, time.min)
+    length = -(-duration_minutes // granularity)
+    work_start_slot = -(-(work_start.hour * 60 + work_start.minute) // granularity)
+    work_end_slot = (work_end.hour * 60 + work_end.minute) // granularity
+    
+    # 하루 안의 구간은 하루치 작은 비트맵에 모은 뒤 날짜별로 한 번만 전체 비트맵에 합침
+    busy = 0
+    day_busy = defaultdict(int)
+    step = timedelta(minutes=granularity)
+    for start, end in intervals:
+        first = max(0, int((start - window_start) // step))
+        last = min(days * slots_per_day, -int(-(end - window_start) // step))
+        if last <= first:
+            continue
+        day = first // slots_per_day
+        if (last - 1) // slots_per_day == day:
+            day_busy[day] |= ((1 << (last - first)) - 1) << (first - day * slots_per_day)
+        else:
+            busy |= ((1 << (last - first)) - 1) << first
+    for day, mask in day_busy.items():
+        busy |= mask << (day * slots_per_day)
+    
+    free = build_work_hours_mask(days, slots_per_day, work_start_slot, work_end_slot, set(weekdays), date_from) & ~busy
+    
+    # 비트 i가 켜져 있으면 슬롯 i ~ i+length-1이 모두 비어 있음
+    run, span = free, 1
+    while span < length and run:
+        shift = min(span, length - span)
+        run &= run >> shift
+        span += shift
+    
+    slots = []
+    while run and len(slots) < limit:
+        index = (run & -run).bit_length() - 1
+        start = window_start + index * step
+        slots.append((start, start + timedelta(minutes=duration_minutes)))
+        run &= ~((1 << (index + length)) - 1)  # 선택한 후보와 겹치는 시작 슬롯 제외
+    return slots
+
+# 회의 시간 찾기 API - ?users=a,b&duration=60&from=YYYY-MM-DD&to=YYYY-MM-DD
+#                     [&work_start=09:00&work_end=18:00&weekends=1&granularity=5&limit=10]
+@app.route('/api/find-time', methods=['GET'])
+@login_required
+def find_meeting_time():
+    print("\n=== 🗓️ 회의 시간 찾기 ===")
+    try:
+        user_ids = parse_user_ids(request.args)
+        max_users = app.config.get('FREEBUSY_MAX_USERS', 100)
+        max_days = app.config.get('FREEBUSY_MAX_RANGE_DAYS', 62)
+        try:
+            date_from, date_to = parse_date_window(request.args)
+            duration = int(request.args['duration'])
+            granularity = int(request.args.get('granularity', app.config.get('FIND_TIME_GRANULARITY', 5)))
+            work_start = datetime.strptime(request.args.get('work_start', '09:00'), '%H:%M').time()
+            work_end = datetime.strptime(request.args.get('work_end', '18:00'), '%H:%M').time()
+            limit = min(int(request.args.get('limit', 10)), 50)
+            if not user_ids:
+                raise ValueError('users는 필수 항목입니다.')
+            if len(user_ids) > max_users:
+                raise ValueError(f'한 번에 최대 {max_users}명까지 조회할 수 있습니다.')
+            if not date_from or not date_to:
+                raise ValueError('from, to는 필수 항목입니다.')
+            if (date_to - date_from).days >= max_days:
+                raise ValueError(f'조회 기간은 최대 {max_days}일입니다.')
+            if granularity < 1 or (24 * 60) % granularity:
+                raise ValueError('granularity는 하루(1440분)를 나누어 떨어지게 하는 분 단위여야 합니다.')
+            if duration < 1 or limit < 1 or work_end <= work_start:
+                raise ValueError('duration, limit, 근무 시간이 올바르지 않습니다.')
+        except (KeyError, ValueError) as e:
+            print(f"❌ 회의 시간 찾기 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        weekdays = range(7) if request.args.get('weekends') in ('1', 'true') else range(5)
+        print(f"1️⃣ 참석자 {len(user_ids)}명, {duration}분, 기간 {date_from} ~ {date_to}, 근무 {work_start}~{work_end}")
+        found_users, intervals = load_busy_intervals(user_ids, date_from, date_to)
+        slots = find_common_free_slots(intervals, date_from, date_to, duration, granularity,
+                                       work_start, work_end, weekdays, limit)
+        print(f"✅ 바쁜 구간 {len(intervals)}개 → 후보 {len(slots)}개")
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'users': [user_id for user_id in user_ids if user_id in found_users],
+                'unknown_users': [user_id for user_id in user_ids if user_id not in found_users],
+                'duration': duration,
+                'slots': [{'start': start.isoformat(), 'end': end.isoformat()} for start, end in slots]
+            }
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ 회의 시간 찾기 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '회의 시간 찾기 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 태그 집계(태그 클라우드) API - ?calendar=코드&limit=50
+# 내 캘린더의 태그별 일정 수 (태그 테이블 인덱스로 GROUP BY, 일정 행은 읽지 않음)
+@app.route('/api/tags', methods=['GET'])
+@login_required
+def get_tag_facets():
+    print("\n=== 🏷️ 태그 집계 ===")
+    try:
+        user = g.current_user
+        try:
+            limit = min(int(request.args.get('limit', 50)), 500)
+            if limit < 1:
+                raise ValueError('limit은 1 이상이어야 합니다.')
+        except ValueError as e:
+            return jsonify({'success': False, 'message': '조회 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        calendar_ids = db.select(Calendar.id).where(Calendar.user_id == user.id)
+        if request.args.get('calendar'):
+            calendar_ids = calendar_ids.where(Calendar.calendar_code == request.args['calendar'])
+        
+        schedule_tags = ScheduleTag.__table__
+        count = db.func.count().label('count')
+        rows = db.session.execute(
+            db.select(schedule_tags.c.tag, count)
+            .where(schedule_tags.c.calendar_id.in_(calendar_ids.scalar_subquery()))
+            .group_by(schedule_tags.c.tag)
+            .order_by(count.desc(), schedule_tags.c.tag)
+            .limit(limit)
+        ).all()
+        print(f"✅ 태그 {len(rows)}개")
+        
+        return jsonify({
+            'success': True,
+            'data': {'tags': [{'tag': tag, 'count': tag_count} for tag, tag_count in rows]}
+        }), 200
+        
+    except Exception as e:
+        print(f"❌ 태그 집계 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '태그 집계 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+def add_analytics_totals(totals, key, count, cost):
+    """그룹별 [일정 수, 비용 합계] 누적"""
+    entry = totals.get(key)
+    if entry is None:
+        totals[key] = [count, cost]
+    else:
+        entry[0] += count
+        entry[1] += cost
+
+def resolve_analytics_window(date_from, date_to):
+    """
+    분석 기간 확정 (반복 일정 합계가 기간 없이 오늘 날짜에 따라 달라지지 않도록 항상 닫힌 기간)
+    - from/to 모두 지정: 그대로
+    - 한쪽만 지정: 나머지를 ANALYTICS_DEFAULT_DAYS일 기간으로 채움
+    - 둘 다 없음: 오늘까지 최근 ANALYTICS_DEFAULT_DAYS일
+    """
+    period = timedelta(days=app.config.get('ANALYTICS_DEFAULT_DAYS', 365) - 1)
+    if date_from and date_to:
+        return date_from, date_to
+    if date_from:
+        return date_from, date_from + period
+    date_to = date_to or date.today()
+    return date_to - period, date_to
+
+def compute_schedule_analytics(calendar_ids, date_from, date_to):
+    """
+    캘린더들의 date_from ~ date_to 비용/중요도 분석
+    - 일반 일정: 숫자 컬럼만 DB에서 GROUP BY (행 단위 파이썬 루프 없이 집계된 그룹만 합산)
+      (캘린더, 중요도) / (날짜, 시작 시각) / 태그 - 3개 쿼리로 월별·요일×시간대 등을 모두 접어서 계산
+    - 반복 일정: 시리즈 행만 읽어 기간 내 발생 날짜로 모두 펼친 뒤 같은 누적기에 합산
+      (합계가 잘리지 않도록 화면 표시용 최대 발생 수 대신 기간 일수를 상한으로 사용)
+    """
+    schedules = Schedule.__table__
+    schedule_tags = ScheduleTag.__table__
+    count = db.func.count()
+    cost = db.func.coalesce(db.func.sum(schedules.c.estimated_cost), 0)
+    hour = db.extract('hour', schedules.c.start_time)
+    
+    plain = [schedules.c.calendar_id.in_(calendar_ids), schedules.c.recurrence_until.is_(None),
+             schedules.c.date_info >= date_from, schedules.c.date_info <= date_to]
+    
+    by_calendar_importance = {}
+    for calendar_id, importance, group_count, group_cost in db.session.execute(
+        db.select(schedules.c.calendar_id, schedules.c.importance, count, cost)
+        .where(*plain).group_by(schedules.c.calendar_id, schedules.c.importance)
+    ):
+        add_analytics_totals(by_calendar_importance, (calendar_id, importance), group_count, int(group_cost))
+    
+    by_day_hour = {}
+    for day, start_hour, group_count, group_cost in db.session.execute(
+        db.select(schedules.c.date_info, hour, count, cost).where(*plain).group_by(schedules.c.date_info, hour)
+    ):
+        add_analytics_totals(by_day_hour, (day, int(start_hour)), group_count, int(group_cost))
+    
+    by_tag = {}
+    for tag, group_count, group_cost in db.session.execute(
+        db.select(schedule_tags.c.tag, count, cost)
+        .join(schedules, schedules.c.id == schedule_tags.c.schedule_id)
+        .where(schedule_tags.c.calendar_id.in_(calendar_ids), *plain)
+        .group_by(schedule_tags.c.tag)
+    ):
+        add_analytics_totals(by_tag, tag, group_count, int(group_cost))
+    
+    # 반복 일정 발생분 합산
+    series_query = Schedule.query.filter(
+        Schedule.calendar_id.in_(calendar_ids), Schedule.recurrence_until.isnot(None),
+        Schedule.recurrence_until >= date_from, Schedule.date_info <= date_to
+    ).options(db.load_only(Schedule.calendar_id, Schedule.date_info, Schedule.start_time, Schedule.estimated_cost,
+                           Schedule.importance, Schedule.tags, Schedule.recurring, Schedule.recurrence_until))
+    window_days = (date_to - date_from).days + 1
+    for schedule, day in expand_schedule_occurrences(series_query.all(), date_from, date_to, window_days):
+        schedule_cost = schedule.estimated_cost or 0
+        add_analytics_totals(by_calendar_importance, (schedule.calendar_id, schedule.importance), 1, schedule_cost)
+        add_analytics_totals(by_day_hour, (day, schedule.start_time.hour), 1, schedule_cost)
+        for row in build_tag_rows(schedule):
+            add_analytics_totals(by_tag, row['tag'], 1, schedule_cost)
+    
+    # 집계된 그룹을 캘린더/중요도/월/요일×시간대로 접기
+    calendars, importance, monthly = {}, {}, {}
+    importance_sums = defaultdict(lambda: [0, 0])
+    for (calendar_id, level), (group_count, group_cost) in by_calendar_importance.items():
+        add_analytics_totals(calendars, calendar_id, group_count, group_cost)
+        add_analytics_totals(importance, level, group_count, group_cost)
+        if level is not None:
+            importance_sums[calendar_id][0] += level * group_count
+            importance_sums[calendar_id][1] += group_count
+    week_grid = [[0] * 24 for _ in range(7)]
+    for (day, start_hour), (group_count, group_cost) in by_day_hour.items():
+        add_analytics_totals(monthly, (day.year, day.month), group_count, group_cost)
+        week_grid[day.weekday()][start_hour] += group_count
+    
+    busiest = sorted(
+        ((week_grid[weekday][start_hour], weekday, start_hour) for weekday in range(7) for start_hour in range(24)),
+        key=lambda item: (-item[0], item[1], item[2])
+    )
+    total_count = sum(group_count for group_count, _ in calendars.values())
+    total_cost = sum(group_cost for _, group_cost in calendars.values())
+    return {
+        'totals': {'count': total_count, 'totalCost': total_cost},
+        'calendars': {
+            calendar_id: {
+                'count': group_count,
+                'totalCost': group_cost,
+                'avgImportance': round(importance_sums[calendar_id][0] / importance_sums[calendar_id][1], 2)
+                if importance_sums[calendar_id][1] else None
+            }
+            for calendar_id, (group_count, group_cost) in calendars.items()
+        },
+        'monthly': [
+            {'month': f'{year:04d}-{month:02d}', 'count': group_count, 'totalCost': group_cost}
+            for (year, month), (group_count, group_cost) in sorted(monthly.items())
+        ],
+        'tags': [
+            {'tag': tag, 'count': group_count, 'totalCost': group_cost}
+            for tag, (group_count, group_cost) in sorted(by_tag.items(), key=lambda item: (-item[1][1], -item[1][0], item[0]))
+        ],
+        'importance': [
+            {'importance': level, 'count': group_count, 'totalCost': group_cost}
+            for level, (group_count, group_cost) in sorted(importance.items(), key=lambda item: (item[0] is None, item[0] or 0))
+        ],
+        'weekHours': week_grid,
+        'busiestHours': [
+            {'weekday': weekday, 'hour': start_hour, 'count': group_count}
+            for group_count, weekday, start_hour in busiest[:10] if group_count
+        ]
+    }
+
+# 일정 비용/중요도 분석 API - ?calendar=코드&from=YYYY-MM-DD&to=YYYY-MM-DD
+# 월별/태그별/캘린더별 비용, 중요도 분포, 요일×시간대 일정 수 (캘린더 버전 기반 캐시)
+@app.route('/api/analytics', methods=['GET'])
+@login_required
+def get_schedule_analytics():
+    print("\n=== 📊 일정 분석 ===")
+    try:
+        user = g.current_user
+        try:
+            date_from, date_to = parse_date_window(request.args)
+        except ValueError as e:
+            print(f"❌ 조회 기간 파싱 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 기간 형식이 올바르지 않습니다. (YYYY-MM-DD)', 'error': str(e)}), 400
+        # 확정된 기간이 캐시 키/ETag에 들어가므로 기간 미지정 결과도 날짜가 바뀌면 새로 계산
+        date_from, date_to = resolve_analytics_window(date_from, date_to)
+        
+        # 대상 캘린더 + 버전 조회 (1회) - 캐시 키와 ETag에 사용
+        query = db.session.query(Calendar.id, Calendar.calendar_code, Calendar.version).filter(Calendar.user_id == user.id)
+        if request.args.get('calendar'):
+            query = query.filter(Calendar.calendar_code == request.args['calendar'])
+        calendars = query.order_by(Calendar.id).all()
+        if request.args.get('calendar') and not calendars:
+            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
+        
+        calendar_state = tuple((calendar.id, calendar.version) for calendar in calendars)
+        etag = make_etag('analytics', user.id, calendar_state, date_from, date_to)
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        cache_key = (user.id, calendar_state, date_from, date_to)
+        analytics = analytics_cache.get(cache_key)
+        if analytics is None:
+            print(f"1️⃣ 분석 계산 중... (캘린더 {len(calendars)}개, {date_from} ~ {date_to})")
+            analytics = compute_schedule_analytics([calendar.id for calendar in calendars], date_from, date_to)
+            analytics_cache.set(user.id, cache_key, analytics)
+        else:
+            print("⚡ 분석 캐시 적중")
         
-        print("8️⃣ 캘린더 검색 중...")
-        calendars = Calendar.query.filter_by(user_id=user.id).all()
-        print(f"9️⃣ 찾은 캘린더 수: {len(calendars)}")
+        codes = {calendar.id: calendar.calendar_code for calendar in calendars}
+        data = dict(analytics)
+        data['calendars'] = [
+            {'calendarId': codes[calendar_id], **values} for calendar_id, values in analytics['calendars'].items()
+        ]
+        data['from'] = date_from.isoformat()
+        data['to'] = date_to.isoformat()
         
-        calendar_list = []
-        for calendar in calendars:
-            calendar_data = {
-                'calendar_id': calendar.calendar_code,
-                'calendarId': calendar.calendar_code,
-                'calendar_name': calendar.calendar_name,
-                'calendarName': calendar.calendar_name,
-                'description': calendar.description,
-                'created_at': calendar.created_at.isoformat() if calendar.created_at else None
-            }
-            calendar_list.append(calendar_data)
-            print(f"🔟 캘린더 추가: {calendar_data}")
+        print(f"✅ 분석 완료: 일정 {analytics['totals']['count']}개")
+        response = jsonify({'success': True, 'data': data})
+        return set_etag_headers(response, etag), 200
         
-        response_data = {
+    except Exception as e:
+        print(f"❌ 일정 분석 오류: {e}")
+        return jsonify({
+            'success': False,
+            'message': '일정 분석 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# 참석자별 일정 조회 API - ?name=김대표 또는 ?contact=010-1111-2222 [&calendar=코드&limit=20&cursor=...]
+# 참석자 색인에서 일정 id를 키셋(최근 생성 순)으로 조회한 뒤 해당 일정만 로드
+@app.route('/api/participants/schedules', methods=['GET'])
+@login_required
+def get_participant_schedules():
+    print("\n=== 👥 참석자별 일정 조회 ===")
+    try:
+        user = g.current_user
+        name_key = normalize_participant_name(request.args.get('name', ''))
+        contact_key = normalize_participant_contact(request.args.get('contact', '')) if request.args.get('contact') else ''
+        try:
+            limit = min(int(request.args.get('limit', 20)), app.config.get('SCHEDULE_PAGE_SIZE_MAX', 500))
+            cursor = int(request.args['cursor']) if request.args.get('cursor') else None
+            if not name_key and not contact_key:
+                raise ValueError('name 또는 contact 파라미터가 필요합니다.')
+            if limit < 1:
+                raise ValueError('limit은 1 이상이어야 합니다.')
+        except ValueError as e:
+            print(f"❌ 조회 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        print(f"1️⃣ 참석자: name={name_key or '-'}, contact={contact_key or '-'}")
+        
+        calendar_ids = db.select(Calendar.id).where(Calendar.user_id == user.id)
+        if request.args.get('calendar'):
+            calendar_ids = calendar_ids.where(Calendar.calendar_code == request.args['calendar'])
+        
+        schedule_participants = ScheduleParticipant.__table__
+        query = db.select(schedule_participants.c.schedule_id) \
+            .where(schedule_participants.c.calendar_id.in_(calendar_ids.scalar_subquery()))
+        if name_key:
+            query = query.where(schedule_participants.c.name_key == name_key)
+        if contact_key:
+            query = query.where(schedule_participants.c.contact_key == contact_key)
+        if cursor is not None:
+            query = query.where(schedule_participants.c.schedule_id < cursor)
+        ids = db.session.execute(
+            query.order_by(schedule_participants.c.schedule_id.desc()).limit(limit + 1)
+        ).scalars().all()
+        has_more = len(ids) > limit
+        ids = ids[:limit]
+        print(f"2️⃣ 일치 일정 {len(ids)}개 (다음 페이지: {has_more})")
+        
+        results = []
+        if ids:
+            rows = db.session.query(Schedule, Calendar.calendar_code) \
+                .join(Calendar, Schedule.calendar_id == Calendar.id) \
+                .filter(Schedule.id.in_(ids)) \
+                .all()
+            by_id = {schedule.id: (schedule, calendar_code) for schedule, calendar_code in rows}
+            for schedule_id in ids:
+                if schedule_id not in by_id:
+                    continue
+                schedule, calendar_code = by_id[schedule_id]
+                item = build_schedule_item(schedule, user, True)
+                item['calendarId'] = calendar_code
+                results.append(item)
+        
+        print(f"✅ 참석자별 일정 {len(results)}개")
+        return jsonify({
             'success': True,
             'data': {
-                'calendars': calendar_list
+                'schedules': results,
+                'limit': limit,
+                'has_more': has_more,
+                'next_cursor': str(ids[-1]) if has_more else None
             }
-        }
-        print(f"✅ 최종 응답: {response_data}")
-        return jsonify(response_data), 200
+        }), 200
         
     except Exception as e:
-        print(f"❌ 캘린더 조회 오류: {e}")
-        print(f"❌ 오류 상세: {repr(e)}")
+        print(f"❌ 참석자별 일정 조회 오류: {e}")
         return jsonify({
             'success': False,
-            'message': '캘린더 조회 중 오류 발생',
+            'message': '참석자별 일정 조회 중 오류 발생',
             'error': str(e)
         }), 500
 
-# 캘린더 생성 API (프론트엔드용)
-@app.route('/api/calendars', methods=['POST'])
-def create_calendar():
-    print("\n=== 📅 캘린더 생성 시작 ===")
+# 참석자 자동완성 API - ?q=김[&calendar=코드&limit=10&cursor=...]
+# 정규화 이름 접두어 범위 조회 (참석자 색인 인덱스 범위 조건), 이름 순 키셋 페이지네이션 (조회 2회)
+@app.route('/api/participants/autocomplete', methods=['GET'])
+@login_required
+def autocomplete_participants():
+    print("\n=== 👥 참석자 자동완성 ===")
     try:
-        print("1️⃣ 인증 헤더 확인 중...")
-        auth_header = request.headers.get('Authorization')
-        
-        if not auth_header:
-            print("❌ 인증 헤더 없음")
-            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
-        
-        print("2️⃣ 토큰 파싱 중...")
-        token = auth_header.replace('Bearer ', '')
-        user_id = extract_user_id_from_token(token)
-        print(f"3️⃣ 추출된 사용자 ID: {user_id}")
-        
-        if not user_id:
-            print("❌ 토큰에서 사용자 ID 추출 실패")
-            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
-        
-        print("4️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
-        
-        if not user:
-            print("❌ 사용자 없음")
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
-        
-        print("5️⃣ 요청 데이터 파싱 중...")
-        data = request.get_json()
-        print(f"6️⃣ 받은 데이터: {data}")
-        
-        calendar_name = data.get('calendarName', '새 캘린더')
-        description = data.get('description', '')
-        
-        print("7️⃣ 새 캘린더 생성 중...")
-        new_calendar = Calendar(
-            calendar_code=f"{user_id}_{datetime.utcnow().timestamp()}",
-            calendar_name=calendar_name,
-            description=description,
-            user_id=user.id
+        user = g.current_user
+        prefix = normalize_participant_name(request.args.get('q', ''))
+        try:
+            limit = min(int(request.args.get('limit', 10)), 100)
+            if not prefix:
+                raise ValueError('q 파라미터가 필요합니다.')
+            if limit < 1:
+                raise ValueError('limit은 1 이상이어야 합니다.')
+        except ValueError as e:
+            print(f"❌ 자동완성 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '자동완성 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        calendar_ids = db.select(Calendar.id).where(Calendar.user_id == user.id)
+        if request.args.get('calendar'):
+            calendar_ids = calendar_ids.where(Calendar.calendar_code == request.args['calendar'])
+        
+        # 1단계: 접두어 범위의 이름 키만 인덱스 순서로 조회 (인덱스만 읽음, 다음 페이지 확인용으로 1개 더)
+        schedule_participants = ScheduleParticipant.__table__
+        in_calendars = schedule_participants.c.calendar_id.in_(calendar_ids.scalar_subquery())
+        query = db.select(schedule_participants.c.name_key).distinct().where(
+            in_calendars,
+            schedule_participants.c.name_key >= prefix,
+            schedule_participants.c.name_key < prefix_upper_bound(prefix)
         )
+        if request.args.get('cursor'):
+            query = query.where(schedule_participants.c.name_key > request.args['cursor'])
+        name_keys = db.session.execute(
+            query.order_by(schedule_participants.c.name_key).limit(limit + 1)
+        ).scalars().all()
+        has_more = len(name_keys) > limit
+        name_keys = name_keys[:limit]
+        
+        # 2단계: 현재 페이지 이름들만 표시 이름/연락처/일정 수 집계 (1글자 접두어도 전체 범위를 집계하지 않음)
+        rows = []
+        if name_keys:
+            rows = db.session.execute(
+                db.select(
+                    schedule_participants.c.name_key,
+                    db.func.min(schedule_participants.c.name).label('name'),
+                    db.func.max(schedule_participants.c.contact).label('contact'),
+                    db.func.count().label('count')
+                )
+                .where(in_calendars, schedule_participants.c.name_key.in_(name_keys))
+                .group_by(schedule_participants.c.name_key)
+                .order_by(schedule_participants.c.name_key)
+            ).all()
+        print(f"✅ 자동완성 후보 {len(rows)}개 (접두어: {prefix})")
         
-        print("8️⃣ 데이터베이스 저장 중...")
-        db.session.add(new_calendar)
-        db.session.commit()
-        print(f"9️⃣ 캘린더 생성 완료: {new_calendar.calendar_code}")
-        
-        response_data = {
+        return jsonify({
             'success': True,
-            'message': '캘린더가 생성되었습니다.',
             'data': {
-                'calendar': {
-                    'calendar_id': new_calendar.calendar_code,
-                    'calendar_name': new_calendar.calendar_name,
-                    'description': new_calendar.description,
-                    'created_at': new_calendar.created_at.isoformat()
-                }
+                'participants': [
+                    {'name': row.name, 'contact': row.contact, 'count': row.count} for row in rows
+                ],
+                'has_more': has_more,
+                'next_cursor': name_keys[-1] if has_more else None
             }
-        }
-        print(f"✅ 최종 응답: {response_data}")
-        return jsonify(response_data), 201
+        }), 200
         
     except Exception as e:
-        print(f"❌ 캘린더 생성 오류: {e}")
-        db.session.rollback()
+        print(f"❌ 참석자 자동완성 오류: {e}")
         return jsonify({
             'success': False,
-            'message': '캘린더 생성 중 오류 발생',
+            'message': '참석자 자동완성 중 오류 발생',
             'error': str(e)
         }), 500
 
-# 일정 목록 조회 (프론트엔드용) - 기존 스키마와 호환, 수정된 토큰 파싱
-@app.route('/api/schedules/<calendar_id>', methods=['GET'])
-def get_schedules_by_calendar(calendar_id):
-    print(f"\n=== 📝 일정 목록 조회 시작 (캘린더: {calendar_id}) ===")
+# 일정 검색 API - ?q=검색어[&calendar=코드&limit=20&offset=0]
+# 내 캘린더의 일정에서 검색어의 모든 2-gram을 포함하는 일정을 가중치 합 순으로 반환
+@app.route('/api/search', methods=['GET'])
+@login_required
+def search_schedules():
+    print("\n=== 🔎 일정 검색 ===")
     try:
-        print("1️⃣ 인증 헤더 확인 중...")
-        auth_header = request.headers.get('Authorization')
-        print(f"2️⃣ 인증 헤더: {auth_header}")
-        
-        if not auth_header:
-            print("❌ 인증 헤더 없음")
-            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
-        
-        print("3️⃣ 토큰 파싱 중...")
-        token = auth_header.replace('Bearer ', '')
-        print(f"4️⃣ 원본 토큰: {token}")
-        
-        # 개선된 토큰 파싱
-        user_id = extract_user_id_from_token(token)
-        print(f"5️⃣ 추출된 사용자 ID: {user_id}")
-        
-        if not user_id:
-            print("❌ 토큰에서 사용자 ID 추출 실패")
-            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
-        
-        print("6️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
-        print(f"7️⃣ 사용자 검색 결과: {user}")
-        
-        if not user:
-            print("❌ 사용자 없음")
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
-        
-        print("8️⃣ 캘린더 검색 중...")
-        calendar = Calendar.query.filter_by(calendar_code=calendar_id).first()
-        print(f"9️⃣ 캘린더 검색 결과: {calendar}")
-        
-        if not calendar:
-            print("❌ 캘린더 없음")
-            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
-        
-        # ✅ 수정: 캘린더 소유자 확인 제거 - 모든 캘린더의 일정을 볼 수 있도록
-        print("🔟 일정 검색 중... (모든 일정 표시)")
-        schedules = Schedule.query.filter_by(calendar_id=calendar.id).all()
-        print(f"1️⃣1️⃣ 찾은 일정 수: {len(schedules)}")
-        
-        schedule_list = []
-        for schedule in schedules:
-            start_datetime = datetime.combine(schedule.date_info, schedule.start_time)
-            end_datetime = datetime.combine(schedule.date_info, schedule.end_time)
-            
-            # 캘린더 소유자 정보 추가
-            calendar_owner = User.query.get(calendar.user_id)
-            
-            # 기존 JSON 구조와 호환되도록 수정
-            location_str = ""
-            if schedule.location_data:
-                if isinstance(schedule.location_data, dict):
-                    location_str = schedule.location_data.get('name', '')
-                else:
-                    location_str = str(schedule.location_data)
-            
-            participants_str = ""
-            if schedule.participants_data:
-                if isinstance(schedule.participants_data, list):
-                    participants_str = ", ".join([p.get('name', '') for p in schedule.participants_data if isinstance(p, dict)])
-                else:
-                    participants_str = str(schedule.participants_data)
-            
-            # ✅ 내 일정인지 확인하여 색상 구분
-            is_my_schedule = calendar.user_id == user.id
-            
-            schedule_data = {
-                'id': schedule.schedule_id,
-                'title': schedule.title,
-                'description': schedule.description,
-                'start_time': start_datetime.isoformat(),
-                'startTime': start_datetime.isoformat(),
-                'end_time': end_datetime.isoformat(),
-                'endTime': end_datetime.isoformat(),
-                'location': location_str,
-                'color': '#667eea' if is_my_schedule else '#10b981',  # 내 일정 파란색, 다른 사람 초록색
-                'notification': True,
-                'importance': schedule.importance,
-                'participants': participants_str,
-                'notes': schedule.notes,
-                'tags': schedule.tags,
-                'is_my_schedule': is_my_schedule,
-                'owner_name': calendar_owner.name if calendar_owner else 'Unknown',
-                'owner_id': calendar_owner.user_id if calendar_owner else 'Unknown'
-            }
-            schedule_list.append(schedule_data)
-            print(f"1️⃣2️⃣ 일정 추가: {schedule_data}")
-        
-        response_data = {
+        user = g.current_user
+        query_text = request.args.get('q', '').strip()
+        tokens = sorted(set(tokenize_search_text(query_text)))
+        try:
+            limit = min(int(request.args.get('limit', 20)), app.config.get('SCHEDULE_PAGE_SIZE_MAX', 500))
+            offset = int(request.args.get('offset', 0))
+            if not tokens:
+                raise ValueError('검색어는 2글자 이상 단어를 포함해야 합니다.')
+            if len(tokens) > app.config.get('SEARCH_MAX_TOKENS', 32):
+                raise ValueError('검색어가 너무 깁니다.')
+            if limit < 1 or offset < 0:
+                raise ValueError('limit은 1 이상, offset은 0 이상이어야 합니다.')
+        except ValueError as e:
+            print(f"❌ 검색 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '검색 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        print(f"1️⃣ 검색어: {query_text} → 토큰 {tokens}")
+        
+        calendar_ids = db.select(Calendar.id).where(Calendar.user_id == user.id)
+        if request.args.get('calendar'):
+            calendar_ids = calendar_ids.where(Calendar.calendar_code == request.args['calendar'])
+        
+        # 역색인에서 모든 토큰을 포함하는 일정 id + 점수 (다음 페이지 확인용으로 1개 더)
+        search_index = ScheduleSearchToken.__table__
+        score = db.func.sum(search_index.c.weight).label('score')
+        ranked = db.session.execute(
+            db.select(search_index.c.schedule_id, score)
+            .where(search_index.c.calendar_id.in_(calendar_ids.scalar_subquery()), search_index.c.token.in_(tokens))
+            .group_by(search_index.c.schedule_id)
+            .having(db.func.count() == len(tokens))
+            .order_by(score.desc(), search_index.c.schedule_id.desc())
+            .limit(limit + 1).offset(offset)
+        ).all()
+        has_more = len(ranked) > limit
+        ranked = ranked[:limit]
+        print(f"2️⃣ 일치 일정 {len(ranked)}개 (다음 페이지: {has_more})")
+        
+        results = []
+        if ranked:
+            rows = db.session.query(Schedule, Calendar.calendar_code) \
+                .join(Calendar, Schedule.calendar_id == Calendar.id) \
+                .filter(Schedule.id.in_([row.schedule_id for row in ranked])) \
+                .all()
+            by_id = {schedule.id: (schedule, calendar_code) for schedule, calendar_code in rows}
+            for schedule_id, schedule_score in ranked:
+                if schedule_id not in by_id:
+                    continue
+                schedule, calendar_code = by_id[schedule_id]
+                item = build_schedule_item(schedule, user, True)
+                item['calendarId'] = calendar_code
+                item['score'] = int(schedule_score)
+                results.append(item)
+        
+        print(f"✅ 검색 완료: {len(results)}개")
+        return jsonify({
             'success': True,
             'data': {
-                'schedules': schedule_list
+                'query': query_text,
+                'schedules': results,
+                'limit': limit,
+                'offset': offset,
+                'has_more': has_more,
+                'next_offset': offset + limit if has_more else None
             }
-        }
-        print(f"✅ 최종 응답: {response_data}")
-        return jsonify(response_data), 200
+        }), 200
         
     except Exception as e:
-        print(f"❌ 일정 조회 오류: {e}")
-        print(f"❌ 오류 상세: {repr(e)}")
+        print(f"❌ 일정 검색 오류: {e}")
         return jsonify({
             'success': False,
-            'message': '일정 조회 중 오류 발생',
+            'message': '일정 검색 중 오류 발생',
             'error': str(e)
         }), 500
 
 # 일정 추가 API (프론트엔드용)
 @app.route('/api/schedules/<calendar_id>', methods=['POST'])
+@login_required
 def add_schedule_to_calendar(calendar_id):
     print(f"\n=== 📝 일정 추가 시작 (캘린더: {calendar_id}) ===")
     try:
-        print("1️⃣ 인증 헤더 확인 중...")
-        auth_header = request.headers.get('Authorization')
-        print(f"2️⃣ 인증 헤더: {auth_header}")
-        
-        if not auth_header:
-            print("❌ 인증 헤더 없음")
-            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
-        
-        print("3️⃣ 토큰 파싱 중...")
-        token = auth_header.replace('Bearer ', '')
-        print(f"4️⃣ 원본 토큰: {token}")
-        
-        # 토큰에서 사용자 ID 추출
-        user_id = extract_user_id_from_token(token)
-        print(f"5️⃣ 추출된 사용자 ID: {user_id}")
-        
-        if not user_id:
-            print("❌ 토큰에서 사용자 ID 추출 실패")
-            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
-        
-        print("6️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
-        print(f"7️⃣ 사용자 검색 결과: {user}")
-        
-        if not user:
-            print("❌ 사용자 없음")
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
         
-        print("8️⃣ 캘린더 검색 중...")
+        print("2️⃣ 캘린더 검색 중...")
         calendar = Calendar.query.filter_by(calendar_code=calendar_id).first()
-        print(f"9️⃣ 캘린더 검색 결과: {calendar}")
+        print(f"3️⃣ 캘린더 검색 결과: {calendar}")
         
         if not calendar:
             print("❌ 캘린더 없음")
@@ -986,9 +3476,9 @@ def add_schedule_to_calendar(calendar_id):
             print("❌ 캘린더 접근 권한 없음")
             return jsonify({'success': False, 'message': '캘린더에 접근할 권한이 없습니다.'}), 403
         
-        print("🔟 요청 데이터 파싱 중...")
+        print("4️⃣ 요청 데이터 파싱 중...")
         data = request.get_json()
-        print(f"1️⃣1️⃣ 받은 일정 데이터: {data}")
+        print(f"5️⃣ 받은 일정 데이터: {data}")
         
         # 필수 필드 검증
         required_fields = ['title', 'startTime', 'endTime']
@@ -999,18 +3489,33 @@ def add_schedule_to_calendar(calendar_id):
                     'message': f'{field}는 필수 항목입니다.'
                 }), 400
         
-        print("1️⃣2️⃣ 날짜/시간 파싱 중...")
+        print("6️⃣ 날짜/시간 파싱 중...")
         # 시작 시간 파싱
         start_datetime = datetime.fromisoformat(data['startTime'].replace('Z', '+00:00'))
         end_datetime = datetime.fromisoformat(data['endTime'].replace('Z', '+00:00'))
         
-        print(f"1️⃣3️⃣ 시작 시간: {start_datetime}")
-        print(f"1️⃣4️⃣ 종료 시간: {end_datetime}")
+        print(f"7️⃣ 시작 시간: {start_datetime}")
+        print(f"8️⃣ 종료 시간: {end_datetime}")
+        
+        # 선택적 충돌 확인 (checkConflicts: true) - 겹치는 일정이 있으면 저장하지 않고 409
+        if data.get('checkConflicts'):
+            print("🔍 일정 충돌 확인 중...")
+            try:
+                conflicts = find_schedule_conflicts(user.id, start_datetime, end_datetime)
+            except ValueError as e:
+                return jsonify({'success': False, 'message': '일정 시간이 올바르지 않습니다.', 'error': str(e)}), 400
+            if conflicts:
+                print(f"❌ 겹치는 일정 {len(conflicts)}개")
+                return jsonify({
+                    'success': False,
+                    'message': '겹치는 일정이 있습니다.',
+                    'data': {'conflicts': [build_conflict_item(*conflict) for conflict in conflicts]}
+                }), 409
         
         # 새 일정 생성
-        print("1️⃣5️⃣ 새 일정 생성 중...")
+        print("9️⃣ 새 일정 생성 중...")
         new_schedule = Schedule(
-            schedule_id=f"schedule_{user_id}_{datetime.utcnow().timestamp()}",
+            schedule_id=f"schedule_{user.user_id}_{datetime.utcnow().timestamp()}",
             date_info=start_datetime.date(),
             start_time=start_datetime.time(),
             end_time=end_datetime.time(),
@@ -1021,13 +3526,15 @@ def add_schedule_to_calendar(calendar_id):
             estimated_cost=0,
             importance=5,
             notes=data.get('notes', ''),
+            recurring=data.get('recurring'),
             calendar_id=calendar.id
         )
         
-        print("1️⃣6️⃣ 데이터베이스 저장 중...")
+        print("🔟 데이터베이스 저장 중...")
         db.session.add(new_schedule)
         db.session.commit()
-        print(f"1️⃣7️⃣ 일정 생성 완료: {new_schedule.schedule_id}")
+        schedule_response_cache.invalidate(calendar.id)
+        print(f"1️⃣1️⃣ 일정 생성 완료: {new_schedule.schedule_id}")
         
         # 응답 데이터 생성
         schedule_data = {
@@ -1135,11 +3642,13 @@ def create_schedule_by_calendar_code(calendar_code):
             tags=data.get('tags', []),
             importance=data.get('importance', 5),
             notes=data.get('notes', ''),
+            recurring=data.get('recurring'),
             calendar_id=calendar.id
         )
         
         db.session.add(new_schedule)
         db.session.commit()
+        schedule_response_cache.invalidate(calendar.id)
         
         return jsonify({
             'success': True,
@@ -1155,8 +3664,439 @@ def create_schedule_by_calendar_code(calendar_code):
         db.session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# 일정 일괄 생성 헬퍼 함수
+def iter_bulk_items():
+    """
+    요청 본문에서 (순번, 항목) 생성
+    - application/x-ndjson: 한 줄에 일정 하나 (스트림으로 읽으므로 본문 전체를 메모리에 올리지 않음)
+    - application/json: 일정 배열 또는 {"schedules": [...]}
+    JSON 파싱에 실패한 줄은 항목 대신 ValueError를 생성
+    """
+    if request.mimetype == 'application/x-ndjson':
+        index = 0
+        for line in request.stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield index, json.loads(line)
+            except ValueError as e:
+                yield index, ValueError(f'JSON 파싱 오류: {e}')
+            index += 1
+        return
+    
+    data = request.get_json()
+    items = data if isinstance(data, list) else (data or {}).get('schedules', [])
+    for index, item in enumerate(items):
+        yield index, item
+
+def parse_bulk_schedule(item):
+    """
+    일괄 생성 항목 검증 → (calendar_code, INSERT용 dict)
+    형식은 /api/calendars/<calendar_code>/schedules와 같음 + calendar_code
+    """
+    if isinstance(item, Exception):
+        raise item
+    if not isinstance(item, dict):
+        raise ValueError('일정 항목은 객체여야 합니다.')
+    
+    for field in ['calendar_code', 'date_info', 'start_time', 'end_time', 'title']:
+        if not item.get(field):
+            raise ValueError(f'{field}는 필수 항목입니다.')
+    
+    row = {
+        'schedule_id': item.get('schedule_id') or f"schedule_{uuid.uuid4().hex}",
+        'date_info': datetime.strptime(item['date_info'], '%Y-%m-%d').date(),
+        'start_time': datetime.strptime(item['start_time'], '%H:%M').time(),
+        'end_time': datetime.strptime(item['end_time'], '%H:%M').time(),
+        'title': item['title'],
+        'description': item.get('description', ''),
+        'location_data': item.get('location', {}),
+        'participants_data': item.get('participants', []),
+        'estimated_cost': item.get('estimated_cost', 0),
+        'tags': item.get('tags', []),
+        'importance': item.get('importance', 5),
+        'notes': item.get('notes', ''),
+        'recurring': item.get('recurring')
+    }
+    row['recurrence_until'] = compute_recurrence_until(row['recurring'], row['date_info'])
+    return item['calendar_code'], row
+
+def insert_schedule_chunk(chunk, calendar_cache, user, seen_ids):
+    """
+    검증된 일정 청크를 한 트랜잭션으로 INSERT (executemany)
+    - 새로 나온 캘린더 코드만 한 번의 IN 쿼리로 조회 (calendar_cache에 보관)
+    - 이미 존재하는 schedule_id도 한 번의 IN 쿼리로 확인
+    반환: 항목별 결과 목록
+    """
+    results = []
+    
+    missing_codes = {code for _, code, _ in chunk if code not in calendar_cache}
+    if missing_codes:
+        for calendar in Calendar.query.filter(Calendar.calendar_code.in_(missing_codes)).all():
+            calendar_cache[calendar.calendar_code] = (calendar.id, calendar.user_id)
+        for code in missing_codes:
+            calendar_cache.setdefault(code, None)
+    
+    existing_ids = {
+        schedule_id for (schedule_id,) in db.session.query(Schedule.schedule_id)
+        .filter(Schedule.schedule_id.in_([row['schedule_id'] for _, _, row in chunk]))
+    }
+    
+    rows = []
+    row_indexes = []
+    for index, code, row in chunk:
+        calendar = calendar_cache[code]
+        if calendar is None:
+            results.append({'index': index, 'success': False, 'schedule_id': row['schedule_id'], 'error': f'캘린더를 찾을 수 없습니다: {code}'})
+        elif calendar[1] != user.id:
+            results.append({'index': index, 'success': False, 'schedule_id': row['schedule_id'], 'error': f'캘린더에 접근할 권한이 없습니다: {code}'})
+        elif row['schedule_id'] in existing_ids or row['schedule_id'] in seen_ids:
+            results.append({'index': index, 'success': False, 'schedule_id': row['schedule_id'], 'error': '이미 존재하는 schedule_id입니다.'})
+        else:
+            seen_ids.add(row['schedule_id'])
+            rows.append({**row, 'calendar_id': calendar[0]})
+            row_indexes.append(index)
+    
+    if not rows:
+        return results, set()
+    
+    try:
+        # Core executemany (ORM 일괄 INSERT는 None 값 키 조합별로 배치를 나눔)
+        # 매퍼 이벤트를 거치지 않으므로 카운터/캘린더 버전을 직접 갱신
+        db.session.execute(Schedule.__table__.insert(), rows)
+        connection = db.session.connection()
+        bump_counter(connection, 'schedules', len(rows))
+        # 새 일정 id 조회 후 검색 역색인/태그 테이블/참석자 색인 추가 (청크당 조회 1회 + 테이블별 executemany 1회)
+        schedules = Schedule.__table__
+        new_ids = dict(connection.execute(
+            db.select(schedules.c.schedule_id, schedules.c.id)
+            .where(schedules.c.schedule_id.in_([row['schedule_id'] for row in rows]))
+        ).all())
+        index_schedules(connection, [{**row, 'id': new_ids[row['schedule_id']]} for row in rows])
+        touched_calendars = {row['calendar_id'] for row in rows}
+        for calendar_id in touched_calendars:
+            bump_calendar_version(connection, calendar_id)
+        db.session.commit()
+    except Exception as e:
+        print(f"❌ 청크 INSERT 오류: {e}")
+        db.session.rollback()
+        for index, row in zip(row_indexes, rows):
+            seen_ids.discard(row['schedule_id'])
+            results.append({'index': index, 'success': False, 'schedule_id': row['schedule_id'], 'error': str(e)})
+        return results, set()
+    
+    for index, row in zip(row_indexes, rows):
+        results.append({'index': index, 'success': True, 'schedule_id': row['schedule_id']})
+    return results, touched_calendars
+
+# 일정 일괄 생성 API (마이그레이션용) - JSON 배열 또는 NDJSON
+@app.route('/api/schedules/bulk', methods=['POST'])
+@login_required
+def create_schedules_bulk():
+    print("\n=== 📦 일정 일괄 생성 시작 ===")
+    try:
+        user = g.current_user
+        chunk_size = app.config.get('BULK_INSERT_CHUNK_SIZE', 500)
+        print(f"1️⃣ 인증 사용자: {user.user_id} (청크 크기: {chunk_size})")
+        
+        results = []
+        calendar_cache = {}
+        seen_ids = set()
+        touched_calendars = set()
+        chunk = []
+        
+        def flush():
+            chunk_results, chunk_calendars = insert_schedule_chunk(chunk, calendar_cache, user, seen_ids)
+            results.extend(chunk_results)
+            touched_calendars.update(chunk_calendars)
+            chunk.clear()
+        
+        print("2️⃣ 항목 검증 및 청크 단위 INSERT 중...")
+        for index, item in iter_bulk_items():
+            try:
+                code, row = parse_bulk_schedule(item)
+            except (ValueError, TypeError) as e:
+                results.append({'index': index, 'success': False, 'schedule_id': item.get('schedule_id') if isinstance(item, dict) else None, 'error': str(e)})
+                continue
+            chunk.append((index, code, row))
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+        
+        for calendar_id in touched_calendars:
+            schedule_response_cache.invalidate(calendar_id)
+        
+        results.sort(key=lambda result: result['index'])
+        created = sum(1 for result in results if result['success'])
+        print(f"✅ 일괄 생성 완료: 성공 {created}개, 실패 {len(results) - created}개")
+        
+        return jsonify({
+            'success': created > 0,
+            'message': f'{created}개 일정이 생성되었습니다.',
+            'data': {
+                'total': len(results),
+                'created': created,
+                'failed': len(results) - created,
+                'results': results
+            }
+        }), 201 if created > 0 else 400
+        
+    except Exception as e:
+        print(f"❌ 일정 일괄 생성 오류: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '일정 일괄 생성 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+# iCalendar(.ics) 가져오기 헬퍼 함수
+ICS_IMPORT_ERROR_LIMIT = 100
+
+def iter_ics_lines(stream):
+    """바이트/문자열 줄 스트림 → 접힌 줄(RFC 5545 line folding)을 펼친 논리 줄"""
+    pending = None
+    for raw in stream:
+        line = raw.decode('utf-8', errors='replace') if isinstance(raw, bytes) else raw
+        line = line.rstrip('\r\n')
+        if line[:1] in (' ', '\t'):
+            if pending is not None:
+                pending += line[1:]
+            continue
+        if pending is not None:
+            yield pending
+        pending = line
+    if pending:
+        yield pending
+
+def iter_ics_events(stream):
+    """
+    .ics 스트림에서 VEVENT를 하나씩 생성 (파일 전체를 메모리에 올리지 않음)
+    이벤트: {속성명: [(파라미터 dict, 값), ...]}
+    """
+    event = None
+    depth = 0
+    for line in iter_ics_lines(stream):
+        name, _, value = line.partition(':')
+        name, *params = name.split(';')
+        name = name.upper()
+        
+        if name == 'BEGIN':
+            if value.upper() == 'VEVENT' and event is None:
+                event = {}
+            elif event is not None:
+                depth += 1  # VALARM 등 하위 컴포넌트는 건너뜀
+            continue
+        if name == 'END':
+            if event is not None and depth:
+                depth -= 1
+            elif event is not None and value.upper() == 'VEVENT':
+                yield event
+                event = None
+            continue
+        if event is None or depth:
+            continue
+        
+        param_dict = {}
+        for param in params:
+            key, _, param_value = param.partition('=')
+            param_dict[key.upper()] = param_value.strip('"')
+        event.setdefault(name, []).append((param_dict, value))
+
+ICS_ESCAPE_PATTERN = re.compile(r'\\([\\;,nN])')
+
+def unescape_ics_text(value):
+    """TEXT 값 이스케이프 해제 (\\n → 줄바꿈, \\, \\; \\\\ → 문자 그대로)"""
+    return ICS_ESCAPE_PATTERN.sub(lambda match: '\n' if match.group(1) in 'nN' else match.group(1), value)
+
+@lru_cache(maxsize=64)
+def get_ics_timezone(tzid):
+    """TZID → ZoneInfo (IANA 이름만 지원, 찾을 수 없으면 ValueError)"""
+    try:
+        return ZoneInfo(tzid.strip().removeprefix('/mozilla.org/20050126_1/'))
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f'알 수 없는 시간대입니다: {tzid}')
+
+def parse_ics_datetime(value, tzid=None):
+    """
+    DATE(YYYYMMDD) 또는 DATE-TIME(YYYYMMDDTHHMMSS[Z]) → (date, time 또는 None)
+    - UTC(Z) 또는 TZID 시각은 앱 기준 시간대(CALENDAR_TIMEZONE)의 현지 시각으로 변환
+    - 시간대 없는 시각(floating)은 현지 시각으로 보고 그대로 사용
+    """
+    value = value.strip()
+    # strptime보다 빠른 고정 위치 슬라이싱 (대용량 가져오기의 주요 비용)
+    parsed_date = date(int(value[0:4]), int(value[4:6]), int(value[6:8]))
+    if len(value) < 15 or value[8] != 'T':
+        return parsed_date, None
+    parsed_time = time(int(value[9:11]), int(value[11:13]), int(value[13:15]))
+    if value.endswith('Z'):
+        source_zone = timezone.utc
+    elif tzid:
+        source_zone = get_ics_timezone(tzid)
+    else:
+        return parsed_date, parsed_time
+    local = datetime.combine(parsed_date, parsed_time, source_zone).astimezone(get_ics_timezone(app.config['CALENDAR_TIMEZONE']))
+    return local.date(), local.time()
+
+def ics_event_to_schedule(event, calendar_code):
+    """
+    VEVENT → Schedule INSERT용 dict
+    - schedule_id는 (캘린더, UID, RECURRENCE-ID) 해시 - 같은 파일을 다른 캘린더로 가져와도 충돌하지 않음
+    - 시각은 앱 기준 시간대로 변환 (알 수 없는 TZID는 ValueError로 해당 일정만 실패 처리)
+    - 일정은 하루 단위로 저장하므로 다음 날 끝나는 일정은 시작일 23:59에 끝나는 것으로 자름
+    - 종일 일정은 00:00 ~ 23:59
+    """
+    def first(name, default=None):
+        values = event.get(name)
+        return values[0][1] if values else default
+    
+    def first_datetime(name):
+        values = event.get(name)
+        return parse_ics_datetime(values[0][1], values[0][0].get('TZID')) if values else (None, None)
+    
+    if not first('DTSTART'):
+        raise ValueError('DTSTART가 없습니다.')
+    start_date, start_time = first_datetime('DTSTART')
+    end_date, end_time = first_datetime('DTEND')
+    if start_time is None:
+        start_time, end_time = time(0, 0), time(23, 59)
+    elif end_time is None or end_date < start_date or (end_date == start_date and end_time < start_time):
+        end_time = start_time
+    elif end_date > start_date:
+        end_time = time(23, 59)
+    
+    uid = first('UID') or f"{first('DTSTART')}|{first('SUMMARY', '')}"
+    recurrence_id = first('RECURRENCE-ID', '')
+    location = first('LOCATION')
+    participants = []
+    for params, value in event.get('ATTENDEE', []):
+        email = value[7:] if value.lower().startswith('mailto:') else value
+        participants.append({'name': params.get('CN') or email, 'email': email})
+    rrule = first('RRULE')
+    
+    recurring = rrule[:100] if rrule else None
+    return {
+        'schedule_id': 'ics_' + hashlib.sha1(f'{calendar_code}|{uid}|{recurrence_id}'.encode('utf-8')).hexdigest(),
+        'date_info': start_date,
+        'start_time': start_time,
+        'end_time': end_time,
+        'title': unescape_ics_text(first('SUMMARY', '')) or '(제목 없음)',
+        'description': unescape_ics_text(first('DESCRIPTION', '')),
+        'location_data': {'name': unescape_ics_text(location)} if location else {},
+        'participants_data': participants,
+        'estimated_cost': 0,
+        'tags': [unescape_ics_text(tag).strip() for _, value in event.get('CATEGORIES', []) for tag in value.split(',') if tag.strip()],
+        'importance': 5,
+        'notes': '',
+        'recurring': recurring,
+        'recurrence_until': compute_recurrence_until(recurring, start_date)
+    }
+
+def import_ics_stream(stream, calendar_code, user, chunk_size=None):
+    """
+    .ics 스트림을 캘린더로 가져오기
+    - 청크 단위 INSERT (insert_schedule_chunk 재사용, 청크마다 커밋)
+    - 메모리는 청크 크기 + 오류 목록(최대 ICS_IMPORT_ERROR_LIMIT개)으로 제한
+    - 같은 캘린더에서 같은 UID(+RECURRENCE-ID)는 이미 가져온 일정으로 보고 건너뜀
+    - 반복 일정의 개별 발생 변경(RECURRENCE-ID가 있는 VEVENT)은 가져오지 않음 (skipped)
+      일정 반복 규칙은 제외 날짜(EXDATE)를 표현할 수 없어 원래 시리즈가 같은 발생을 다시 만들므로 중복 표시됨
+    """
+    chunk_size = chunk_size or app.config.get('BULK_INSERT_CHUNK_SIZE', 500)
+    calendar_cache = {}
+    touched_calendars = set()
+    summary = {'total': 0, 'created': 0, 'failed': 0, 'skipped': 0, 'errors': []}
+    chunk = []
+    
+    def record(results):
+        for result in results:
+            if result['success']:
+                summary['created'] += 1
+                continue
+            summary['failed'] += 1
+            if len(summary['errors']) < ICS_IMPORT_ERROR_LIMIT:
+                summary['errors'].append(result)
+    
+    def flush():
+        # 이전 청크는 이미 커밋되어 중복 검사 쿼리에 잡히므로 청크마다 새 집합 사용
+        results, calendars = insert_schedule_chunk(chunk, calendar_cache, user, set())
+        record(results)
+        touched_calendars.update(calendars)
+        chunk.clear()
+    
+    for index, event in enumerate(iter_ics_events(stream)):
+        summary['total'] += 1
+        if event.get('RECURRENCE-ID'):
+            summary['skipped'] += 1
+            continue
+        try:
+            chunk.append((index, calendar_code, ics_event_to_schedule(event, calendar_code)))
+        except (ValueError, TypeError) as e:
+            record([{'index': index, 'success': False, 'schedule_id': None, 'error': str(e)}])
+            continue
+        if len(chunk) >= chunk_size:
+            flush()
+    if chunk:
+        flush()
+    
+    for calendar_id in touched_calendars:
+        schedule_response_cache.invalidate(calendar_id)
+    return summary
+
+# iCalendar(.ics) 가져오기 API - 본문(text/calendar) 또는 multipart 파일(file)
+@app.route('/api/calendars/<calendar_code>/import', methods=['POST'])
+@login_required
+def import_ics_to_calendar(calendar_code):
+    print(f"\n=== 📥 .ics 가져오기 시작: {calendar_code} ===")
+    try:
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
+        
+        calendar = Calendar.query.filter_by(calendar_code=calendar_code).first()
+        if not calendar:
+            return jsonify({'success': False, 'message': '캘린더를 찾을 수 없습니다.'}), 404
+        if calendar.user_id != user.id:
+            return jsonify({'success': False, 'message': '캘린더에 접근할 권한이 없습니다.'}), 403
+        
+        upload = request.files.get('file')
+        stream = upload.stream if upload else request.stream
+        print("2️⃣ VEVENT 스트림 파싱 및 청크 단위 INSERT 중...")
+        summary = import_ics_stream(stream, calendar_code, user)
+        print(f"✅ 가져오기 완료: 전체 {summary['total']}개, 성공 {summary['created']}개, 실패 {summary['failed']}개, 건너뜀 {summary['skipped']}개")
+        
+        return jsonify({
+            'success': summary['created'] > 0 or summary['total'] == summary['skipped'],
+            'message': f"{summary['created']}개 일정을 가져왔습니다.",
+            'data': summary
+        }), 201 if summary['created'] > 0 else 200
+        
+    except Exception as e:
+        print(f"❌ .ics 가져오기 오류: {e}")
+        db.session.rollback()
+        return jsonify({
+            'success': False,
+            'message': '.ics 가져오기 중 오류 발생',
+            'error': str(e)
+        }), 500
+
+@app.cli.command('import-ics')
+@click.argument('calendar_code')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+def import_ics_command(calendar_code, path):
+    """flask import-ics CALENDAR_CODE PATH - .ics 파일을 캘린더로 가져오기"""
+    calendar = Calendar.query.filter_by(calendar_code=calendar_code).first()
+    if not calendar:
+        raise click.ClickException(f'캘린더를 찾을 수 없습니다: {calendar_code}')
+    owner = resolve_auth_user(calendar.user.user_id)
+    with open(path, 'rb') as stream:
+        summary = import_ics_stream(stream, calendar_code, owner)
+    print(f"✅ 가져오기 완료: 전체 {summary['total']}개, 성공 {summary['created']}개, 실패 {summary['failed']}개, 건너뜀 {summary['skipped']}개")
+
 # ✅ 핵심 수정: 사용자별 일정 조회 API - 모든 일정 표시
+# 일정 ⋈ 캘린더 ⋈ 사용자 단일 조인 쿼리 + 키셋 페이지네이션 (?limit=&cursor=&from=&to=)
 @app.route('/api/users/<user_id>/schedules', methods=['GET'])
+@compress_response
 def get_user_schedules(user_id):
     print(f"\n=== 📝 사용자별 일정 조회: {user_id} ===")
     try:
@@ -1165,54 +4105,87 @@ def get_user_schedules(user_id):
         if not user:
             return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
         
-        # ✅ 수정: 모든 캘린더의 일정을 조회 (사용자 구분 없이)
-        print("📅 모든 캘린더의 일정 조회 중...")
-        all_calendars = Calendar.query.all()  # 기존: Calendar.query.filter_by(user_id=user.id).all()
-        print(f"찾은 캘린더 수: {len(all_calendars)}")
+        # 페이지네이션/기간 파라미터 파싱
+        try:
+            limit = parse_page_size(request.args)
+            cursor = request.args.get('cursor')
+            after = decode_schedule_cursor(cursor) if cursor else None
+            date_from, date_to = parse_date_window(request.args)
+            fields = parse_fields(request.args, USER_SCHEDULE_ITEM_COLUMNS)
+            tags = parse_tags(request.args)
+        except ValueError as e:
+            print(f"❌ 조회 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '조회 파라미터가 올바르지 않습니다.', 'error': str(e)}), 400
+        
+        # 반복 일정을 펼칠 시작일/마지막 날짜 - 종료일(to)이 없으면 오늘 기준 기본 기간이므로 ETag에 포함
+        series_from = max(filter(None, [date_from, after[0] if after else None]), default=None)
+        series_to = date_to or get_recurrence_horizon(series_from)
+        
+        # 전체 캘린더 버전 합계 기반 ETag (버전은 일정 추가/삭제마다 증가하므로 합계도 항상 증가)
+        calendar_state = db.session.query(
+            db.func.count(Calendar.id),
+            db.func.coalesce(db.func.sum(Calendar.version), 0),
+            db.func.max(Calendar.id)
+        ).one()
+        etag = make_etag('user-schedules', user.id, tuple(calendar_state), request.args.to_dict(flat=False), series_to.isoformat())
+        cached = not_modified(etag)
+        if cached:
+            return cached
+        
+        # ✅ 수정: 모든 캘린더의 일정을 조회 (사용자 구분 없이) - 단일 조인 쿼리
+        print(f"📅 모든 캘린더의 일정 조회 중... (limit: {limit}, cursor: {cursor})")
+        base_query = db.session.query(Schedule, Calendar, User) \
+            .join(Calendar, Schedule.calendar_id == Calendar.id) \
+            .join(User, Calendar.user_id == User.id) \
+            .options(*schedule_load_only(fields, USER_SCHEDULE_ITEM_COLUMNS, 'date_info', 'start_time', 'recurring', 'recurrence_until'))
+        base_query = filter_by_tags(base_query, tags)
+        
+        # 일반 일정: 키셋 조건으로 다음 페이지 존재 여부 확인을 위해 1개 더 조회
+        query = Schedule.in_window(base_query.filter(Schedule.recurrence_until.is_(None)), date_from, date_to)
+        if after:
+            query = query.filter(tuple_(Schedule.date_info, Schedule.start_time, Schedule.id) > tuple_(*after))
+        rows = query.order_by(Schedule.date_info, Schedule.start_time, Schedule.id).limit(limit + 1).all()
+        pages = [((schedule.date_info, schedule.start_time, schedule.id), schedule, calendar, owner, schedule.date_info)
+                 for schedule, calendar, owner in rows]
+        
+        # 반복 일정: 커서 이후 기간과 겹치는 시리즈를 펼쳐서 일반 일정과 병합
+        # - 일반 일정이 limit개를 넘으면 (limit+1)번째 일정 날짜 이후 발생은 이번 페이지에 들어올 수 없으므로 거기까지만
+        # - 시리즈마다 limit+2개까지만 펼침 (커서 날짜의 발생 1개는 커서 이전일 수 있음)
+        if len(rows) > limit:
+            series_to = min(series_to, rows[-1][0].date_info)
+        series_query = base_query.filter(Schedule.recurrence_until.isnot(None), Schedule.date_info <= series_to)
+        if series_from:
+            series_query = series_query.filter(Schedule.recurrence_until >= series_from)
+        series_rows = series_query.all()
+        series_owners = {schedule.id: (calendar, owner) for schedule, calendar, owner in series_rows}
+        for schedule, day in expand_schedule_occurrences([row[0] for row in series_rows], series_from, series_to, limit + 2):
+            key = (day, schedule.start_time, schedule.id)
+            if after is None or key > after:
+                pages.append((key, schedule, *series_owners[schedule.id], day))
+        
+        pages.sort(key=lambda page: page[0])
+        has_more = len(pages) > limit
+        pages = pages[:limit]
         
         all_schedules = []
-        for calendar in all_calendars:
-            schedules = Schedule.query.filter_by(calendar_id=calendar.id).all()
-            for schedule in schedules:
-                # 캘린더 소유자 정보 추가
-                owner = User.query.get(calendar.user_id)
-                
-                start_datetime = datetime.combine(schedule.date_info, schedule.start_time)
-                end_datetime = datetime.combine(schedule.date_info, schedule.end_time)
-                
-                schedule_data = {
-                    'schedule_id': schedule.schedule_id,
-                    'title': schedule.title,
-                    'description': schedule.description,
-                    'date_info': schedule.date_info.isoformat(),
-                    'start_time': schedule.start_time.strftime('%H:%M'),
-                    'end_time': schedule.end_time.strftime('%H:%M'),
-                    'start_datetime': start_datetime.isoformat(),
-                    'end_datetime': end_datetime.isoformat(),
-                    'location': schedule.location_data,
-                    'participants': schedule.participants_data,
-                    'estimated_cost': schedule.estimated_cost,
-                    'tags': schedule.tags,
-                    'importance': schedule.importance,
-                    'notes': schedule.notes,
-                    'calendar_name': calendar.calendar_name,
-                    'calendar_code': calendar.calendar_code,
-                    'owner_name': owner.name if owner else 'Unknown',  # 소유자 정보 추가
-                    'owner_id': owner.user_id if owner else 'Unknown',
-                    'is_my_schedule': calendar.user_id == user.id  # 내 일정인지 표시
-                }
-                all_schedules.append(schedule_data)
+        for key, schedule, calendar, owner, day in pages:
+            all_schedules.append(build_user_schedule_item(schedule, calendar, owner, user, fields, day))
         
-        print(f"✅ 총 {len(all_schedules)}개 일정 조회 완료 (모든 사용자 포함)")
+        next_cursor = encode_schedule_cursor(pages[-1][1], pages[-1][4]) if has_more else None
+        print(f"✅ {len(all_schedules)}개 일정 조회 완료 (모든 사용자 포함, 다음 페이지: {has_more})")
         
-        return jsonify({
+        response = jsonify({
             'success': True,
             'data': {
                 'user_id': user_id,
                 'schedules': all_schedules,
-                'total_count': len(all_schedules)
+                'total_count': len(all_schedules),
+                'limit': limit,
+                'has_more': has_more,
+                'next_cursor': next_cursor
             }
-        }), 200
+        })
+        return set_etag_headers(response, etag), 200
         
     except Exception as e:
         print(f"❌ 일정 조회 오류: {e}")
@@ -1261,6 +4234,15 @@ def get_schedule_by_id(schedule_id):
             'owner_id': owner.user_id if owner else 'Unknown'
         }
         
+        # 응답 필드 선택 (?fields=title,start_datetime)
+        try:
+            fields = parse_fields(request.args, schedule_data)
+        except ValueError as e:
+            print(f"❌ 필드 파라미터 오류: {e}")
+            return jsonify({'success': False, 'message': '요청 필드가 올바르지 않습니다.', 'error': str(e)}), 400
+        if fields is not None:
+            schedule_data = {key: value for key, value in schedule_data.items() if key in fields}
+        
         print(f"✅ 일정 조회 성공: {schedule.title}")
         
         return jsonify({
@@ -1281,42 +4263,23 @@ def get_schedule_by_id(schedule_id):
 
 # 일정 삭제 API (프론트엔드용)
 @app.route('/api/schedules/<schedule_id>', methods=['DELETE'])
+@login_required
 def delete_schedule(schedule_id):
     print(f"\n=== 🗑️ 일정 삭제 시작: {schedule_id} ===")
     try:
-        print("1️⃣ 인증 헤더 확인 중...")
-        auth_header = request.headers.get('Authorization')
-        
-        if not auth_header:
-            print("❌ 인증 헤더 없음")
-            return jsonify({'success': False, 'message': '인증 토큰이 필요합니다.'}), 401
-        
-        print("2️⃣ 토큰 파싱 중...")
-        token = auth_header.replace('Bearer ', '')
-        user_id = extract_user_id_from_token(token)
-        print(f"3️⃣ 추출된 사용자 ID: {user_id}")
-        
-        if not user_id:
-            print("❌ 토큰에서 사용자 ID 추출 실패")
-            return jsonify({'success': False, 'message': '유효하지 않은 토큰입니다.'}), 401
-        
-        print("4️⃣ 사용자 검색 중...")
-        user = User.query.filter_by(user_id=user_id).first()
-        
-        if not user:
-            print("❌ 사용자 없음")
-            return jsonify({'success': False, 'message': '사용자를 찾을 수 없습니다.'}), 404
+        user = g.current_user
+        print(f"1️⃣ 인증 사용자: {user.user_id}")
         
-        print("5️⃣ 일정 검색 중...")
+        print("2️⃣ 일정 검색 중...")
         schedule = Schedule.query.filter_by(schedule_id=schedule_id).first()
-        print(f"6️⃣ 일정 검색 결과: {schedule}")
+        print(f"3️⃣ 일정 검색 결과: {schedule}")
         
         if not schedule:
             print("❌ 일정 없음")
             return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
         
         # 일정 소유자 확인
-        print("7️⃣ 일정 소유자 확인 중...")
+        print("4️⃣ 일정 소유자 확인 중...")
         calendar = Calendar.query.get(schedule.calendar_id)
         if not calendar or calendar.user_id != user.id:
             print("❌ 일정 삭제 권한 없음")
@@ -1324,10 +4287,11 @@ def delete_schedule(schedule_id):
         
         schedule_title = schedule.title
         
-        print("8️⃣ 일정 삭제 중...")
+        print("5️⃣ 일정 삭제 중...")
         db.session.delete(schedule)
         db.session.commit()
-        print(f"9️⃣ 일정 삭제 완료: {schedule_title}")
+        schedule_response_cache.invalidate(calendar.id)
+        print(f"6️⃣ 일정 삭제 완료: {schedule_title}")
         
         response_data = {
             'success': True,
@@ -1543,6 +4507,8 @@ if __name__ == '__main__':
     
     print("3️⃣ 서버 시작...")
     print("🌐 JSON 데이터: http://localhost:5000/json-data")
+    print("📤 NDJSON 내보내기: http://localhost:5000/json-data?format=ndjson")
     print("📊 요약 데이터: http://localhost:5000/json-summary")
+    print("📈 통계 데이터: http://localhost:5000/json-data/stats")
     print("🔍 API 상태: http://localhost:5000/api/db/status")
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -0,0 +1,113 @@
+# bench_analytics.py - 일정 분석 집계 벤치마크 (DB GROUP BY vs 일정 행 전체 로드 후 파이썬 루프 비교)
+#
+# 사용법: python bench_analytics.py [하루 일정 수] [캘린더 수] [반복 일정 수]
+# 기본값: 1년 × 하루 80개 일정 (약 29,000개) × 캘린더 5개, 주간 반복 일정 20개
+# DATABASE_URL이 없으면 메모리 SQLite 사용 (MySQL 측정 시 DATABASE_URL 지정)
+
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, timedelta
+from datetime import time as dtime
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, User, Calendar, Schedule, compute_schedule_analytics, index_schedules
+
+TAGS = ['미팅', '업무', '운동', '가족', '출장', '교육', '식사', '정기']
+
+def load_data(per_day, calendar_count, series_count, date_from, seed=42):
+    """1년치 일정 Core executemany 삽입 + 태그 테이블 채우기 (executemany는 첫 행의 키로 컬럼이 정해지므로 모든 행에 같은 키)"""
+    rng = random.Random(seed)
+    user = User(user_id='bench_user', name='벤치마크', email='bench@example.com', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    calendars = [Calendar(calendar_code=f'bench_cal_{i}', calendar_name=f'캘린더 {i}', user_id=user.id)
+                 for i in range(calendar_count)]
+    db.session.add_all(calendars)
+    db.session.flush()
+    calendar_ids = [calendar.id for calendar in calendars]
+
+    connection = db.session.connection()
+    rows = []
+    for offset in range(365):
+        day = date_from + timedelta(days=offset)
+        for _ in range(per_day):
+            rows.append({
+                'id': len(rows) + 1, 'schedule_id': f'bench_{len(rows)}', 'date_info': day,
+                'start_time': dtime(rng.randint(7, 21), rng.choice([0, 30])), 'end_time': dtime(22),
+                'title': '일정', 'estimated_cost': rng.choice([0, 0, 5000, 12000, 30000]),
+                'importance': rng.randint(1, 10), 'tags': rng.sample(TAGS, rng.randint(0, 2)),
+                'calendar_id': rng.choice(calendar_ids), 'recurring': None, 'recurrence_until': None
+            })
+    for i in range(series_count):
+        rows.append({
+            'id': len(rows) + 1, 'schedule_id': f'bench_series_{i}', 'date_info': date_from + timedelta(days=i),
+            'start_time': dtime(9), 'end_time': dtime(10), 'title': '정기 일정', 'estimated_cost': 1000,
+            'importance': 5, 'tags': ['정기'], 'calendar_id': calendar_ids[i % calendar_count],
+            'recurring': 'FREQ=WEEKLY', 'recurrence_until': date(9999, 12, 31)
+        })
+    for start in range(0, len(rows), 5000):
+        chunk = rows[start:start + 5000]
+        connection.execute(Schedule.__table__.insert(), chunk)
+        index_schedules(connection, chunk)
+    db.session.commit()
+    return calendar_ids, len(rows)
+
+def analytics_by_python_loop(calendar_ids, date_from, date_to):
+    """비교 기준: 일정 ORM 행 전체를 읽어 행마다 파이썬에서 그룹별 합산 (반복 일정 펼침 제외)"""
+    monthly, tags, calendars, importance = defaultdict(int), defaultdict(int), defaultdict(int), defaultdict(int)
+    week_grid = [[0] * 24 for _ in range(7)]
+    schedules = Schedule.query.filter(
+        Schedule.calendar_id.in_(calendar_ids), Schedule.recurrence_until.is_(None),
+        Schedule.date_info >= date_from, Schedule.date_info <= date_to
+    ).all()
+    for schedule in schedules:
+        cost = schedule.estimated_cost or 0
+        monthly[schedule.date_info.strftime('%Y-%m')] += cost
+        calendars[schedule.calendar_id] += cost
+        importance[schedule.importance] += 1
+        week_grid[schedule.date_info.weekday()][schedule.start_time.hour] += 1
+        for tag in schedule.tags or []:
+            tags[tag] += cost
+    return monthly, tags, calendars, importance, week_grid
+
+def measure(function, repeat, *args):
+    samples = []
+    for _ in range(repeat):
+        db.session.expire_all()
+        started = time.perf_counter()
+        result = function(*args)
+        samples.append((time.perf_counter() - started) * 1000)
+    return sorted(samples)[len(samples) // 2], result
+
+def run_benchmark(per_day, calendar_count, series_count):
+    date_from, date_to = date(2025, 1, 1), date(2025, 12, 31)
+    with app.app_context():
+        db.create_all()
+        calendar_ids, total = load_data(per_day, calendar_count, series_count, date_from)
+        print(f"=== 📊 일정 분석 벤치마크: 1년 일정 {total:,}개 (반복 {series_count}개) × 캘린더 {calendar_count}개 ===")
+
+        # print 출력이 측정을 왜곡하지 않도록 측정 중 표준 출력 비활성화
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            grouped_ms, analytics = measure(compute_schedule_analytics, 10, calendar_ids, date_from, date_to)
+            loop_ms, _ = measure(analytics_by_python_loop, 3, calendar_ids, date_from, date_to)
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+        print(f"⏱️ DB GROUP BY 집계: {grouped_ms:.1f}ms (일정 {analytics['totals']['count']:,}건, 월 {len(analytics['monthly'])}개)")
+        print(f"🐢 비교 기준 (행 전체 로드 + 파이썬 루프, 반복 일정 제외): {loop_ms:.1f}ms ({loop_ms / grouped_ms:.1f}배)")
+
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    per_day = int(sys.argv[1]) if len(sys.argv) > 1 else 80
+    calendar_count = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    series_count = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    run_benchmark(per_day, calendar_count, series_count)
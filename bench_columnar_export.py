@@ -0,0 +1,100 @@
+# bench_columnar_export.py - 컬럼형 스냅샷 vs /json-data JSON 덤프 (크기 / 생성 시간 / 읽기 시간)
+#
+# 사용법: python bench_columnar_export.py [일정 수] [사용자 수]
+# 기본값: 일정 100,000개, 사용자 200명 (사용자당 캘린더 2개)
+# DATABASE_URL이 없으면 메모리 SQLite 사용 (MySQL 측정 시 DATABASE_URL 지정)
+
+import io
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from datetime import time as dtime
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, User, Calendar, Schedule, read_columnar_snapshot
+
+LOCATIONS = [{'name': '본사 대회의실', 'address': '서울시 강남구 테헤란로 123'}, {'name': '홈 오피스'},
+             {'name': '카페 봄', 'address': '서울시 강남구 논현로 123'}, {}]
+PEOPLE = [{'name': '김대표', 'contact': '010-1111-2222', 'relation': '클라이언트'},
+          {'name': '이수정', 'contact': '010-3333-4444', 'relation': '동료'},
+          {'name': '지훈', 'contact': '010-5555-6666', 'relation': '대학동기'}]
+TAGS = ['미팅', '업무', '운동', '가족', '디자인', '스터디']
+
+def load_data(schedule_count, user_count, seed=42):
+    rng = random.Random(seed)
+    connection = db.session.connection()
+    connection.execute(User.__table__.insert(), [
+        {'id': i + 1, 'user_id': f'user_{i}', 'name': f'사용자 {i}', 'email': f'user_{i}@example.com',
+         'password_hash': 'x', 'user_type': 'user', 'profile': '일정 관리 서비스 사용자'}
+        for i in range(user_count)
+    ])
+    connection.execute(Calendar.__table__.insert(), [
+        {'id': i + 1, 'calendar_code': f'cal_{i}', 'calendar_name': f'캘린더 {i}', 'description': '개인 일정',
+         'user_id': i // 2 + 1}
+        for i in range(user_count * 2)
+    ])
+    rows = []
+    for i in range(schedule_count):
+        rows.append({
+            'id': i + 1, 'schedule_id': f'sch_{i}', 'date_info': date(2025, 1, 1) + timedelta(days=i % 365),
+            'start_time': dtime(9 + i % 9), 'end_time': dtime(10 + i % 9), 'title': f'일정 {i % 500}',
+            'description': rng.choice(['', '프로젝트 진행 상황 공유 및 다음 단계 논의', None]),
+            'location_data': rng.choice(LOCATIONS), 'participants_data': rng.sample(PEOPLE, rng.randint(0, 2)),
+            'estimated_cost': rng.choice([0, 15000, 50000]), 'tags': rng.sample(TAGS, 2),
+            'importance': rng.randint(1, 10), 'notes': rng.choice(['', '자료 준비']),
+            'calendar_id': rng.randint(1, user_count * 2)
+        })
+        if len(rows) == 5000:
+            connection.execute(Schedule.__table__.insert(), rows)
+            rows = []
+    if rows:
+        connection.execute(Schedule.__table__.insert(), rows)
+    db.session.commit()
+
+def measure_export(client, url):
+    started = time.perf_counter()
+    body = client.get(url).get_data()
+    return body, (time.perf_counter() - started) * 1000
+
+def run_benchmark(schedule_count, user_count):
+    print(f"=== 📦 컬럼형 스냅샷 벤치마크: 일정 {schedule_count:,}개, 사용자 {user_count}명 ===")
+    with app.app_context():
+        db.create_all()
+        load_data(schedule_count, user_count)
+        client = app.test_client()
+
+        # 행마다 출력하는 로그가 측정을 왜곡하지 않도록 표준 출력 비활성화
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            json_body, json_ms = measure_export(client, '/json-data')
+            columnar_body, columnar_ms = measure_export(client, '/json-data?format=columnar')
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+        started = time.perf_counter()
+        json_data = json.loads(json_body)
+        json_load_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        tables, statistics = read_columnar_snapshot(io.BytesIO(columnar_body))
+        columnar_load_ms = (time.perf_counter() - started) * 1000
+        assert statistics['schedules'] == len(json_data['data']['schedules']) == schedule_count
+
+        print(f"📏 크기: JSON {len(json_body) / 1024 / 1024:.1f}MB → 컬럼형 {len(columnar_body) / 1024 / 1024:.1f}MB "
+              f"({len(json_body) / len(columnar_body):.1f}배 작음)")
+        print(f"⏱️ 생성: JSON {json_ms:,.0f}ms → 컬럼형 {columnar_ms:,.0f}ms ({json_ms / columnar_ms:.1f}배)")
+        print(f"⏱️ 읽기: json.loads {json_load_ms:,.0f}ms → read_columnar_snapshot {columnar_load_ms:,.0f}ms "
+              f"({json_load_ms / columnar_load_ms:.1f}배)")
+
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    schedule_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    user_count = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    run_benchmark(schedule_count, user_count)
@@ -0,0 +1,83 @@
+# bench_find_time.py - 회의 시간 찾기 벤치마크 (정수 비트맵 vs 순수 파이썬 구간 비교)
+#
+# 사용법: python bench_find_time.py [참석자 수] [기간 일수] [슬롯 단위 분] [1인당 하루 최대 일정 수]
+# 기본값: 100명 × 28일 × 5분, 1인당 근무일 하루 0~2개 일정
+
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from datetime import time as dtime
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import find_common_free_slots
+
+def make_intervals(participants, days, date_from, max_per_day, seed=42):
+    """
+    참석자별 근무일 하루 0~max_per_day개 일정 (30분 ~ 2시간)
+    대부분 팀 공통 회의 시간대(10~12시, 14~17시)에 몰려 있어 공통 빈 시간이 드물게 남음
+    """
+    rng = random.Random(seed)
+    intervals = []
+    for _ in range(participants):
+        for offset in range(days):
+            day = date_from + timedelta(days=offset)
+            if day.weekday() >= 5:
+                continue
+            for _ in range(rng.randint(0, max_per_day)):
+                hour = rng.choice([10, 11, 14, 15, 16] * 4 + [9, 12, 13, 17])
+                start = datetime.combine(day, dtime(hour)) + timedelta(minutes=rng.choice([0, 15, 30, 45]))
+                intervals.append((start, start + timedelta(minutes=rng.choice([30, 60, 90, 120]))))
+    return intervals
+
+def find_free_slots_baseline(intervals, date_from, date_to, duration_minutes, granularity=5,
+                             work_start=dtime(9, 0), work_end=dtime(18, 0), weekdays=(0, 1, 2, 3, 4), limit=10):
+    """비교 기준: 후보 시작 슬롯마다 모든 바쁜 구간과 겹침 비교"""
+    slots = []
+    duration = timedelta(minutes=duration_minutes)
+    step = timedelta(minutes=granularity)
+    day = date_from
+    while day <= date_to and len(slots) < limit:
+        if day.weekday() in weekdays:
+            start = datetime.combine(day, work_start)
+            day_end = datetime.combine(day, work_end)
+            while start + duration <= day_end and len(slots) < limit:
+                end = start + duration
+                if any(busy_start < end and busy_end > start for busy_start, busy_end in intervals):
+                    start += step
+                else:
+                    slots.append((start, end))
+                    start = end
+        day += timedelta(days=1)
+    return slots
+
+def measure(function, repeat, *args):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        result = function(*args)
+    return (time.perf_counter() - started) / repeat * 1000, result
+
+def run_benchmark(participants, days, granularity, max_per_day):
+    date_from = date(2025, 9, 1)
+    date_to = date_from + timedelta(days=days - 1)
+    intervals = make_intervals(participants, days, date_from, max_per_day)
+    print(f"=== 🗓️ 회의 시간 찾기 벤치마크: {participants}명 × {days}일 × {granularity}분, 바쁜 구간 {len(intervals)}개 ===")
+
+    for duration in (30, 60, 120):
+        args = (intervals, date_from, date_to, duration, granularity)
+        bitmap_ms, bitmap_slots = measure(find_common_free_slots, 20, *args)
+        baseline_ms, baseline_slots = measure(find_free_slots_baseline, 1, *args)
+        assert bitmap_slots == baseline_slots, (bitmap_slots, baseline_slots)
+        first = bitmap_slots[0][0].isoformat() if bitmap_slots else '-'
+        print(f"⏱️ {duration:>3}분: 비트맵 {bitmap_ms:7.2f}ms, 순수 파이썬 {baseline_ms:9.2f}ms "
+              f"({baseline_ms / bitmap_ms:,.0f}배), 후보 {len(bitmap_slots)}개 (첫 후보 {first})")
+
+if __name__ == '__main__':
+    participants = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 28
+    granularity = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    max_per_day = int(sys.argv[4]) if len(sys.argv) > 4 else 2
+    run_benchmark(participants, days, granularity, max_per_day)
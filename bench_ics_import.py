@@ -0,0 +1,84 @@
+# bench_ics_import.py - .ics 가져오기 처리량 벤치마크
+#
+# 사용법: python bench_ics_import.py [이벤트 수] [청크 크기]
+# DATABASE_URL이 없으면 메모리 SQLite 사용 (MySQL 측정 시 DATABASE_URL 지정)
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, User, Calendar, Schedule, import_ics_stream, resolve_auth_user
+
+def write_sample_ics(path, event_count):
+    """이벤트 N개짜리 .ics 파일 생성 (접힌 줄, 참석자, 반복 규칙, 알림 포함)"""
+    start = date(2025, 1, 1)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//bench//ics//KO\r\n')
+        for i in range(event_count):
+            day = (start + timedelta(days=i % 365)).strftime('%Y%m%d')
+            f.write(
+                'BEGIN:VEVENT\r\n'
+                f'UID:bench-{i}@example.com\r\n'
+                f'DTSTART;TZID=Asia/Seoul:{day}T{9 + i % 8:02d}0000\r\n'
+                f'DTEND;TZID=Asia/Seoul:{day}T{10 + i % 8:02d}0000\r\n'
+                f'SUMMARY:벤치마크 일정 {i}\r\n'
+                'DESCRIPTION:다른 캘린더 시스템에서 내보낸 일정입니다.\\n설명이 길어서 \r\n'
+                ' 여러 줄로 접혀 있습니다.\r\n'
+                'LOCATION:본사 회의실\r\n'
+                'ATTENDEE;CN="김지훈":mailto:jihoon@example.com\r\n'
+                + ('RRULE:FREQ=WEEKLY;COUNT=4\r\n' if i % 10 == 0 else '') +
+                'BEGIN:VALARM\r\nACTION:DISPLAY\r\nTRIGGER:-PT10M\r\nEND:VALARM\r\n'
+                'END:VEVENT\r\n'
+            )
+        f.write('END:VCALENDAR\r\n')
+
+def run_benchmark(event_count, chunk_size):
+    print(f"=== 📥 .ics 가져오기 벤치마크: 이벤트 {event_count}개, 청크 {chunk_size} ===")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'bench.ics')
+        write_sample_ics(path, event_count)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"1️⃣ 샘플 파일 생성: {size_mb:.1f}MB")
+
+        with app.app_context():
+            db.create_all()
+            user = User(user_id='bench_user', name='벤치마크', email='bench@example.com', password_hash='x')
+            db.session.add(user)
+            db.session.flush()
+            db.session.add(Calendar(calendar_code='bench_cal', calendar_name='벤치마크', user_id=user.id))
+            db.session.commit()
+            owner = resolve_auth_user('bench_user')
+
+            print("2️⃣ 처리량 측정 중...")
+            started = time.perf_counter()
+            with open(path, 'rb') as stream:
+                summary = import_ics_stream(stream, 'bench_cal', owner, chunk_size=chunk_size)
+            elapsed = time.perf_counter() - started
+            print(f"✅ 성공 {summary['created']}개, 실패 {summary['failed']}개")
+            print(f"⏱️ {elapsed:.2f}초, {summary['total'] / elapsed:,.0f} 이벤트/초, {size_mb / elapsed:.1f}MB/초")
+
+            # tracemalloc은 처리 속도를 크게 떨어뜨리므로 메모리는 일정을 비운 뒤 별도 실행에서 측정
+            print("3️⃣ 메모리 측정 중...")
+            db.session.execute(Schedule.__table__.delete())
+            db.session.commit()
+            tracemalloc.start()
+            with open(path, 'rb') as stream:
+                import_ics_stream(stream, 'bench_cal', owner, chunk_size=chunk_size)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"🧠 최대 추적 메모리: {peak / 1024 / 1024:.1f}MB (파일 크기 {size_mb:.1f}MB)")
+
+            db.session.remove()
+            db.drop_all()
+
+if __name__ == '__main__':
+    event_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    run_benchmark(event_count, chunk_size)
@@ -0,0 +1,135 @@
+# bench_participants.py - 참석자 색인 조회/자동완성 벤치마크 (색인 vs participants_data 전체 디코딩 비교)
+#
+# 사용법: python bench_participants.py [일정 수] [캘린더 수] [참석자 이름 수]
+# 기본값: 일정 1,000,000개 × 캘린더 10개, 참석자 이름 5,000명 중 일정당 1~3명
+# DATABASE_URL이 없으면 메모리 SQLite 사용 (MySQL 측정 시 DATABASE_URL 지정)
+
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from datetime import time as dtime
+
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app import (app, db, User, Calendar, Schedule, reindex_schedule_participants,
+                 normalize_participant_name, issue_auth_token, resolve_auth_user)
+
+SURNAMES = '김이박최정강조윤장임한오서신권황안송류홍'
+GIVEN = '지훈수정민준서연도윤하은예준지우현우수빈'
+
+def make_names(count, seed=7):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(rng.choice(SURNAMES) + rng.choice(GIVEN) + rng.choice(GIVEN) + ('' if rng.random() < 0.9 else ' 대표'))
+    return sorted(names)
+
+def load_data(schedule_count, calendar_count, names, chunk_size=5000, seed=42):
+    """일정 Core executemany 삽입 + 참석자 색인 채우기 (검색/태그 색인은 측정 대상이 아니므로 생략)"""
+    rng = random.Random(seed)
+    user = User(user_id='bench_user', name='벤치마크', email='bench@example.com', password_hash='x')
+    db.session.add(user)
+    db.session.flush()
+    calendars = [Calendar(calendar_code=f'bench_cal_{i}', calendar_name=f'캘린더 {i}', user_id=user.id)
+                 for i in range(calendar_count)]
+    db.session.add_all(calendars)
+    db.session.flush()
+    calendar_ids = [calendar.id for calendar in calendars]
+
+    connection = db.session.connection()
+    schedules = Schedule.__table__
+    start = date(2025, 1, 1)
+    for offset in range(0, schedule_count, chunk_size):
+        rows = []
+        for i in range(offset, min(offset + chunk_size, schedule_count)):
+            participants = [{'name': names[k], 'contact': f'010-{k:04d}-0000', 'relation': '동료'}
+                            for k in rng.sample(range(len(names)), rng.randint(1, 3))]
+            rows.append({
+                'id': i + 1, 'schedule_id': f'bench_{i}', 'date_info': start + timedelta(days=i % 365),
+                'start_time': dtime(9 + i % 8), 'end_time': dtime(10 + i % 8), 'title': f'일정 {i}',
+                'participants_data': participants, 'calendar_id': calendar_ids[i % calendar_count]
+            })
+        connection.execute(schedules.insert(), rows)
+        reindex_schedule_participants(connection, rows)
+    db.session.commit()
+    return user
+
+def find_by_decoding(user_id, name, limit=20):
+    """비교 기준: 사용자 캘린더의 모든 일정 participants_data를 디코딩해 이름 비교"""
+    name_key = normalize_participant_name(name)
+    rows = db.session.execute(
+        db.select(Schedule.id, Schedule.participants_data)
+        .join(Calendar, Schedule.calendar_id == Calendar.id)
+        .where(Calendar.user_id == user_id)
+        .order_by(Schedule.id.desc())
+    )
+    found = []
+    for schedule_id, participants in rows:
+        if any(normalize_participant_name(p.get('name', '')) == name_key for p in participants or []):
+            found.append(schedule_id)
+            if len(found) == limit:
+                break
+    return found
+
+def percentile(samples, ratio):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * ratio))]
+
+def measure_requests(client, headers, urls):
+    samples = []
+    for url in urls:
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        samples.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.get_json()
+    return percentile(samples, 0.5), percentile(samples, 0.99)
+
+def run_benchmark(schedule_count, calendar_count, name_count):
+    print(f"=== 👥 참석자 색인 벤치마크: 일정 {schedule_count:,}개 × 캘린더 {calendar_count}개, 이름 {name_count:,}명 ===")
+    names = make_names(name_count)
+
+    with app.app_context():
+        app.logger.disabled = True
+        db.create_all()
+        print("1️⃣ 데이터 적재 중...")
+        started = time.perf_counter()
+        user = load_data(schedule_count, calendar_count, names)
+        print(f"✅ 적재 완료: {time.perf_counter() - started:.1f}초")
+
+        resolve_auth_user('bench_user')
+        headers = {'Authorization': f'Bearer {issue_auth_token("bench_user")}'}
+        client = app.test_client()
+        rng = random.Random(1)
+        lookups = [f'/api/participants/schedules?name={rng.choice(names)}&limit=20' for _ in range(200)]
+        prefixes = [f'/api/participants/autocomplete?q={name[:rng.randint(1, 2)]}&limit=10' for name in rng.sample(names, 200)]
+
+        print("2️⃣ API 지연 측정 중...")
+        # print 출력이 측정을 왜곡하지 않도록 요청 처리 중 표준 출력 비활성화
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            lookup_p50, lookup_p99 = measure_requests(client, headers, lookups)
+            prefix_p50, prefix_p99 = measure_requests(client, headers, prefixes)
+            started = time.perf_counter()
+            baseline = find_by_decoding(user.id, names[0])
+            baseline_ms = (time.perf_counter() - started) * 1000
+            indexed = client.get(f'/api/participants/schedules?name={names[0]}&limit=20', headers=headers).get_json()
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        assert len(indexed['data']['schedules']) == len(baseline)
+
+        print(f"⏱️ 참석자별 일정 조회: p50 {lookup_p50:.2f}ms, p99 {lookup_p99:.2f}ms")
+        print(f"⏱️ 참석자 자동완성: p50 {prefix_p50:.2f}ms, p99 {prefix_p99:.2f}ms")
+        print(f"🐢 비교 기준 (participants_data 전체 디코딩): {baseline_ms:,.0f}ms")
+
+        db.session.remove()
+        db.drop_all()
+
+if __name__ == '__main__':
+    schedule_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    calendar_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    name_count = int(sys.argv[3]) if len(sys.argv) > 3 else 5000
+    run_benchmark(schedule_count, calendar_count, name_count)
@@ -9,6 +9,76 @@ USE calendar_db;
 -- DELETE FROM calendars WHERE calendar_code LIKE 'sample_%';
 -- DELETE FROM users WHERE user_id IN ('sample_user1', 'sample_user2');
 
+-- 월간 뷰 기간 조회용 복합 인덱스 (GET /api/schedules/<calendar_id>?from=&to=)
+-- 기존 테이블에 한 번만 실행 (이미 있으면 Duplicate key name 오류는 무시)
+CREATE INDEX idx_schedules_calendar_date_time ON schedules (calendar_id, date_info, start_time);
+
+-- 사용자별 일정 조회 키셋 페이지네이션용 인덱스 (GET /api/users/<user_id>/schedules?cursor=)
+CREATE INDEX idx_schedules_date_time_id ON schedules (date_info, start_time, id);
+
+-- /json-summary용 테이블별 행 수 카운터 (INSERT/DELETE 시 앱에서 같은 트랜잭션으로 갱신)
+-- 불일치 시 재계산: flask --app app reconcile-counters
+CREATE TABLE IF NOT EXISTS table_counters (
+    name VARCHAR(50) NOT NULL PRIMARY KEY,
+    count BIGINT NOT NULL DEFAULT 0,
+    updated_at DATETIME
+);
+-- 카운터 행은 항상 있어야 함 (앱은 행을 증감만 함) - 현재 행 수로 초기화, 이미 있으면 유지
+INSERT IGNORE INTO table_counters (name, count, updated_at) VALUES
+('users', (SELECT COUNT(*) FROM users), NOW()),
+('calendars', (SELECT COUNT(*) FROM calendars), NOW()),
+('schedules', (SELECT COUNT(*) FROM schedules), NOW());
+
+-- 캘린더 버전 (일정 추가/삭제 시 앱에서 증가, 일정 목록 ETag 생성용)
+ALTER TABLE calendars ADD COLUMN version INT NOT NULL DEFAULT 0;
+
+-- 마지막 일정 변경 시각 (버전과 함께 갱신, .ics 구독 피드 Last-Modified용)
+ALTER TABLE calendars ADD COLUMN updated_at DATETIME NULL;
+
+-- .ics 구독 전용 비밀 값 (캘린더 소유자가 발급/재발급/폐기, NULL이면 구독 비활성)
+ALTER TABLE calendars ADD COLUMN feed_token VARCHAR(64) NULL;
+CREATE UNIQUE INDEX idx_calendars_feed_token ON calendars (feed_token);
+
+-- 반복 일정의 마지막 발생 날짜 (반복 규칙(RRULE)이 없으면 NULL, 종료 조건 없으면 9999-12-31)
+-- 기간 조회 시 기간과 겹치는 반복 일정 행만 골라 앱에서 발생 날짜로 펼침
+ALTER TABLE schedules ADD COLUMN recurrence_until DATE NULL;
+-- 비용/중요도 분석 집계 컬럼까지 포함한 커버링 인덱스 (분석 GROUP BY가 일정 행을 읽지 않도록)
+CREATE INDEX idx_schedules_calendar_recurrence ON schedules (calendar_id, recurrence_until, date_info, start_time, importance, estimated_cost);
+
+-- 일정 검색 역색인 (제목/설명/메모/태그/장소 이름의 글자 2-gram, 일정 INSERT/UPDATE/DELETE 시 앱에서 갱신)
+-- 기존 데이터 색인: flask --app app rebuild-schedule-indexes
+CREATE TABLE IF NOT EXISTS schedule_search_index (
+    calendar_id INT NOT NULL,
+    token VARCHAR(16) NOT NULL,
+    schedule_id INT NOT NULL,
+    weight INT NOT NULL DEFAULT 1,
+    PRIMARY KEY (calendar_id, token, schedule_id),
+    INDEX ix_schedule_search_index_schedule_id (schedule_id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin;
+
+-- 일정 태그 정규화 테이블 (tags JSON 배열 대신 인덱스로 태그 필터/집계, 일정 INSERT/UPDATE/DELETE 시 앱에서 갱신)
+CREATE TABLE IF NOT EXISTS schedule_tags (
+    calendar_id INT NOT NULL,
+    tag VARCHAR(50) NOT NULL,
+    schedule_id INT NOT NULL,
+    PRIMARY KEY (calendar_id, tag, schedule_id),
+    INDEX ix_schedule_tags_schedule_id (schedule_id),
+    INDEX idx_schedule_tags_tag (tag, schedule_id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin;
+
+-- 참석자 역색인 테이블 (정규화 이름/연락처 → 일정, 일정 INSERT/UPDATE/DELETE 시 앱에서 갱신)
+CREATE TABLE IF NOT EXISTS schedule_participants (
+    calendar_id INT NOT NULL,
+    name_key VARCHAR(100) NOT NULL,
+    schedule_id INT NOT NULL,
+    contact_key VARCHAR(100) NOT NULL DEFAULT '',
+    name VARCHAR(100) NOT NULL,
+    contact VARCHAR(100) NOT NULL DEFAULT '',
+    PRIMARY KEY (calendar_id, name_key, schedule_id),
+    INDEX ix_schedule_participants_schedule_id (schedule_id),
+    INDEX idx_schedule_participants_contact (calendar_id, contact_key, schedule_id)
+) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin;
+
 -- 샘플 사용자 데이터 추가
 INSERT IGNORE INTO users (user_id, name, email, password_hash, user_type, phone, profile, created_at) 
 VALUES 
@@ -109,6 +179,12 @@ INSERT IGNORE INTO schedules (
  0, '["개발", "스크럼", "일일미팅"]', 7, '스프린트 진행상황 공유',
  (SELECT id FROM calendars WHERE calendar_code = 'sample_user002_work'));
 
+-- 카운터 초기값 (위 샘플 INSERT는 앱을 거치지 않으므로 직접 재계산)
+REPLACE INTO table_counters (name, count, updated_at) VALUES
+('users', (SELECT COUNT(*) FROM users), NOW()),
+('calendars', (SELECT COUNT(*) FROM calendars), NOW()),
+('schedules', (SELECT COUNT(*) FROM schedules), NOW());
+
 -- 결과 확인
 SELECT '=== 생성된 샘플 데이터 확인 ===' as message;
 SELECT COUNT(*) as total_users FROM users;
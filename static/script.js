@@ -429,67 +429,44 @@ function getCalendarBorderColor(calendarName) {
     return '#4338ca'; // 기본 진한 색상
 }
 
-// 캘린더 목록 로드
+// 캘린더 목록 로드 - 목록은 /api/bootstrap 응답에 함께 오므로 별도 /api/calendars 요청 없이 전체 일정 로드로 처리
 async function loadCalendars() {
-    try {
-        const token = authToken || localStorage.getItem('token');
-        
-        if (!token) {
-            console.log('❌ 토큰이 없습니다.');
-            return;
-        }
-        
-        const response = await fetch('/api/calendars', {
-            headers: {
-                'Authorization': `Bearer ${token}`
-            }
-        });
-        
-        const data = await response.json();
-        console.log('캘린더 목록:', data);
+    await loadAllSchedules();
+}
+
+// 캘린더 선택 목록 채우기 (기본값: 전체 일정 보기)
+function renderCalendarSelect(calendarList) {
+    const calendarSelect = document.getElementById('calendarSelect');
+    calendarSelect.innerHTML = '';
+    
+    // 캘린더 수 업데이트
+    document.getElementById('calendarCount').textContent = calendarList.length;
+    
+    // 전체 일정 보기 옵션 추가
+    const allOption = document.createElement('option');
+    allOption.value = 'ALL_CALENDARS';
+    allOption.textContent = '📅 전체 일정 보기';
+    calendarSelect.appendChild(allOption);
+    
+    // 구분선 추가
+    const dividerOption = document.createElement('option');
+    dividerOption.disabled = true;
+    dividerOption.textContent = '─────────────────';
+    calendarSelect.appendChild(dividerOption);
+    
+    // 기존 캘린더들 추가 (아이콘과 함께)
+    calendarList.forEach(calendar => {
+        const option = document.createElement('option');
+        option.value = calendar.calendarId;
         
-        if (data.success) {
-            calendars = data.data.calendars;
-            
-            const calendarSelect = document.getElementById('calendarSelect');
-            calendarSelect.innerHTML = '';
-            
-            // 캘린더 수 업데이트
-            document.getElementById('calendarCount').textContent = calendars.length;
-            
-            // 전체 일정 보기 옵션 추가
-            const allOption = document.createElement('option');
-            allOption.value = 'ALL_CALENDARS';
-            allOption.textContent = '📅 전체 일정 보기';
-            calendarSelect.appendChild(allOption);
-            
-            // 구분선 추가
-            const dividerOption = document.createElement('option');
-            dividerOption.disabled = true;
-            dividerOption.textContent = '─────────────────';
-            calendarSelect.appendChild(dividerOption);
-            
-            // 기존 캘린더들 추가 (아이콘과 함께)
-            calendars.forEach(calendar => {
-                const option = document.createElement('option');
-                option.value = calendar.calendarId;
-                
-                // 🎨 일관된 아이콘 사용
-                const icon = getCalendarIcon(calendar.calendarName);
-                option.textContent = `${icon} ${calendar.calendarName}`;
-                calendarSelect.appendChild(option);
-            });
-            
-            // 기본값을 전체 일정 보기로 설정
-            calendarSelect.value = 'ALL_CALENDARS';
-            
-            // 전체 일정 로드
-            await loadAllSchedules();
-        }
-    } catch (error) {
-        console.error('캘린더 로드 오류:', error);
-        showMessage('캘린더 로드 중 오류가 발생했습니다.', 'error');
-    }
+        // 🎨 일관된 아이콘 사용
+        const icon = getCalendarIcon(calendar.calendarName);
+        option.textContent = `${icon} ${calendar.calendarName}`;
+        calendarSelect.appendChild(option);
+    });
+    
+    // 기본값을 전체 일정 보기로 설정
+    calendarSelect.value = 'ALL_CALENDARS';
 }
 
 // 전체 일정 로드 함수 + 디버깅 강화
@@ -504,58 +481,37 @@ async function loadAllSchedules() {
             return;
         }
         
-        // 캘린더가 없으면 다시 로드
-        if (!calendars || calendars.length === 0) {
-            const calendarResponse = await fetch('/api/calendars', {
-                headers: { 'Authorization': `Bearer ${token}` }
-            });
-            
-            const calendarData = await calendarResponse.json();
-            if (!calendarData.success) return;
-            
-            calendars = calendarData.data.calendars;
+        // 캘린더 목록 + 보이는 기간의 전체 일정을 한 번에 조회
+        const bootstrapResponse = await fetch(`/api/bootstrap?${getVisibleRangeQuery()}`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+        
+        const bootstrapData = await bootstrapResponse.json();
+        if (!bootstrapData.success) {
+            console.log('❌ 부트스트랩 로드 실패:', bootstrapData.message);
+            return;
         }
         
+        calendars = bootstrapData.data.calendars;
         console.log('전체 캘린더 목록:', calendars);
-        let allSchedules = [];
+        renderCalendarSelect(calendars);
         
-        // 각 캘린더에서 일정 가져오기
-        for (const calendar of calendars) {
-            try {
-                console.log(`캘린더 "${calendar.calendarName}" 일정 로드 중...`);
-                
-                const scheduleResponse = await fetch(`/api/schedules/${calendar.calendarId}`, {
-                    headers: { 'Authorization': `Bearer ${token}` }
-                });
-                
-                const scheduleData = await scheduleResponse.json();
-                if (scheduleData.success) {
-                    // 🎨 일관된 캘린더 정보를 각 일정에 추가 + 디버깅
-                    const schedulesWithCalendar = scheduleData.data.schedules.map(schedule => {
-                        const colorInfo = {
-                            ...schedule,
-                            calendarName: calendar.calendarName,
-                            calendarIcon: getCalendarIcon(calendar.calendarName),
-                            calendarColor: getCalendarColor(calendar.calendarName),
-                            calendarBorderColor: getCalendarBorderColor(calendar.calendarName)
-                        };
-                        
-                        console.log(`일정 "${schedule.title}" 색상 정보:`, {
-                            calendarName: calendar.calendarName,
-                            color: colorInfo.calendarColor,
-                            icon: colorInfo.calendarIcon
-                        });
-                        
-                        return colorInfo;
-                    });
-                    
-                    allSchedules = allSchedules.concat(schedulesWithCalendar);
-                    console.log(`캘린더 "${calendar.calendarName}"에서 ${schedulesWithCalendar.length}개 일정 로드됨`);
-                }
-            } catch (error) {
-                console.error(`캘린더 ${calendar.calendarId} 일정 로드 오류:`, error);
-            }
-        }
+        const calendarNames = {};
+        calendars.forEach(calendar => {
+            calendarNames[calendar.calendarId] = calendar.calendarName;
+        });
+        
+        // 🎨 일관된 캘린더 정보를 각 일정에 추가
+        let allSchedules = bootstrapData.data.schedules.map(schedule => {
+            const calendarName = calendarNames[schedule.calendarId] || '';
+            return {
+                ...schedule,
+                calendarName: calendarName,
+                calendarIcon: getCalendarIcon(calendarName),
+                calendarColor: getCalendarColor(calendarName),
+                calendarBorderColor: getCalendarBorderColor(calendarName)
+            };
+        });
         
         // 날짜순으로 정렬
         allSchedules.sort((a, b) => new Date(a.startTime || a.start_time) - new Date(b.startTime || b.start_time));
@@ -621,6 +577,30 @@ function showCalendarLoading(show) {
     }
 }
 
+// 📅 현재 월간 그리드(42칸)에 보이는 기간 계산 - 서버에 from/to로 전달
+function formatDateParam(date) {
+    const y = date.getFullYear();
+    const m = String(date.getMonth() + 1).padStart(2, '0');
+    const d = String(date.getDate()).padStart(2, '0');
+    return `${y}-${m}-${d}`;
+}
+
+function getVisibleRange() {
+    const firstDay = new Date(currentDate.getFullYear(), currentDate.getMonth(), 1);
+    const startDate = new Date(firstDay);
+    startDate.setDate(startDate.getDate() - firstDay.getDay());
+    
+    const endDate = new Date(startDate);
+    endDate.setDate(startDate.getDate() + 41);
+    
+    return { from: formatDateParam(startDate), to: formatDateParam(endDate) };
+}
+
+function getVisibleRangeQuery() {
+    const range = getVisibleRange();
+    return `from=${range.from}&to=${range.to}`;
+}
+
 // 시간 포맷 헬퍼 함수
 function formatTime(timeString) {
     const date = new Date(timeString);
@@ -652,7 +632,7 @@ async function loadSchedules() {
     }
     
     try {
-        const url = `${API_BASE}/schedules/${currentCalendarId}`;
+        const url = `${API_BASE}/schedules/${currentCalendarId}?${getVisibleRangeQuery()}`;
         console.log('일정 API 호출 URL:', url);
         
         const response = await fetch(url, {
@@ -871,15 +851,24 @@ function loadTodayEvents() {
     }
 }
 
-// 월 이동
-function previousMonth() {
+// 월 이동 - 보이는 기간이 바뀌므로 일정 다시 로드
+async function previousMonth() {
     currentDate.setMonth(currentDate.getMonth() - 1);
     renderCalendar();
+    await reloadVisibleSchedules();
 }
 
-function nextMonth() {
+async function nextMonth() {
     currentDate.setMonth(currentDate.getMonth() + 1);
     renderCalendar();
+    await reloadVisibleSchedules();
+}
+
+async function reloadVisibleSchedules() {
+    if (!(authToken || localStorage.getItem('token'))) return;
+    
+    // loadSchedules는 선택된 값이 ALL_CALENDARS이면 loadAllSchedules로 위임
+    await loadSchedules();
 }
 
 // 날짜 선택
@@ -1172,15 +1161,9 @@ async function refreshData() {
     
     try {
         showMessage('🔄 Flask MySQL에서 데이터를 새로고침 중...', 'info');
+        // 캘린더 목록 + 전체 일정을 부트스트랩 요청 1회로 다시 로드
         await loadCalendars();
         
-        const calendarSelect = document.getElementById('calendarSelect');
-        if (calendarSelect.value === 'ALL_CALENDARS') {
-            await loadAllSchedules();
-        } else if (currentCalendarId) {
-            await loadSchedules();
-        }
-        
         showMessage('✅ 데이터가 새로고침되었습니다! (Flask MySQL)', 'success');
     } catch (error) {
         showMessage('🚫 데이터 새로고침 중 오류가 발생했습니다.', 'error');